@@ -542,32 +542,33 @@ class Component(component.Main):
                 cmds.connectAttr(translate_attr, self._node_name(self.group_curl_deforms[(group, side)]) + ".translate", force=True)
 
     def _connect_surface_rivets(self) -> None:
-        for group, row, col, _position in self.detail_specs:
-            key = (group, row, col)
-            ref = self.detail_rivet_refs[key]
-            surface = self.ribbon_surfaces[group]
-            rivets = ymt_util.apply_rivet_constrain_to_selected(surface, ref)
-            rivet = pm.PyNode(rivets[0])
-            for rivet_name in rivets:
-                uv_pins = (
-                    cmds.listConnections(
-                        rivet_name + ".offsetParentMatrix",
-                        source=True,
-                        destination=False,
-                        type="uvPin",
+        with ymt_util.geometry_cache():
+            for group, row, col, _position in self.detail_specs:
+                key = (group, row, col)
+                ref = self.detail_rivet_refs[key]
+                surface = self.ribbon_surfaces[group]
+                rivets = ymt_util.apply_rivet_constrain_to_selected(surface, ref)
+                rivet = pm.PyNode(rivets[0])
+                for rivet_name in rivets:
+                    uv_pins = (
+                        cmds.listConnections(
+                            rivet_name + ".offsetParentMatrix",
+                            source=True,
+                            destination=False,
+                            type="uvPin",
+                        )
+                        or []
                     )
-                    or []
-                )
-                if not uv_pins:
-                    raise RuntimeError("ymt_birdtail_01 could not find uvPin driving rivet: %s." % rivet_name)
-                if len(uv_pins) > 1:
-                    raise RuntimeError("ymt_birdtail_01 found multiple uvPins driving rivet: %s." % rivet_name)
-                cmds.setAttr(uv_pins[0] + ".normalAxis", 1)
-                cmds.setAttr(uv_pins[0] + ".tangentAxis", 0)
-                self._set_local_relative_space_mode(uv_pins[0])
-            pm.parent(rivet, self.no_transform, relative=True)
-            pm.pointConstraint(rivet, ref, mo=True)
-            ymt_util.setKeyableAttributesDontLockVisibility(rivet, [])
+                    if not uv_pins:
+                        raise RuntimeError("ymt_birdtail_01 could not find uvPin driving rivet: %s." % rivet_name)
+                    if len(uv_pins) > 1:
+                        raise RuntimeError("ymt_birdtail_01 found multiple uvPins driving rivet: %s." % rivet_name)
+                    cmds.setAttr(uv_pins[0] + ".normalAxis", 1)
+                    cmds.setAttr(uv_pins[0] + ".tangentAxis", 0)
+                    self._set_local_relative_space_mode(uv_pins[0])
+                pm.parent(rivet, self.no_transform, relative=True)
+                pm.pointConstraint(rivet, ref, mo=True)
+                ymt_util.setKeyableAttributesDontLockVisibility(rivet, [])
 
     def _connect_ribbon_detail_chain_roots(self) -> None:
         for group, row, col, _position in self.detail_specs:
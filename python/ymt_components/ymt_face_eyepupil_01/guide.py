@@ -100,9 +100,10 @@ class Guide(guide.ComponentGuide):
         if name not in self.tra.keys():
             self.tra[name] = transform.getTransformFromPos(position)
 
-        pm.importFile(os.path.join(os.path.dirname(__file__), "assets", "surface.ma"))
-        sliding_surface = pm.PyNode("sliding_surface")
-        pm.rename(sliding_surface, self.getName("sliding_surface"))
+        sliding_surface = pm.PyNode(ymt_utility.create_nurbs_surface_from_template(
+            os.path.join(os.path.dirname(__file__), "assets", "surface.ma"),
+            self.getName("sliding_surface")
+        ))
         # sliding_surface.visibility.set(False)
 
         sliding_surface.setTransformation(self.tra[name])
@@ -149,14 +150,12 @@ class Guide(guide.ComponentGuide):
         self.model = self.root.getParent(generations=-1)
         self.setParamDefValuesFromProperty(self.root)
         self.sliding_surface = pm.PyNode(self.getName("sliding_surface"))
-        info = ymt_utility.serialize_nurbs_surface(self.sliding_surface.name())
 
         super(Guide, self).setFromHierarchy(root)
-        pm.delete(self.sliding_surface)
 
-        sliding_surface = ymt_utility.deserialize_nurbs_surface(self.getName("sliding_surface"), info)
-        self.sliding_surface = pm.PyNode(sliding_surface)
-        pm.parent(self.sliding_surface, self.root, absolute=False, relative=True)
+        # keep the existing surface, only make sure it lives under the root
+        if self.sliding_surface.getParent() != self.root:
+            pm.parent(self.sliding_surface, self.root, absolute=False, relative=True)
 
     def get_guide_template_dict(self) -> None:
         """Override the base class method to add more data to the guide template dict"""
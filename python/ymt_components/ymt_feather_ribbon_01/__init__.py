@@ -12,6 +12,8 @@ try:
 except ImportError:
     TypedDict = dict
 
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaAnim as oma2
 import maya.cmds as cmds
 
 try:
@@ -543,41 +545,104 @@ class Component(component.Main):
         surface_u_values: List[float] = self._surface_u_values()
         surface_depths: List[float] = self._surface_depths()
         self._validate_surface_topology(u_count, v_count, surface_u_values, surface_depths)
-        influence_names: List[str] = self._skin_influence_names(skin)
         influence_by_node: Dict[str, str] = self._skin_influence_names_by_node(skin)
+        skin_fn: oma2.MFnSkinCluster = oma2.MFnSkinCluster(self._get_mobject(skin))
+        influence_names: List[str] = [
+            influence_by_node.get(path.partialPathName(), path.partialPathName())
+            for path in skin_fn.influenceObjects()
+        ]
+        weight_rows: List[List[float]] = self._surface_skin_weight_rows(
+            surface_shape, u_count, v_count, influence_names, influence_by_node
+        )
         with suppress(RuntimeError):
             cmds.setAttr(skin + ".normalizeWeights", 0)
 
+        self._write_surface_skin_weights(skin_fn, surface_shape, u_count, v_count, weight_rows)
+
+        with suppress(RuntimeError):
+            cmds.setAttr(skin + ".normalizeWeights", 1)
+            cmds.skinCluster(skin, edit=True, forceNormalizeWeights=True)
+        self._validate_surface_skin_weights(
+            weight_rows, surface_shape, surface_u_values, v_count, surface_depths, influence_names, influence_by_node
+        )
+
+    def _surface_skin_weight_rows(
+        self,
+        surface_shape: str,
+        u_count: int,
+        v_count: int,
+        influence_names: List[str],
+        influence_by_node: Dict[str, str],
+    ) -> List[List[float]]:
+        """Return normalized weights per CV (u-major) and per skinCluster influence."""
+        column_by_influence: Dict[str, int] = {name: index for index, name in enumerate(influence_names)}
+        positions: List[VectorLike] = self._surface_cv_world_positions(surface_shape)
+        rows: List[List[float]] = []
         for u_index in range(u_count):
             for v_index in range(v_count):
-                component: str = "%s.cv[%s][%s]" % (surface_shape, u_index, v_index)
-                sample: SurfaceSample = self._surface_sample_from_component(component)
-                weights: Dict[str, float] = dict.fromkeys(influence_names, 0.0)
+                sample: SurfaceSample = self._surface_sample_from_position(positions[u_index * v_count + v_index])
+                row: List[float] = [0.0] * len(influence_names)
                 for joint, weight in self._surface_weight_entries(sample):
                     influence: str = influence_by_node[self._node_name(joint)]
-                    weights[influence] += weight
-                total: float = sum(weights.values())
+                    row[column_by_influence[influence]] += weight
+                total: float = sum(row)
                 if total <= 0.0:
-                    raise RuntimeError("ymt_feather_ribbon_01 generated zero total skin weight for %s." % component)
-                normalized: List[Tuple[str, float]] = [(name, weight / total) for name, weight in weights.items()]
-                cmds.skinPercent(skin, component, transformValue=normalized, normalize=False)
+                    raise RuntimeError(
+                        "ymt_feather_ribbon_01 generated zero total skin weight for %s.cv[%s][%s]."
+                        % (surface_shape, u_index, v_index)
+                    )
+                rows.append([weight / total for weight in row])
+        return rows
 
-        with suppress(RuntimeError):
-            cmds.setAttr(skin + ".normalizeWeights", 1)
-            cmds.skinCluster(skin, edit=True, forceNormalizeWeights=True)
-        self._validate_surface_skin_weights(
-            skin, surface_shape, surface_u_values, v_count, surface_depths, influence_by_node
+    def _write_surface_skin_weights(
+        self,
+        skin_fn: oma2.MFnSkinCluster,
+        surface_shape: str,
+        u_count: int,
+        v_count: int,
+        weight_rows: List[List[float]],
+    ) -> None:
+        component_fn: om2.MFnDoubleIndexedComponent = om2.MFnDoubleIndexedComponent()
+        components: om2.MObject = component_fn.create(om2.MFn.kSurfaceCVComponent)
+        for u_index in range(u_count):
+            for v_index in range(v_count):
+                component_fn.addElement(u_index, v_index)
+
+        influence_count: int = len(weight_rows[0]) if weight_rows else 0
+        weights: om2.MDoubleArray = om2.MDoubleArray([weight for row in weight_rows for weight in row])
+        skin_fn.setWeights(
+            self._get_dag_path(surface_shape),
+            components,
+            om2.MIntArray(list(range(influence_count))),
+            weights,
+            False,
         )
 
+    def _surface_cv_world_positions(self, surface_shape: str) -> List[VectorLike]:
+        surface_fn: om2.MFnNurbsSurface = om2.MFnNurbsSurface(self._get_dag_path(surface_shape))
+        return [self._to_vector((point.x, point.y, point.z)) for point in surface_fn.cvPositions(om2.MSpace.kWorld)]
+
+    def _get_dag_path(self, name: str) -> om2.MDagPath:
+        selection: om2.MSelectionList = om2.MSelectionList()
+        selection.add(name)
+        return selection.getDagPath(0)
+
+    def _get_mobject(self, name: str) -> om2.MObject:
+        selection: om2.MSelectionList = om2.MSelectionList()
+        selection.add(name)
+        return selection.getDependNode(0)
+
     def _validate_surface_skin_weights(
         self,
-        skin: str,
+        weight_rows: List[List[float]],
         surface_shape: str,
         surface_u_values: List[float],
         v_count: int,
         surface_depths: List[float],
+        influence_names: List[str],
         influence_by_node: Dict[str, str],
     ) -> None:
+        positions: List[VectorLike] = self._surface_cv_world_positions(surface_shape)
         v_index: int = max(range(v_count), key=lambda index: abs(surface_depths[index]))
         for index, joint in enumerate(self.curl_surface_skin_joints):
             u: float = self._curl_u(index)
@@ -586,18 +651,13 @@ class Component(component.Main):
                 key=lambda index: abs(surface_u_values[index] - u),
             )
             component: str = "%s.cv[%s][%s]" % (surface_shape, u_index, v_index)
-            sample: SurfaceSample = self._surface_sample_from_component(component)
+            sample: SurfaceSample = self._surface_sample_from_position(positions[u_index * v_count + v_index])
             expected_entries: Dict[PymelNode, float] = dict(self._surface_curl_weight_entries(sample))
             expected: float = expected_entries.get(joint, 0.0)
             if expected <= 0.05:
                 continue
             influence: str = influence_by_node[self._node_name(joint)]
-            actual: Union[float, List[float], Tuple[float, ...]] = cmds.skinPercent(
-                skin, component, query=True, transform=influence
-            )
-            if isinstance(actual, (list, tuple)):
-                actual = actual[0] if actual else 0.0
-            actual_value: float = float(actual)
+            actual_value: float = weight_rows[u_index * v_count + v_index][influence_names.index(influence)]
             if actual_value < expected * 0.5:
                 raise RuntimeError(
                     "ymt_feather_ribbon_01 failed to assign curl skin weight: "
@@ -635,24 +695,22 @@ class Component(component.Main):
             raise RuntimeError("ymt_feather_ribbon_01 could not find the ribbon surface shape.")
         return shapes[0]
 
-    def _surface_sample_from_component(self, component: str) -> SurfaceSample:
-        position: VectorLike = self._to_vector(cmds.xform(component, query=True, worldSpace=True, translation=True))
-        return self._surface_sample_from_position(position)
-
     def _surface_sample_from_position(self, position: VectorLike) -> SurfaceSample:
-        best_sample: Optional[SurfaceSample] = None
+        best_span: Optional[int] = None
+        best_local: float = 0.0
         best_distance: Optional[float] = None
         for span in range(len(self.anchor_segment_lengths)):
-            sample: SurfaceSample = self._surface_sample_from_position_on_span(position, span)
-            distance: float = (position - sample["position"]).length()
+            local: float = self._surface_local_from_position_on_span(position, span)
+            distance: float = self._surface_projection_distance_on_span(position, span, local)
             if best_distance is None or distance < best_distance:
-                best_sample = sample
+                best_span = span
+                best_local = local
                 best_distance = distance
-        if best_sample is None:
+        if best_span is None:
             raise RuntimeError("ymt_feather_ribbon_01 could not resolve a surface sample from CV position.")
-        return best_sample
+        return self._surface_sample_from_span_local(position, best_span, best_local)
 
-    def _surface_sample_from_position_on_span(self, position: VectorLike, span: int) -> SurfaceSample:
+    def _surface_local_from_position_on_span(self, position: VectorLike, span: int) -> float:
         low: float = 0.0
         high: float = 1.0
         for _ in range(12):
@@ -664,7 +722,9 @@ class Component(component.Main):
                 high = second
             else:
                 low = first
-        local: float = (low + high) * 0.5
+        return (low + high) * 0.5
+
+    def _surface_sample_from_span_local(self, position: VectorLike, span: int, local: float) -> SurfaceSample:
         base_position: VectorLike = self._position_from_span_local(span, local)
         end_position: VectorLike = self._position_from_anchor_end_span_local(span, local)
         depth: float = self._clamped_depth_from_position(position, base_position, end_position)
@@ -710,9 +770,6 @@ class Component(component.Main):
             distances.append(total)
         return distances
 
-    def _skin_influence_names(self, skin: str) -> List[str]:
-        return [self._node_name(influence) for influence in cmds.skinCluster(skin, query=True, influence=True)]
-
     def _skin_influence_names_by_node(self, skin: str) -> Dict[str, str]:
         mapping: Dict[str, str] = {}
         for influence in cmds.skinCluster(skin, query=True, influence=True):
@@ -906,29 +963,30 @@ class Component(component.Main):
         return [(self._anchor_layer_from_depth(depth), 1.0)]
 
     def _connect_surface_rivets(self) -> None:
-        for ref in self.detail_rivet_refs:
-            rivets: List[str] = ymt_util.apply_rivet_constrain_to_selected(self.sliding_surface, ref)
-            rivet: PymelNode = pm.PyNode(rivets[0])
-            for r in rivets:
-                uv_pins: List[str] = (
-                    cmds.listConnections(r + ".offsetParentMatrix", source=True, destination=False, type="uvPin")
-                    or []
-                )
-                if not uv_pins:
-                    raise RuntimeError("ymt_feather_ribbon_01 could not find uvPin driving rivet: %s." % r)
-
-                if len(uv_pins) > 1:
-                    raise RuntimeError(
-                        "ymt_feather_ribbon_01 found multiple uvPins driving rivet: %s, uvPins: %s." % (r, uv_pins)
+        with ymt_util.geometry_cache():
+            for ref in self.detail_rivet_refs:
+                rivets: List[str] = ymt_util.apply_rivet_constrain_to_selected(self.sliding_surface, ref)
+                rivet: PymelNode = pm.PyNode(rivets[0])
+                for r in rivets:
+                    uv_pins: List[str] = (
+                        cmds.listConnections(r + ".offsetParentMatrix", source=True, destination=False, type="uvPin")
+                        or []
                     )
+                    if not uv_pins:
+                        raise RuntimeError("ymt_feather_ribbon_01 could not find uvPin driving rivet: %s." % r)
+
+                    if len(uv_pins) > 1:
+                        raise RuntimeError(
+                            "ymt_feather_ribbon_01 found multiple uvPins driving rivet: %s, uvPins: %s." % (r, uv_pins)
+                        )
 
-                cmds.setAttr(uv_pins[0] + ".normalAxis", 1)  # Y-up
-                cmds.setAttr(uv_pins[0] + ".tangentAxis", 0)  # X-forward
+                    cmds.setAttr(uv_pins[0] + ".normalAxis", 1)  # Y-up
+                    cmds.setAttr(uv_pins[0] + ".tangentAxis", 0)  # X-forward
 
-            self._set_rivet_uv_pin_local_relative_space_mode(rivet)
-            pm.parent(rivet, self.no_transform, relative=True)
-            pm.pointConstraint(rivet, ref, mo=True)
-            ymt_util.setKeyableAttributesDontLockVisibility(rivet, [])
+                self._set_rivet_uv_pin_local_relative_space_mode(rivet)
+                pm.parent(rivet, self.no_transform, relative=True)
+                pm.pointConstraint(rivet, ref, mo=True)
+                ymt_util.setKeyableAttributesDontLockVisibility(rivet, [])
 
     def _set_rivet_uv_pin_local_relative_space_mode(self, rivet: PymelNode) -> None:
         rivet_name: str = self._node_name(rivet)
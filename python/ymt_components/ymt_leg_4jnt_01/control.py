@@ -4,23 +4,20 @@ import traceback
 from typing import Optional
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 import importlib
 try:
     pm = importlib.import_module("mgear.pymaya")
 except ImportError:
     pm = importlib.import_module("pymel.core")
-try:
-    datatypes = importlib.import_module("mgear.pymaya.datatypes")
-except ImportError:
-    datatypes = importlib.import_module("pymel.core.datatypes")
 
 import mgear
 from mgear.core import anim_utils
 from mgear.core import pyqt as gqt
-from mgear.core import transform
 from mgear.core import vector
 
-from ymt_shifter_utility.type_protocols import DagNodeLike, MatrixLike, MatrixValue, PlugLike, WorldPoint
+from ymt_shifter_utility import bake_util
+from ymt_shifter_utility.type_protocols import DagNodeLike, MatrixValue, PlugLike, WorldPoint
 
 
 ENDPOINT_NAMES = ["ankle", "foot", "toe"]
@@ -161,14 +158,6 @@ def _set_translation(obj: DagNodeLike, pos: WorldPoint) -> None:
     obj.setTranslation(pos, space="world")
 
 
-def _matrix_from_vector(pos: WorldPoint) -> MatrixLike:
-    return transform.setMatrixPosition(datatypes.Matrix(), pos)
-
-
-def _set_keyframes(nodes: list[DagNodeLike], attrs: tuple[str, ...] = ("t", "r", "s")) -> None:
-    cmds.setKeyframe([x.name() for x in nodes], at=list(attrs))
-
-
 def _set_translation_keyframes(nodes: list[DagNodeLike]) -> None:
     cmds.setKeyframe([x.name() for x in nodes], at=["tx", "ty", "tz"])
 
@@ -185,10 +174,6 @@ def _cut_transform_keys(nodes: list[DagNodeLike], start_frame: int, end_frame: i
     pm.cutKey(nodes, at=channels, time=(start_frame, end_frame))
 
 
-def _set_attr_key(attr: PlugLike) -> None:
-    pm.setKeyframe(attr)
-
-
 def _set_roll_zero(ui_node: DagNodeLike, ikfk_attr: str) -> None:
     roll_name = ikfk_attr.replace("blend", "roll")
     roll_attr = _get_attr(ui_node, roll_name, required=False)
@@ -201,6 +186,54 @@ def _pole_vector_position(fk_goals: list[DagNodeLike], endpoint_goal: DagNodeLik
     return vector.calculatePoleVector(fk_goals[0], fk_goals[1], endpoint_goal, 1.0, frame)
 
 
+def _pole_vector_from_matrices(root: om.MMatrix, mid: om.MMatrix, end: om.MMatrix, distance: float = 1.0) -> om.MVector:
+    """Same as vector.calculatePoleVector, from already evaluated world matrices."""
+    a, b, c = (om.MVector(*[m.getElement(3, i) for i in range(3)]) for m in (root, mid, end))
+
+    start_end = c - a
+    start_mid = b - a
+    length = start_end.length()
+    if length < 1e-8:
+        return b
+
+    proj = start_end.normal() * ((start_mid * start_end) / length)
+    return (start_mid - proj) * distance + b
+
+
+def _translation_matrix(pos: om.MVector) -> om.MMatrix:
+    mat = om.MMatrix()
+    for i, v in enumerate((pos.x, pos.y, pos.z)):
+        mat.setElement(3, i, v)
+    return mat
+
+
+def _transfer_frames(key_times: list[int], start_frame: int, end_frame: int, only_keyframes: bool) -> list[int]:
+    if only_keyframes:
+        return list(key_times)
+    return list(range(start_frame, end_frame + 1))
+
+
+def _bake_world_matrices(nodes: list[DagNodeLike], frames: list[int], matrices: list[list[om.MMatrix]]) -> list[dict[str, list[float]]]:
+    """Local channel values giving nodes matrices[frame][node], see bake_util."""
+    return bake_util.computeLocalTransforms(nodes, frames, matrices)
+
+
+def _key_switch(attr: PlugLike, frames: list[int], value: float) -> None:
+    attr.set(value)
+    if frames:
+        cmds.setKeyframe(attr.name(), time=frames, value=value)
+
+
+def check_pole_vector_parity(fk_goals: list[DagNodeLike], endpoint_goal: DagNodeLike, frames: list[int]) -> float:
+    """Max distance between calculatePoleVector and the batched pole vectors."""
+    matrices = bake_util.getWorldMatricesAtFrames([fk_goals[0], fk_goals[1], endpoint_goal], frames)
+    res = 0.0
+    for frame, (a, b, c) in zip(frames, matrices):
+        expected = om.MVector(*_pole_vector_position(fk_goals, endpoint_goal, frame))
+        res = max(res, (expected - _pole_vector_from_matrices(a, b, c)).length())
+    return res
+
+
 def _apply_fk_matrices(fk_ctrls: list[DagNodeLike], matrices: list[MatrixValue]) -> None:
     for _ in range(2):
         for mat, ctrl in zip(matrices, fk_ctrls):
@@ -363,15 +396,19 @@ class IkFkTransfer(_TransferBase):
         key_src_nodes = ik_side_ctrls if to_fk else fk_ctrls
         key_times = _keyframe_times(key_src_nodes, startFrame, endFrame)
 
-        values = []
-        for frame in range(startFrame, endFrame + 1):
-            if to_fk:
-                values.append([_get_matrix(x, frame) for x in fk_goals])
-            else:
-                ik_matrix = _get_matrix(ik_goal, frame)
-                offset_matrices = [_get_matrix(x, frame) for x in offset_goals]
-                pole_matrix = _matrix_from_vector(_pole_vector_position(fk_goals, endpoint_goal, frame))
-                values.append([ik_matrix] + offset_matrices + [pole_matrix])
+        # only the frames that get keyed are evaluated, all in DG context
+        frames = _transfer_frames(key_times, startFrame, endFrame, onlyKeyframes)
+        if to_fk:
+            dst_nodes = fk_ctrls
+            matrices = bake_util.getWorldMatricesAtFrames(fk_goals, frames)
+        else:
+            dst_nodes = [ik_ctrl] + offset_ctrls + [upv_ctrl]
+            goals = [ik_goal] + offset_goals + [fk_goals[0], fk_goals[1], endpoint_goal]
+            matrices = []
+            for evaluated in bake_util.getWorldMatricesAtFrames(goals, frames):
+                pole = _pole_vector_from_matrices(*evaluated[-3:])
+                matrices.append(evaluated[:-3] + [_translation_matrix(pole)])
+        transforms = _bake_world_matrices(dst_nodes, frames, matrices)
 
         pm.cycleCheck(e=False)
         try:
@@ -382,23 +419,11 @@ class IkFkTransfer(_TransferBase):
                 roll_attr = _get_attr(ui_node, self.switchedAttrShortName.replace("blend", "roll"), required=False)
                 if roll_attr:
                     pm.cutKey(roll_attr, time=(startFrame, endFrame))
+                    if frames:
+                        roll_attr.set(0.0)
 
-            for i, frame in enumerate(range(startFrame, endFrame + 1)):
-                if onlyKeyframes and frame not in key_times:
-                    continue
-                pm.currentTime(frame)
-                switch_attr.set(0.0 if to_fk else 1.0)
-                if to_fk:
-                    _apply_fk_matrices(fk_ctrls, values[i])
-                    _set_keyframes(fk_ctrls)
-                else:
-                    _set_roll_zero(ui_node, self.switchedAttrShortName)
-                    _set_matrix(ik_ctrl, values[i][0])
-                    for offset_index, ctrl in enumerate(offset_ctrls):
-                        _set_matrix(ctrl, values[i][offset_index + 1])
-                    _set_matrix(upv_ctrl, values[i][-1])
-                    _set_keyframes(ik_side_ctrls)
-                _set_attr_key(switch_attr)
+            _key_switch(switch_attr, frames, 0.0 if to_fk else 1.0)
+            bake_util.keyTransforms(dst_nodes, frames, transforms)
         finally:
             pm.cycleCheck(e=True)
 
@@ -473,30 +498,22 @@ class IkEndpointTransfer(_TransferBase):
         key_nodes = [ik_ctrl, upv_ctrl] + offset_ctrls
         key_times = _keyframe_times(key_nodes, startFrame, endFrame)
 
-        matrices = []
-        for frame in range(startFrame, endFrame + 1):
-            endpoint_matrix = _get_matrix(endpoint_goal, frame)
-            offset_matrices = [_get_matrix(x, frame) for x in offset_goals]
-            upv_position = _get_translation(upv_ctrl, frame)
-            matrices.append([endpoint_matrix] + offset_matrices + [upv_position])
+        # the pole keeps its world position, only its translation is keyed
+        frames = _transfer_frames(key_times, startFrame, endFrame, onlyKeyframes)
+        dst_nodes = [ik_ctrl] + offset_ctrls + [upv_ctrl]
+        matrices = bake_util.getWorldMatricesAtFrames([endpoint_goal] + offset_goals + [upv_ctrl], frames)
+        transforms = _bake_world_matrices(dst_nodes, frames, matrices)
 
         pm.cycleCheck(e=False)
         try:
             _cut_transform_keys(key_nodes, startFrame, endFrame)
             switch_attr = _get_attr(ui_node, self.switchedAttrShortName)
             pm.cutKey(switch_attr, time=(startFrame, endFrame))
-            for i, frame in enumerate(range(startFrame, endFrame + 1)):
-                if onlyKeyframes and frame not in key_times:
-                    continue
-                pm.currentTime(frame)
-                switch_attr.set(endpoint_index)
-                _set_matrix(ik_ctrl, matrices[i][0])
-                for offset_index, ctrl in enumerate(offset_ctrls):
-                    _set_matrix(ctrl, matrices[i][offset_index + 1])
-                _set_translation(upv_ctrl, matrices[i][-1])
-                _set_keyframes([ik_ctrl] + offset_ctrls)
-                _set_translation_keyframes([upv_ctrl])
-                _set_attr_key(switch_attr)
+
+            _key_switch(switch_attr, frames, endpoint_index)
+            bake_util.keyTransforms(dst_nodes[:-1], frames, transforms[:-1])
+            bake_util.keyTransforms(dst_nodes[-1:], frames, transforms[-1:],
+                                    attrs=("translateX", "translateY", "translateZ"))
         finally:
             pm.cycleCheck(e=True)
 
@@ -416,8 +416,9 @@ class Component(component.Main):
         self.ghost_ctls.append(ghostCtl)
 
     def connect_rivets(self) -> None:
-        for i, (npo, ctl) in enumerate(zip(self.float_npos, self.float_ctls)):
-            self.connect_rivet(npo, i)
+        with ymt_util.geometry_cache():
+            for i, (npo, ctl) in enumerate(zip(self.float_npos, self.float_ctls)):
+                self.connect_rivet(npo, i)
 
     def connect_rivet(self, npo: object, index: int) -> None:
         rivets = ymt_util.apply_rivet_constrain_to_selected(self.sliding_surface, npo)
@@ -1066,84 +1066,75 @@ class Component(component.Main):
         fk0_npo.visibility = vis
 
     def addOperatorSineCurveExprespy(self) -> None:
+        # X and Y waves are evaluated by one node, sharing the curve length,
+        # the scale and the dropoff of each sample
         rewrite_map = [
             ["__scale_ctl", self.length_ctl],
             ["__curve_length", self.slv_crv_fn.length()],
-            ["__wave_offset_att", self.sinewave_offset_y_att],
-            ["__wave_power_att", self.sinewave_power_y_att],
-            ["__wave_length_att", self.sinewave_wavelength_y_att],
+            ["__wave_offset_x_att", self.sinewave_offset_x_att],
+            ["__wave_power_x_att", self.sinewave_power_x_att],
+            ["__wave_length_x_att", self.sinewave_wavelength_x_att],
+            ["__wave_offset_y_att", self.sinewave_offset_y_att],
+            ["__wave_power_y_att", self.sinewave_power_y_att],
+            ["__wave_length_y_att", self.sinewave_wavelength_y_att],
             ["__mst_crv", "{}.worldSpace".format(self.mst_crv.name())],
             ["__divisions", self.divisions],
+            ["__sample_count", max(len(self.fk_local_in2), self.divisions + 1)],
             ["__negate", self.negate],
             ["__dropoff", self.sinewave_dropoff_att],
         ]
         additional_code = ""
         for i, loc in enumerate(self.fk_local_in2):
-            rate = (i + 0.000000001) / self.divisions
-            additional_code += "\n{}.translateZ = get_sin_at_pos({}, s)".format(loc, rate)
+            additional_code += "\n{}.translateZ = ys[{}]".format(loc, i)
+            additional_code += "\n{}.translateX = xs[{}]".format(loc, i)
 
             if i < self.divisions:
-                additional_code += "\n{}.rotateX = get_tan_at_pos({}, s)".format(loc, rate)
-        self.exprespy2 = create_exprespy_node(self.sinewave_expression_archtype, self.getName("exprespy"), rewrite_map, additional_code)
-        # cmds.setAttr("{}.IN[4]".format(self.exprespy2), "{}.worldSpace".format(self.mst_crv.name()))
+                additional_code += "\n{}.rotateX = get_tan(ys[{}], ys[{}], s)".format(loc, i, i + 1)
+                additional_code += "\n{}.rotateZ = -1. * get_tan(xs[{}], xs[{}], s)".format(loc, i, i + 1)
 
-        rewrite_map = [
-            ["__scale_ctl", self.length_ctl],
-            ["__curve_length", self.slv_crv_fn.length()],
-            ["__wave_offset_att", self.sinewave_offset_x_att],
-            ["__wave_power_att", self.sinewave_power_x_att],
-            ["__wave_length_att", self.sinewave_wavelength_x_att],
-            ["__mst_crv", "{}.worldSpace".format(self.mst_crv.name())],
-            ["__divisions", self.divisions],
-            ["__negate", self.negate],
-            ["__dropoff", self.sinewave_dropoff_att],
-        ]
-        additional_code = ""
-        for i, loc in enumerate(self.fk_local_in2):
-            rate = (i + 0.000000001) / self.divisions
-            additional_code += "\n{}.translateX = get_sin_at_pos({}, s)".format(loc, rate)
-            if i < self.divisions:
-                additional_code += "\n{}.rotateZ = -1. * get_tan_at_pos({}, s)".format(loc, rate)
         self.exprespy2 = create_exprespy_node(self.sinewave_expression_archtype,
                                               self.getName("exprespy"),
                                               rewrite_map,
                                               additional_code)
         # cmds.setAttr("{}.IN[4]".format(self.exprespy2), "{}.worldSpace".format(self.mst_crv.name()))
 
-    def sinewave_expression_archtype(COUNT: int, __scale_ctl: object, __curve_length: float, __wave_offset_att: float, __wave_power_att: float, __wave_length_att: float, __mst_crv: object, __divisions: int, __negate: bool, __dropoff: float) -> object:
+    def sinewave_expression_archtype(COUNT: int, __scale_ctl: object, __curve_length: float, __wave_offset_x_att: float, __wave_power_x_att: float, __wave_length_x_att: float, __wave_offset_y_att: float, __wave_power_y_att: float, __wave_length_y_att: float, __mst_crv: object, __divisions: int, __sample_count: int, __negate: bool, __dropoff: float) -> object:
 
         if not COUNT:
             import math
 
-            def sigmoid(x: float, mx: float) -> None:
+            # rate along the chain of each sample, the tangent of a sample
+            # is taken toward the next one
+            RATES = [(i + 0.000000001) / __divisions for i in range(__sample_count)]
+
+            def sigmoid(x: float, mx: float) -> float:
                 # return mi + (mx-mi)*(lambda t: (1+(100.)**(-t+0.5))**(-1) )( (x-mi)/(mx-mi))
                 x = (x * 10) / mx - 5.
                 return 1 / (1 + math.exp(-x))
 
-            def get_sin_at_pos(pos: float, s: float) -> None:
+            def get_wave(offset: float, power: float, wavelength: float, s: float, weights: list) -> list:
+                k = math.pi * (2. / (wavelength / 100.0))
+                phase = (offset / 100.0) * (wavelength / 100.0)
+                amplitude = __curve_length * (power / 100.0) * 0.5
+                return [w * math.sin(k * (phase + pos * s)) * amplitude for pos, w in zip(RATES, weights)]
 
-                x = math.sin(math.pi * (2. / (__wave_length_att / 100.0)) * ((__wave_offset_att / 100.0) * (__wave_length_att / 100.0) + pos * s)) * __curve_length * (__wave_power_att / 100.0) * 0.5
-                return sigmoid(pos, __dropoff / 100.0) * x
-
-            def get_tan_at_pos(pos: float, s: float) -> object:
-                a = get_sin_at_pos(pos, s)
-                b = get_sin_at_pos(pos + (1. / __divisions), s)
+            def get_tan(a: float, b: float, s: float) -> float:
+                t = math.atan(abs(b - a) / (__curve_length * s / __divisions))
                 if (b - a) < 0.:
-                    if __negate:
-                        return math.atan(abs(b - a) / (__curve_length * s / __divisions)) * 1
-                    else:
-                        return math.atan(abs(b - a) / (__curve_length * s / __divisions)) * -1
+                    return t if __negate else -t
                 else:
-                    if __negate:
-                        return math.atan(abs(b - a) / (__curve_length * s / __divisions)) * -1
-                    else:
-                        return math.atan(abs(b - a) / (__curve_length * s / __divisions))
+                    return -t if __negate else t
 
         mst_crv = api.MFnNurbsCurve(__mst_crv)
         s2 = mst_crv.length() / __curve_length
         s = __scale_ctl.ty / __curve_length
         s = min(s, s2)
 
+        dropoff = __dropoff / 100.0
+        weights = [sigmoid(pos, dropoff) for pos in RATES]
+        xs = get_wave(__wave_offset_x_att, __wave_power_x_att, __wave_length_x_att, s, weights)
+        ys = get_wave(__wave_offset_y_att, __wave_power_y_att, __wave_length_y_att, s, weights)
+
     def connectRef(self, refArray: str, cns_obj: object, upVAttr: bool=None, init_refNames: bool=False) -> None:
         """Connect the cns_obj to a multiple object using parentConstraint.
 
@@ -41,7 +41,6 @@ from mgear.core import (
 from mgear.core.transform import (
     getTransform,
     setMatrixPosition,
-    getTransformLookingAt,
 )
 
 from mgear.core.primitive import addTransform
@@ -488,50 +487,12 @@ class Component(component.Main):
 
     def _getRotationsAtEachPoint(self, bfrs: object) -> None:
         # type: (List[Text]) -> List[Tuple[float, float, float]]
-        # pylint: disable=too-many-locals
 
-        rotations = []
         norm = self.guide.blades["blade"].y
-        for i, ctrl in enumerate(bfrs):
-
-            c = pm.PyNode(ctrl).getTranslation(space="world")
-
-            if i == 0:
-                n = pm.PyNode(bfrs[1]).getTranslation(space="world")
-                t = getTransformLookingAt(c, n, norm, axis="xy")
-                rot = transform_to_euler(t)
-
-            elif i == (len(bfrs) - 1):
-                p = pm.PyNode(bfrs[i - 1]).getTranslation(space="world")
-                t = getTransformLookingAt(c, p, norm, axis="-xy")
-                rot = transform_to_euler(t)
-
-            else:
-                p = pm.PyNode(bfrs[i - 1]).getTranslation(space="world")
-                n = pm.PyNode(bfrs[i + 1]).getTranslation(space="world")
-
-                t1 = getTransformLookingAt(c, p, norm, axis="-xy")
-                t2 = getTransformLookingAt(c, n, norm, axis="xy")
-
-                q1 = om.MTransformationMatrix(om.MMatrix(t1)).rotation(True)
-                q2 = om.MTransformationMatrix(om.MMatrix(t2)).rotation(True)
-                q = om.MQuaternion.slerp(q1, q2, 0.5)
-
-                rot = q.asEulerRotation().asVector()
-                rot = (math.degrees(rot[0]), math.degrees(rot[1]), math.degrees(rot[2]))
-
-            rotations.append(rot)
-
-        return rotations
+        return ymt_util._getRotationsAtEachPoint(bfrs, norm)
 
     def withCurvePos(self, curveFn: object, it: object, offset: float=0.) -> None:
-        curveLen = curveFn.length()
-
-        for i, element in enumerate(it):
-            param = curveFn.findParamFromLength((curveLen / (len(it) - 1)) * (i + offset))
-            point = curveFn.getPointAtParam(param, om.MSpace.kObject)
-            pos = point[0], point[1], point[2]
-            yield pos, element
+        return ymt_util.withCurvePos(curveFn, it, offset)
 
     def alignControllers(self, bfrs: object, cvs: object, oTans: object, iTans: object, curveFn: object) -> None:
         curveLen = curveFn.length()
@@ -582,14 +543,14 @@ class Component(component.Main):
             cmds.setAttr("{0}.Pin".format(cv), 0)
 
         # Re-set the tangent worldspace positions now that things have changed
-        for pos, cv in self.withCurvePos(curveFn, oTans, 0.4):
+        for cv in oTans:
             cmds.setAttr("{0}.tx".format(cv), curveLen / self.ikNb * 0.7)
             cmds.setAttr("{0}.ty".format(cv), 0.0)
             cmds.setAttr("{0}.tz".format(cv), 0.0)
             cmds.setAttr("{0}.Auto".format(cv), 0)
             insertNpo(cv)
 
-        for pos, cv in self.withCurvePos(curveFn, iTans, 0.6):
+        for cv in iTans:
             cmds.setAttr("{0}.tx".format(cv), curveLen / self.ikNb * -0.7)
             cmds.setAttr("{0}.ty".format(cv), 0.0)
             cmds.setAttr("{0}.tz".format(cv), 0.0)
@@ -601,36 +562,8 @@ class Component(component.Main):
 
         curveLen = curveFn.length()
         max_param = curveLen / 33.3333
-        maximum_iteration = 10000
-
-        joint = getAsMFnNode(joints[0], om.MFnTransform)
-        _positions = []
-
-        for param in [(max_param / maximum_iteration) * x for x in range(maximum_iteration)]:
-            cmds.setAttr("{0}.params[0].param".format(riderCnst), param)
-            cmds.dgeval(riderCnst)
-            p = joint.translation(om.MSpace.kWorld)
-            _positions.append(p)
-
-        def _searchNearestParam(pos: float) -> None:
-
-            res = _positions[0]
-            cur = None
-            pos = om.MVector(pos)
-
-            for i, p in enumerate(_positions):
-                d = (p - pos).length()
-                if not cur or cur > d:
-                    cur = d
-                    res = p
-
-            return max_param / maximum_iteration * _positions.index(res)
 
-        cmds.setAttr("{0}.params[0].param".format(riderCnst), 0.0)
-        for i, pos in enumerate(positions[1:]):
-            i = i + 1  # skiped first
-            param = _searchNearestParam(pos)
-            cmds.setAttr("{0}.params[{1}].param".format(riderCnst, i), param)
+        ymt_util.alignRiderParams(joints, positions, riderCnst, max_param)
 
     def convertToTwistSpline(self, positions: object, crv: object, ikNb: object, isClosed: bool=False) -> None:
 
@@ -0,0 +1,229 @@
+"""NumPy optimizer loop of ``ymt_shifter_utility.fit_curve``.
+
+This module imports neither Maya nor the ``ymt_shifter_utility`` package, so
+``fit_curves_batch(executor="process")`` workers can unpickle ``run_job``
+without loading Qt, pymel, mgear or OpenMaya. Everything here works on
+plain arrays; the ``om2`` conversions stay in ``fit_curve``.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass
+class ArrayFitContext:
+    """Dense NumPy form of a ``FitContext``.
+
+    ``basis`` and ``smoothness`` are folded onto master CV columns, so the
+    trailing bound CVs of periodic curves have all-zero columns and gradients
+    come out already accumulated on the independent CVs.
+    """
+
+    basis: np.ndarray
+    smoothness: np.ndarray
+    target_points: np.ndarray
+    cvs_world: np.ndarray
+
+
+@dataclass
+class ArrayFitJob:
+    """Picklable input of ``run_job``.
+
+    ``periodic_degree`` is the curve degree for periodic curves and 0
+    otherwise; the last ``periodic_degree`` CVs mirror the first ones.
+    """
+
+    arrays: ArrayFitContext
+    values: np.ndarray
+    cv_indices: list[int]
+    periodic_degree: int
+    num_iterations: int
+    learning_rate: float
+    beta: float
+    optimizer: str
+    smoothness_weight: float
+    adam_beta1: float
+    adam_beta2: float
+    adam_epsilon: float
+    tracker: ConvergenceTracker
+
+
+class ConvergenceTracker:
+    """Record per-step history and decide when the optimizer loop may stop.
+
+    A step counts as converged when any enabled criterion holds: relative
+    objective change, gradient norm of the active CVs, or max CV displacement
+    at or below its tolerance. The loop stops after ``patience`` consecutive
+    converged steps.
+    """
+
+    def __init__(
+        self,
+        initial_objective: float,
+        objective_tolerance: float | None,
+        gradient_tolerance: float | None,
+        displacement_tolerance: float | None,
+        patience: int,
+        record_history: bool,
+    ) -> None:
+        if patience < 1:
+            raise ValueError("patience must be at least 1.")
+
+        self.previous_objective = initial_objective
+        self.objective_tolerance = objective_tolerance
+        self.gradient_tolerance = gradient_tolerance
+        self.displacement_tolerance = displacement_tolerance
+        self.patience = patience
+        self.record_history = record_history
+        self.iterations = 0
+        self.converged = False
+        self.stop_reason = "max_iterations"
+        self.loss_history: list[float] = []
+        self.gradient_norm_history: list[float] = []
+        self._streak = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.record_history or any(
+            tolerance is not None
+            for tolerance in (self.objective_tolerance, self.gradient_tolerance, self.displacement_tolerance)
+        )
+
+    @property
+    def needs_objective(self) -> bool:
+        return self.record_history or self.objective_tolerance is not None
+
+    def _converged_reason(self, objective: float | None, gradient_norm: float, displacement: float) -> str | None:
+        reason = None
+        if self.objective_tolerance is not None and objective is not None:
+            change = abs(self.previous_objective - objective) / max(abs(self.previous_objective), 1e-30)
+            self.previous_objective = objective
+            if change <= self.objective_tolerance:
+                reason = "objective"
+        if reason is None and self.gradient_tolerance is not None and gradient_norm <= self.gradient_tolerance:
+            reason = "gradient"
+        if reason is None and self.displacement_tolerance is not None and displacement <= self.displacement_tolerance:
+            reason = "displacement"
+        return reason
+
+    def update(self, step: int, objective: float | None, gradient_norm: float, displacement: float) -> bool:
+        """Record ``step`` and return whether the loop should stop."""
+        self.iterations = step
+        if self.record_history:
+            self.loss_history.append(float(objective))
+            self.gradient_norm_history.append(float(gradient_norm))
+
+        reason = self._converged_reason(objective, gradient_norm, displacement)
+        if reason is None:
+            self._streak = 0
+            return False
+
+        self._streak += 1
+        if self._streak < self.patience:
+            return False
+
+        self.converged = True
+        self.stop_reason = reason
+        return True
+
+
+def sync_periodic_bound_cvs(values: np.ndarray, periodic_degree: int) -> np.ndarray:
+    if periodic_degree:
+        values[-periodic_degree:] = values[:periodic_degree]
+    return values
+
+
+def objective_loss(values: np.ndarray, arrays: ArrayFitContext, smoothness_weight: float) -> tuple[float, float, float]:
+    diff = arrays.basis @ values - arrays.target_points
+    distance_loss = float(np.sum(diff * diff)) / float(len(arrays.target_points))
+    smoothness_loss = 0.0
+    if len(arrays.smoothness):
+        second = arrays.smoothness @ values
+        smoothness_loss = float(np.sum(second * second)) / float(len(arrays.smoothness))
+    return (
+        distance_loss + smoothness_weight * smoothness_loss,
+        distance_loss,
+        smoothness_loss,
+    )
+
+
+def objective_gradients(values: np.ndarray, arrays: ArrayFitContext, smoothness_weight: float) -> np.ndarray:
+    diff = arrays.basis @ values - arrays.target_points
+    gradients = arrays.basis.T @ diff * (2.0 / float(len(arrays.target_points)))
+    if smoothness_weight != 0.0 and len(arrays.smoothness):
+        second = arrays.smoothness @ values
+        gradients += arrays.smoothness.T @ second * (2.0 * smoothness_weight / float(len(arrays.smoothness)))
+    return gradients
+
+
+def optimize_values(
+    arrays: ArrayFitContext,
+    values: np.ndarray,
+    cv_indices: Sequence[int],
+    periodic_degree: int,
+    num_iterations: int,
+    learning_rate: float,
+    beta: float,
+    optimizer: str,
+    smoothness_weight: float,
+    adam_beta1: float,
+    adam_beta2: float,
+    adam_epsilon: float,
+    tracker: ConvergenceTracker,
+) -> np.ndarray:
+    """Run the adam or lion loop on ``values`` in place and return it."""
+    active = np.asarray(cv_indices, dtype=np.intp)
+    first_moment = np.zeros((len(active), 3), dtype=np.float64)
+    second_moment = np.zeros((len(active), 3), dtype=np.float64)
+
+    for step in range(1, num_iterations + 1):
+        previous = values[active]
+        gradients = objective_gradients(values, arrays, smoothness_weight)[active]
+        if optimizer == "adam":
+            first_moment = first_moment * adam_beta1 + gradients * (1.0 - adam_beta1)
+            second_moment = second_moment * adam_beta2 + gradients * gradients * (1.0 - adam_beta2)
+            m_hat = first_moment / (1.0 - adam_beta1**step)
+            v_hat = second_moment / (1.0 - adam_beta2**step)
+            values[active] -= m_hat / (np.sqrt(v_hat) + adam_epsilon) * learning_rate
+        else:
+            first_moment = first_moment * beta + gradients * (1.0 - beta)
+            values[active] -= np.sign(first_moment) * learning_rate
+        sync_periodic_bound_cvs(values, periodic_degree)
+
+        tracker.iterations = step
+        if not tracker.enabled:
+            continue
+        objective = None
+        if tracker.needs_objective:
+            objective = objective_loss(values, arrays, smoothness_weight)[0]
+        displacement = float(np.max(np.linalg.norm(values[active] - previous, axis=1), initial=0.0))
+        if tracker.update(step, objective, float(np.linalg.norm(gradients)), displacement):
+            break
+
+    return values
+
+
+def run_job(job: ArrayFitJob) -> tuple[np.ndarray, ConvergenceTracker]:
+    """Process pool entry point, returns the optimized values and the tracker."""
+    values = optimize_values(
+        job.arrays,
+        job.values,
+        job.cv_indices,
+        job.periodic_degree,
+        job.num_iterations,
+        job.learning_rate,
+        job.beta,
+        job.optimizer,
+        job.smoothness_weight,
+        job.adam_beta1,
+        job.adam_beta2,
+        job.adam_epsilon,
+        job.tracker,
+    )
+    return values, job.tracker
@@ -1,8 +1,15 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 import re
+import ast
+import json
 import math
+import os
 import sys
+import time
+import zlib
+import array
+import base64
 import contextlib
 from collections.abc import Iterator, Sequence
 
@@ -671,30 +678,86 @@ def setCurveCVs(crv: str | PymelNode, positions: Sequence[Sequence[float]], spac
     crv_fn.updateCurve()
 
 
+class GuideLocalNameIndex(object):
+    """Local name to dag path index of a guide subtree.
+
+    Built lazily by findGuideObjectByLocalName and stored on the guide. It is
+    rebuilt when the guide root or name changes, when a cached node is gone,
+    and on a miss, so nodes added later are still found. Lookups are counted
+    when the logger is in debug mode.
+    """
+
+    def __init__(self, guide: object, includeShapes: bool) -> None:
+        self.includeShapes = includeShapes
+        self.key: tuple[str, str] = ("", "")
+        self._exact: dict[str, str] = {}
+        self._suffix: dict[str, str] = {}
+        self.lookups = 0
+        self.rescans = 0
+        self.misses = 0
+        self.rescan(guide)
+
+    @staticmethod
+    def get_key(guide: object) -> tuple[str, str]:
+        root = guide.root.longName() if hasattr(guide.root, "longName") else str(guide.root)
+        return root, guide.fullName
+
+    def rescan(self, guide: object) -> None:
+        self.key = self.get_key(guide)
+        kwargs = {"ad": True, "fullPath": True}
+        if not self.includeShapes:
+            kwargs["type"] = "transform"
+
+        self._exact = {}
+        self._suffix = {}
+        self.rescans += 1
+
+        # keep the first node in listRelatives order for every name, same
+        # as the linear passes did
+        for child in cmds.listRelatives(self.key[0], **kwargs) or []:
+            short_name = child.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
+            self._exact.setdefault(short_name, child)
+            self._suffix.setdefault(short_name, child)
+            parts = short_name.split("_")
+            for i in range(1, len(parts)):
+                self._suffix.setdefault("_".join(parts[i:]), child)
+
+    def find(self, guide: object, local_name: str) -> str | None:
+        target = "{}_{}".format(guide.fullName, local_name)
+        return self._exact.get(target) or self._suffix.get(local_name)
+
+
+def invalidateGuideLocalNameIndex(guide: object) -> None:
+    """Drop the local name indices of the guide, e.g. after rebuilding it."""
+    guide.__dict__.pop("_ymt_local_name_index", None)
+
+
 def findGuideObjectByLocalName(guide: object, local_name: str, includeShapes: bool = False) -> PymelNode | None:
-    root = guide.root.longName() if hasattr(guide.root, "longName") else str(guide.root)
-    kwargs = {"ad": True, "fullPath": True}
-    if not includeShapes:
-        kwargs["type"] = "transform"
+    indices = guide.__dict__.setdefault("_ymt_local_name_index", {})
+    index = indices.get(includeShapes)
+
+    if index is None:
+        index = indices[includeShapes] = GuideLocalNameIndex(guide, includeShapes)
+    elif index.key != GuideLocalNameIndex.get_key(guide):
+        index.rescan(guide)
 
-    children = cmds.listRelatives(root, **kwargs) or []
-    target = "{}_{}".format(guide.fullName, local_name)
+    index.lookups += 1
+    found = index.find(guide, local_name)
 
-    def _short_name(node: str) -> str:
-        return node.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
+    if found is None or not cmds.objExists(found):
+        index.misses += 1
+        index.rescan(guide)
+        found = index.find(guide, local_name)
 
-    for child in children:
-        if _short_name(child) == target:
-            return pm.PyNode(child)
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("local name index of {}: {} lookups, {} misses, {} rescans".format(
+            guide.fullName, index.lookups, index.misses, index.rescans))
 
-    suffix = "_{}".format(local_name)
-    for child in children:
-        short_name = _short_name(child)
-        if short_name == local_name or short_name.endswith(suffix):
-            return pm.PyNode(child)
+    if found is None:
+        raise Exception(
+            "Object {} not found in guide {}.".format(local_name, guide.fullName))
 
-    raise Exception(
-        "Object {} not found in guide {}.".format(local_name, guide.fullName))
+    return pm.PyNode(found)
 
 
 def transform_to_euler(t: om.MTransformationMatrix|dt.Matrix) -> tuple[float, float, float]:
@@ -916,14 +979,14 @@ def alignControllers(cvs: List[Text], bfrs: List[Text], oTans: List[Text], iTans
         cmds.setAttr("{0}.Pin".format(cv), 0)
 
     # Re-set the tangent worldspace positions now that things have changed
-    for pos, cv in withCurvePos(curveFn, oTans, 0.4):
+    for cv in oTans:
         cmds.setAttr("{0}.tx".format(cv), curveLen / ikNb * 0.7)
         cmds.setAttr("{0}.ty".format(cv), 0.0)
         cmds.setAttr("{0}.tz".format(cv), 0.0)
         cmds.setAttr("{0}.Auto".format(cv), 0)
         insertNpo(cv)
 
-    for pos, cv in withCurvePos(curveFn, iTans, 0.6):
+    for cv in iTans:
         cmds.setAttr("{0}.tx".format(cv), curveLen / ikNb * -0.7)
         cmds.setAttr("{0}.ty".format(cv), 0.0)
         cmds.setAttr("{0}.tz".format(cv), 0.0)
@@ -931,65 +994,211 @@ def alignControllers(cvs: List[Text], bfrs: List[Text], oTans: List[Text], iTans
         insertNpo(cv)
 
 
-def alignDeformers(joints: List, positions: List, riderCnst: Text, curveFn: om.MFnNurbsCurve) -> None:
-    # align deformer joints to the given positions
+def _evalRiderPosition(riderCnst: Text, joint: om.MFnTransform, param: float) -> om.MVector:
+    cmds.setAttr("{0}.params[0].param".format(riderCnst), param)
+    cmds.dgeval(riderCnst)
+    return joint.translation(om.MSpace.kWorld)
 
-    curveLen = curveFn.length()
-    max_param = curveLen * len(positions) / 33.3
-    maximum_iteration = 10000
 
-    joint = getAsMFnNode(joints[0], om.MFnTransform)
-    _positions = []
+def _goldenSectionSearch(func: Callable[[float], float], low: float, high: float, tolerance: float) -> float:
+    ratio = (math.sqrt(5.0) - 1.0) / 2.0
+    left = high - ratio * (high - low)
+    right = low + ratio * (high - low)
+    left_value = func(left)
+    right_value = func(right)
+
+    while high - low > tolerance:
+        if left_value < right_value:
+            high, right, right_value = right, left, left_value
+            left = high - ratio * (high - low)
+            left_value = func(left)
+        else:
+            low, left, left_value = left, right, right_value
+            right = low + ratio * (high - low)
+            right_value = func(right)
+
+    return (low + high) * 0.5
+
+
+def findRiderParamsExhaustive(positions: Sequence[VectorLike], riderCnst: Text, joint: om.MFnTransform, max_param: float, samples: int = 10000) -> List[float]:
+    """Return the nearest rider param of each position by a dense scan.
+
+    This is the original brute-force lookup, kept as the reference for
+    ``findRiderParams``.
+    """
+    table = [_evalRiderPosition(riderCnst, joint, max_param / samples * x) for x in range(samples)]
+
+    params = []
+    for pos in positions:
+        pos = om.MVector(pos)
+        distances = [(p - pos).length() for p in table]
+        params.append(max_param / samples * distances.index(min(distances)))
 
-    for param in [(max_param / maximum_iteration) * x for x in range(maximum_iteration)]:
-        cmds.setAttr("{0}.params[0].param".format(riderCnst), param)
-        cmds.dgeval(riderCnst)
-        p = joint.translation(om.MSpace.kWorld)
-        _positions.append(p)
+    return params
 
-    def _searchNearestParam(pos: Sequence[float]) -> float:
 
-        res = _positions[0]
-        cur = None
+def findRiderParams(positions: Sequence[VectorLike], riderCnst: Text, joint: om.MFnTransform, max_param: float, coarse_samples: int = 200, tolerance: Optional[float] = None) -> List[float]:
+    """Return the nearest rider param of each position by a coarse-to-fine search.
+
+    A small table of ``coarse_samples`` rider positions brackets the nearest
+    param, which is then refined by golden-section search with a few
+    ``dgeval`` calls. ``tolerance`` defaults to the resolution of the old
+    10,000 step scan.
+    """
+    if tolerance is None:
+        tolerance = max_param / 10000.0
+
+    step = max_param / coarse_samples
+    table = [_evalRiderPosition(riderCnst, joint, step * x) for x in range(coarse_samples)]
+
+    params = []
+    for pos in positions:
         pos = om.MVector(pos)
+        distances = [(p - pos).length() for p in table]
+        nearest = distances.index(min(distances))
+        low = max(0.0, step * (nearest - 1))
+        high = min(max_param, step * (nearest + 1))
+
+        def _distance(param: float) -> float:
+            return (_evalRiderPosition(riderCnst, joint, param) - pos).length()
+
+        params.append(_goldenSectionSearch(_distance, low, high, tolerance))
 
-        for i, p in enumerate(_positions):
-            d = (p - pos).length()
-            if not cur or cur > d:
-                cur = d
-                res = p
+    return params
 
-        return max_param / maximum_iteration * _positions.index(res)
+
+def alignRiderParams(joints: List, positions: List, riderCnst: Text, max_param: float, coarse_samples: int = 200, tolerance: Optional[float] = None, timing_hook: Optional[Callable[[Text, float], None]] = None) -> List[float]:
+    """Set rider params so that joints[1:] sit nearest to positions[1:].
+
+    ``timing_hook`` receives a label and the elapsed seconds of the search.
+    """
+    start = time.perf_counter()
+    joint = getAsMFnNode(joints[0], om.MFnTransform)
+    params = findRiderParams(positions[1:], riderCnst, joint, max_param, coarse_samples, tolerance)
 
     cmds.setAttr("{0}.params[0].param".format(riderCnst), 0.0)
-    for i, pos in enumerate(positions[1:]):
+    for i, param in enumerate(params):
         i = i + 1  # skiped first
-        param = _searchNearestParam(pos)
         cmds.setAttr("{0}.params[{1}].param".format(riderCnst, i), param)
 
+    elapsed = time.perf_counter() - start
+    if timing_hook is not None:
+        timing_hook("alignRiderParams", elapsed)
+    logger.debug("alignRiderParams: %d deformers in %.3fs", len(params), elapsed)
 
-def withCurvePos(curveFn: om.MFnNurbsCurve, it: Sequence[object], offset: float = 0.0) -> Iterator[tuple[tuple[float, float, float], object]]:
+    return params
+
+
+def alignDeformers(joints: List, positions: List, riderCnst: Text, curveFn: om.MFnNurbsCurve, coarse_samples: int = 200, tolerance: Optional[float] = None, timing_hook: Optional[Callable[[Text, float], None]] = None) -> None:
+    # align deformer joints to the given positions
 
     curveLen = curveFn.length()
+    max_param = curveLen * len(positions) / 33.3
+    alignRiderParams(joints, positions, riderCnst, max_param, coarse_samples, tolerance, timing_hook)
 
-    if len(it) == 1:
-        param = curveFn.findParamFromLength(curveLen * offset)
-        point = curveFn.getPointAtParam(param, om.MSpace.kObject)
-        pos = point[0], point[1], point[2]
 
-        yield pos, it[0]
-        return
+def sampleCurveByLength(curveFn: om.MFnNurbsCurve, count: int, offset: float = 0.0, tangents: bool = False) -> tuple[list[tuple[float, float, float]], list[tuple[float, float, float]] | None]:
+    """Sample positions evenly spaced by arc length on the curve.
+
+    The i-th sample is at length (curveLen / (count - 1)) * (i + offset),
+    a single sample is at curveLen * offset.
+
+    Args:
+        curveFn (om.MFnNurbsCurve): The curve
+        count (int): Number of samples
+        offset (float, optional): Offset of the samples in spacing units
+        tangents (bool, optional): Also return the tangent at each sample
+
+    Returns:
+        list[tuple[float, float, float]]: Object space positions
+        list[tuple[float, float, float]] | None: Object space tangents
+    """
+
+    curveLen = curveFn.length()
+    if count == 1:
+        lengths = [curveLen * offset]
+    else:
+        step = curveLen / (count - 1) if count > 1 else 0.0
+        lengths = [step * (i + offset) for i in range(count)]
 
-    for i, element in enumerate(it):
+    params = [curveFn.findParamFromLength(x) for x in lengths]
 
-        param = curveFn.findParamFromLength((curveLen / (len(it) - 1)) * (i + offset))
+    positions = []
+    for param in params:
         point = curveFn.getPointAtParam(param, om.MSpace.kObject)
-        pos = point[0], point[1], point[2]
+        positions.append((point[0], point[1], point[2]))
+
+    if not tangents:
+        return positions, None
+
+    tans = []
+    for param in params:
+        tan = curveFn.tangent(param, om.MSpace.kObject)
+        tans.append((tan[0], tan[1], tan[2]))
+
+    return positions, tans
+
+
+def withCurvePos(curveFn: om.MFnNurbsCurve, it: Sequence[object], offset: float = 0.0) -> Iterator[tuple[tuple[float, float, float], object]]:
 
+    positions, _ = sampleCurveByLength(curveFn, len(it), offset)
+    for pos, element in zip(positions, it):
         yield pos, element
 
 
+def getWorldTranslations(nodes: Sequence[Text]) -> List[dt.Vector]:
+    """World space translation of each transform, fetched through om2."""
+
+    res = []
+    for node in nodes:
+        path = om.MSelectionList().add(node).getDagPath(0)
+        t = om.MFnTransform(path).translation(om.MSpace.kWorld)
+        res.append(dt.Vector(t.x, t.y, t.z))
+
+    return res
+
+
+def getLookAtRotations(positions: Sequence[VectorLike], norm: VectorLike) -> List[Tuple[float, float, float]]:
+    """Rotation in degrees at each position looking along the point chain.
+
+    The first and last points look at their neighbor, the points in between
+    use the half-way slerp of the frames looking back and forward.
+    The frame looking from a point to the next one and the frame looking
+    back from the next one ("-xy") share the same rotation, so a single
+    look-at is computed per segment.
+
+    Args:
+        positions (Sequence[VectorLike]): World space positions, at least 2
+        norm (VectorLike): Normal passed to getTransformLookingAt
+
+    Returns:
+        List[Tuple[float, float, float]]: Euler rotations in degrees
+    """
+
+    count = len(positions)
+    segments = [getTransformLookingAt(positions[i], positions[i + 1], norm, axis="xy")
+                for i in range(count - 1)]
+    quats = [om.MTransformationMatrix(om.MMatrix(t)).rotation(True) for t in segments]
+
+    rotations = [transform_to_euler(segments[0])]
+    for i in range(1, count - 1):
+        q = om.MQuaternion.slerp(quats[i - 1], quats[i], 0.5)
+
+        rot = q.asEulerRotation().asVector()
+        rotations.append((math.degrees(rot[0]), math.degrees(rot[1]), math.degrees(rot[2])))
+
+    rotations.append(transform_to_euler(segments[-1]))
+
+    return rotations
+
+
 def _getRotationsAtEachPoint(bfrs: List[Text], norm: om.MVector) -> List[Tuple[float, float, float]]:
+
+    return getLookAtRotations(getWorldTranslations(bfrs), norm)
+
+
+def _getRotationsAtEachPointReference(bfrs: List[Text], norm: om.MVector) -> List[Tuple[float, float, float]]:
+    """Reference implementation building two look-at frames per point."""
     # pylint: disable=too-many-locals
 
     rotations = []
@@ -1027,6 +1236,58 @@ def _getRotationsAtEachPoint(bfrs: List[Text], norm: om.MVector) -> List[Tuple[f
     return rotations
 
 
+def benchmarkControllerFrames(counts: Sequence[int] = (10, 50, 200), repeat: int = 5) -> Dict[int, Dict[str, float]]:
+    """Time the controller frame generation against the reference helpers.
+
+    Temporary transforms are laid out along a temporary curve for each
+    controller count and deleted afterwards.
+
+    Args:
+        counts (Sequence[int], optional): Controller counts to measure
+        repeat (int, optional): Runs per measure, the best one is kept
+
+    Returns:
+        Dict[int, Dict[str, float]]: per count, the best "reference" and
+            "batched" seconds and the "max_error" in degrees between them
+    """
+
+    def _best(func: Callable[[], object]) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    results = {}
+    for count in counts:
+        points = [(i, math.sin(i * 0.3) * 2.0, math.cos(i * 0.2)) for i in range(count)]
+        crv = cmds.curve(d=3, p=points + [(count, 0.0, 0.0)] * max(0, 4 - count))
+        nodes = [cmds.createNode("transform", name="benchmarkFrame{}".format(i)) for i in range(count)]
+        try:
+            curveFn = getAsMFnNode(getCurveShapeName(crv), om.MFnNurbsCurve)
+            for pos, node in withCurvePos(curveFn, nodes):
+                cmds.xform(node, ws=True, a=True, t=pos)
+
+            norm = dt.Vector(0.0, 1.0, 0.0)
+            reference = _getRotationsAtEachPointReference(nodes, norm)
+            batched = _getRotationsAtEachPoint(nodes, norm)
+            max_error = max(abs(a - b) for r, q in zip(reference, batched) for a, b in zip(r, q))
+
+            results[count] = {
+                "reference": _best(lambda: _getRotationsAtEachPointReference(nodes, norm)),
+                "batched": _best(lambda: _getRotationsAtEachPoint(nodes, norm)),
+                "max_error": max_error,
+            }
+            logger.info("{} controllers: reference {:.4f} sec, batched {:.4f} sec, max error {}".format(
+                count, results[count]["reference"], results[count]["batched"], max_error))
+
+        finally:
+            cmds.delete(nodes + [crv])
+
+    return results
+
+
 def iter_tr_xyz(object_name: str) -> Iterator[str]:
     for attr in ("t", "r"):
         for axis in ("x", "y", "z"):
@@ -1087,117 +1348,187 @@ def __has_make_nurbs_surface_hostory(surface_name: str) -> bool:
     return False
 
 
-def serialize_mesh_shape(mesh_name: str) -> str:
+GEOMETRY_FORMAT = "ymt_geometry"
+GEOMETRY_FORMAT_VERSION = 2
+
+
+def _pack_array(values: Sequence[float] | Sequence[int], typecode: str, compress: bool = True) -> dict[str, object]:
+    """Pack numbers as little-endian ``array`` bytes, optionally zlib compressed, in base64."""
+    data = array.array(typecode, values)
+    if sys.byteorder == "big":
+        data.byteswap()
+    raw = data.tobytes()
+    if compress:
+        raw = zlib.compress(raw)
+
+    return {
+        "type": typecode,
+        "zlib": compress,
+        "data": base64.b64encode(raw).decode("ascii"),
+    }
+
+
+def _unpack_array(packed: dict[str, object]) -> array.array:
+    raw = base64.b64decode(packed["data"])
+    if packed.get("zlib"):
+        raw = zlib.decompress(raw)
+
+    data = array.array(packed["type"])
+    data.frombytes(raw)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data
+
+
+def _load_serialized_geometry(serialized_data: str) -> dict[str, object]:
+    """Parse serialized geometry without ``eval``.
+
+    Current data is JSON. Guides saved before the versioned format hold a
+    ``str(dict)`` text which is read with ``ast.literal_eval``.
+    """
+    text = serialized_data.strip()
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = ast.literal_eval(text)
+
+    if not isinstance(data, dict):
+        raise ValueError("serialized geometry must be a dictionary but got {0}".format(type(data)))
+
+    version = data.get("version", 1)
+    if version > GEOMETRY_FORMAT_VERSION:
+        raise ValueError("Unsupported serialized geometry version: {0}".format(version))
+
+    return data
+
+
+def _is_serialized_nurbs_surface(data: dict[str, object]) -> bool:
+    return data.get("type") == "nurbsSurface" or bool(data.get("controlVertices"))
+
+
+def _get_local_transform_data(node_name: str) -> dict[str, object]:
+    return {
+        "localRotatePivot": cmds.xform(node_name, q=True, os=True, rp=True),
+        "localScalePivot": cmds.xform(node_name, q=True, os=True, sp=True),
+        "rotate": cmds.xform(node_name, q=True, os=True, ro=True),
+        "scale": cmds.xform(node_name, q=True, os=True, s=True),
+        "translate": cmds.xform(node_name, q=True, os=True, t=True),
+    }
+
+
+def _set_local_transform_data(node_name: str, data: dict[str, object]) -> None:
+    cmds.xform(node_name, os=True, rp=data["localRotatePivot"])
+    cmds.xform(node_name, os=True, sp=data["localScalePivot"])
+    cmds.xform(node_name, os=True, ro=data["rotate"])
+    cmds.xform(node_name, os=True, s=data["scale"])
+    cmds.xform(node_name, os=True, t=data["translate"])
+
+
+def serialize_mesh_shape(mesh_name: str, compress: bool = True, single_precision: bool = False) -> str:
     """Serialize a mesh shape to a string"""
     meshes = cmds.ls(mesh_name, dag=True, type="mesh")
+    point_type = "f" if single_precision else "d"
 
     def _serialize_mesh(mesh_name: str) -> dict[str, object]:
-        # to store the mesh shape, we need to store the vertices, faces, normals, and uvs
-        # using OpenMaya to get the data
+        # every array is read in bulk through MFnMesh
         mesh = getAsMFnNode(mesh_name, om.MFnMesh)
-        vertices = mesh.getVertices()
+        polygon_counts, polygon_connects = mesh.getVertices()
         points = mesh.getPoints()
-        normals = mesh.getNormals()
-        uvs = mesh.getUVs()
-        poly_uvs = []
-        uv_idices = []
-
-        iter_poly = om.MItMeshPolygon(mesh.object())
-        while not iter_poly.isDone():
-            poly_uv = iter_poly.getUVs()
-            us = list(poly_uv[0])
-            vs = list(poly_uv[1])
-            poly_uvs.append((us, vs))
-            indices = []
-            for i in range(iter_poly.polygonVertexCount()):
-                indices.append(iter_poly.getUVIndex(i))
-            uv_idices.extend(indices)
-
-            iter_poly.next()
+        us, vs = mesh.getUVs()
+        uv_counts, uv_ids = mesh.getAssignedUVs()
 
         return {
-            "vertices": ([v for v in vertices[0]], [v for v in vertices[1]]),
-            "points": [(p[0], p[1], p[2]) for p in points],
-            "normals": [(p[0], p[1], p[2]) for p in normals],
-            "uvs": (list(uvs[0]), list(uvs[1])),
-            "polyUvs": poly_uvs,
-            "uvIndices": uv_idices,
+            "points": _pack_array([c for p in points for c in (p.x, p.y, p.z)], point_type, compress),
+            "polygonCounts": _pack_array(polygon_counts, "i", compress),
+            "polygonConnects": _pack_array(polygon_connects, "i", compress),
+            "us": _pack_array(us, "f", compress),
+            "vs": _pack_array(vs, "f", compress),
+            "uvCounts": _pack_array(uv_counts, "i", compress),
+            "uvIds": _pack_array(uv_ids, "i", compress),
         }
 
-    res = []
-    for mesh in meshes:
-        res.append(_serialize_mesh(mesh))
-
     serialized_data = {
-        "localRotatePivot": cmds.xform(mesh_name, q=True, os=True, rp=True),
-        "localScalePivot": cmds.xform(mesh_name, q=True, os=True, sp=True),
-        "rotate": cmds.xform(mesh_name, q=True, os=True, ro=True),
-        "scale": cmds.xform(mesh_name, q=True, os=True, s=True),
-        "translate": cmds.xform(mesh_name, q=True, os=True, t=True),
-        "meshes": res,
+        "format": GEOMETRY_FORMAT,
+        "version": GEOMETRY_FORMAT_VERSION,
+        "type": "mesh",
+        "meshes": [_serialize_mesh(mesh) for mesh in meshes],
     }
+    serialized_data.update(_get_local_transform_data(mesh_name))
+
+    return json.dumps(serialized_data, separators=(",", ":"))
+
+
+def _get_mesh_arrays(mesh: dict[str, object]) -> tuple[list[float], list[int], list[int], list[float], list[float], list[int], list[int]]:
+    """Return (points, counts, connects, us, vs, uv counts, uv ids) of current or legacy mesh data."""
+    if "polygonCounts" in mesh:
+        return (
+            list(_unpack_array(mesh["points"])),
+            list(_unpack_array(mesh["polygonCounts"])),
+            list(_unpack_array(mesh["polygonConnects"])),
+            list(_unpack_array(mesh["us"])),
+            list(_unpack_array(mesh["vs"])),
+            list(_unpack_array(mesh["uvCounts"])),
+            list(_unpack_array(mesh["uvIds"])),
+        )
 
-    return str(serialized_data)
-
-
-def deserialize_mesh_shape(mesh_name: str, serialized_data: str) -> str:
-    """Deserialize a NURBS surface from a string"""
+    vertices = mesh["vertices"]
+    uvs = mesh["uvs"]
+    return (
+        [c for p in mesh["points"] for c in p],
+        list(vertices[0]),
+        list(vertices[1]),
+        list(uvs[0]),
+        list(uvs[1]),
+        [len(uv[0]) for uv in mesh["polyUvs"]],
+        list(mesh["uvIndices"]),
+    )
 
-    if not isinstance(mesh_name, (str, unicode)):
-        raise TypeError("surface_name must be a string but got {0}".format(type(mesh_name)))
 
-    deserializedData = eval(serialized_data)
-    if deserializedData.get("controlVertices"):
-        return deserialize_nurbs_surface(mesh_name, serialized_data)
-
-    # Retrieve the necessary information from the deserialized data
-    localRotatePivot = deserializedData["localRotatePivot"]
-    localScalePivot = deserializedData["localScalePivot"]
-    rotate = deserializedData["rotate"]
-    scale = deserializedData["scale"]
-    translate = deserializedData["translate"]
-    meshes = deserializedData["meshes"]
+def _deserialize_mesh_data(mesh_name: str, deserializedData: dict[str, object]) -> str:
 
     # Create a new mesh
     container = cmds.createNode("transform", name=mesh_name)
     cmds.delete(container, constructionHistory=True)
-    cmds.xform(container, os=True, rp=localRotatePivot)
-    cmds.xform(container, os=True, sp=localScalePivot)
-    cmds.xform(container, os=True, ro=rotate)
-    cmds.xform(container, os=True, s=scale)
-    cmds.xform(container, os=True, t=translate)
+    _set_local_transform_data(container, deserializedData)
 
     fn_container = getAsMFnNode(container, om.MFnTransform)
 
-    for mesh in meshes:
+    for mesh in deserializedData["meshes"]:
 
         mesh_fn = om.MFnMesh()
-        vertices = mesh["vertices"]
-        points = mesh["points"]
-        normals = mesh["normals"]
-        uvs = mesh["uvs"]
-        poly_uvs = mesh["polyUvs"]
-        uv_indices = mesh["uvIndices"]
+        points, polygon_counts, polygon_connects, us, vs, uv_counts, uv_ids = _get_mesh_arrays(mesh)
 
         vertex_array = om.MFloatPointArray()
-        for p in points:
-            vertex_array.append(om.MFloatPoint(*p))
+        for i in range(0, len(points), 3):
+            vertex_array.append(om.MFloatPoint(points[i], points[i + 1], points[i + 2]))
 
         mesh_fn.create(
             vertex_array,
-            vertices[0],
-            vertices[1],
+            polygon_counts,
+            polygon_connects,
             parent=fn_container.object()
         )
 
-        mesh_fn.setUVs(uvs[0], uvs[1])
-        uv_counts = [len(uv[0]) for uv in poly_uvs]
-        mesh_fn.assignUVs(uv_counts, uv_indices)
+        mesh_fn.setUVs(us, vs)
+        mesh_fn.assignUVs(uv_counts, uv_ids)
 
     return container
 
 
-def serialize_nurbs_surface(surface_name: str) -> str:
+def deserialize_mesh_shape(mesh_name: str, serialized_data: str) -> str:
+    """Deserialize a mesh shape from a string"""
+
+    if not isinstance(mesh_name, (str, unicode)):
+        raise TypeError("surface_name must be a string but got {0}".format(type(mesh_name)))
+
+    deserializedData = _load_serialized_geometry(serialized_data)
+    if _is_serialized_nurbs_surface(deserializedData):
+        return _deserialize_nurbs_surface_data(mesh_name, deserializedData)
+
+    return _deserialize_mesh_data(mesh_name, deserializedData)
+
+
+def serialize_nurbs_surface(surface_name: str, compress: bool = True, single_precision: bool = False) -> str:
     """Serialize a NURBS surface to a string"""
 
     if not isinstance(surface_name, (str, unicode)):
@@ -1205,7 +1536,7 @@ def serialize_nurbs_surface(surface_name: str) -> str:
 
     for shape in cmds.listRelatives(surface_name, shapes=True, fullPath=True) or []:
         if cmds.objectType(shape) == "mesh":
-            return serialize_mesh_shape(surface_name)
+            return serialize_mesh_shape(surface_name, compress, single_precision)
 
     # if has make history, then freeze history
     if __has_make_nurbs_surface_hostory(surface_name):
@@ -1215,40 +1546,33 @@ def serialize_nurbs_surface(surface_name: str) -> str:
     else:
         temp_surface = None
 
-    # Get the control vertices of the NURBS surface
-    control_vertices_names = cmds.ls("{0}.cv[*][*]".format(surface_name), flatten=True)
-    control_vertices = {}
-
-    for path in control_vertices_names:
-        cv = path.split(".")[-1]
-        control_vertices[cv] = cmds.getAttr(path)[0]
-
-    # Get other relevant attributes
-    degreeU = cmds.getAttr("{0}.degreeU".format(surface_name))
-    degreeV = cmds.getAttr("{0}.degreeV".format(surface_name))
-    patchU = cmds.getAttr("{0}.spansU".format(surface_name))
-    patchV = cmds.getAttr("{0}.spansV".format(surface_name))
-    formU = cmds.getAttr("{0}.formU".format(surface_name))
-    formV = cmds.getAttr("{0}.formV".format(surface_name))
+    # Get the control vertices of the NURBS surface in one call, u-major
+    surface_fn = getAsMFnNode(surface_name, om.MFnNurbsSurface)
+    control_vertices = surface_fn.cvPositions(om.MSpace.kObject)
 
     # Create a dictionary to hold the serialized data
     serialized_data = {
-        "controlVertices": control_vertices,
-        "degreeU": degreeU,
-        "degreeV": degreeV,
-        "patchU": patchU,
-        "patchV": patchV,
-        "formU": formU,
-        "formV": formV,
-        "localRotatePivot": cmds.xform(surface_name, q=True, os=True, rp=True),
-        "localScalePivot": cmds.xform(surface_name, q=True, os=True, sp=True),
-        "rotate": cmds.xform(surface_name, q=True, os=True, ro=True),
-        "scale": cmds.xform(surface_name, q=True, os=True, s=True),
-        "translate": cmds.xform(surface_name, q=True, os=True, t=True)
+        "format": GEOMETRY_FORMAT,
+        "version": GEOMETRY_FORMAT_VERSION,
+        "type": "nurbsSurface",
+        "numCVsU": surface_fn.numCVsInU,
+        "numCVsV": surface_fn.numCVsInV,
+        "cvs": _pack_array(
+            [c for p in control_vertices for c in (p.x, p.y, p.z)],
+            "f" if single_precision else "d",
+            compress,
+        ),
+        "degreeU": cmds.getAttr("{0}.degreeU".format(surface_name)),
+        "degreeV": cmds.getAttr("{0}.degreeV".format(surface_name)),
+        "patchU": cmds.getAttr("{0}.spansU".format(surface_name)),
+        "patchV": cmds.getAttr("{0}.spansV".format(surface_name)),
+        "formU": cmds.getAttr("{0}.formU".format(surface_name)),
+        "formV": cmds.getAttr("{0}.formV".format(surface_name)),
     }
+    serialized_data.update(_get_local_transform_data(surface_name))
 
     # Convert the dictionary to a string
-    serialized_text = str(serialized_data)
+    serialized_text = json.dumps(serialized_data, separators=(",", ":"))
 
     if temp_surface:
         cmds.delete(temp_surface)
@@ -1256,29 +1580,50 @@ def serialize_nurbs_surface(surface_name: str) -> str:
     return serialized_text
 
 
-def deserialize_nurbs_surface(surface_name: str, serialized_data: str) -> str:
-    """Deserialize a NURBS surface from a string"""
+def _set_nurbs_surface_cvs(surface_name: str, deserializedData: dict[str, object]) -> None:
+    """Write the stored control vertices, in bulk when the CV grid matches."""
 
-    if not isinstance(surface_name, (str, unicode)):
-        raise TypeError("surface_name must be a string but got {0}".format(type(surface_name)))
+    if "cvs" not in deserializedData:
+        # legacy data keyed by "cv[u][v]"
+        for cv, pos in deserializedData["controlVertices"].items():
+            posX, posY, posZ = pos
+            cmds.setAttr("{0}.{1}".format(surface_name, cv), posX, posY, posZ, type="double3")
+        return
 
-    deserializedData = eval(serialized_data)
-    if deserializedData.get("meshes"):
-        return deserialize_mesh_shape(surface_name, serialized_data)
+    values = _unpack_array(deserializedData["cvs"])
+    num_u = deserializedData["numCVsU"]
+    num_v = deserializedData["numCVsV"]
+    surface_fn = getAsMFnNode(surface_name, om.MFnNurbsSurface)
+
+    if surface_fn.numCVsInU == num_u and surface_fn.numCVsInV == num_v:
+        points = om.MPointArray()
+        for i in range(0, len(values), 3):
+            points.append(om.MPoint(values[i], values[i + 1], values[i + 2]))
+        surface_fn.setCVPositions(points, om.MSpace.kObject)
+        surface_fn.updateSurface()
+        return
+
+    logger.warning(
+        "CV count mismatch on {0}: stored {1}x{2}, created {3}x{4}".format(
+            surface_name, num_u, num_v, surface_fn.numCVsInU, surface_fn.numCVsInV))
+    for u in range(min(num_u, surface_fn.numCVsInU)):
+        for v in range(min(num_v, surface_fn.numCVsInV)):
+            i = (u * num_v + v) * 3
+            cmds.setAttr(
+                "{0}.cv[{1}][{2}]".format(surface_name, u, v),
+                values[i], values[i + 1], values[i + 2],
+                type="double3")
+
+
+def _deserialize_nurbs_surface_data(surface_name: str, deserializedData: dict[str, object]) -> str:
 
     # Retrieve the necessary information from the deserialized data
-    control_vertices = deserializedData["controlVertices"]
     degreeU = deserializedData["degreeU"]
     degreeV = deserializedData["degreeV"]
     patchU = deserializedData["patchU"]
     patchV = deserializedData["patchV"]
     formU = deserializedData.get("formU", 0)
     formV = deserializedData.get("formV", 0)
-    localRotatePivot = deserializedData["localRotatePivot"]
-    localScalePivot = deserializedData["localScalePivot"]
-    rotate = deserializedData["rotate"]
-    scale = deserializedData["scale"]
-    translate = deserializedData["translate"]
 
     # Create a new NURBS surface
     if formU == 0 and formV == 2:  # Open, Periodic
@@ -1320,34 +1665,323 @@ def deserialize_nurbs_surface(surface_name: str, serialized_data: str) -> str:
             lengthRatio=0,
             constructionHistory=False)[0]  # type: ignore
 
-    cmds.xform(new_surface, os=True, rp=localRotatePivot)
-    cmds.xform(new_surface, os=True, sp=localScalePivot)
-    cmds.xform(new_surface, os=True, ro=rotate)
-    cmds.xform(new_surface, os=True, s=scale)
-    cmds.xform(new_surface, os=True, t=translate)
+    _set_local_transform_data(new_surface, deserializedData)
 
     cmds.setAttr("{0}.degreeU".format(new_surface), degreeU)
     cmds.setAttr("{0}.degreeV".format(new_surface), degreeV)
     # Set the control point positions
-    for cv, pos in control_vertices.items():
-        posX, posY, posZ = pos
-        cmds.setAttr("{0}.{1}".format(new_surface, cv), posX, posY, posZ, type="double3")
+    _set_nurbs_surface_cvs(new_surface, deserializedData)
 
     return new_surface
 
 
+def deserialize_nurbs_surface(surface_name: str, serialized_data: str) -> str:
+    """Deserialize a NURBS surface from a string"""
+
+    if not isinstance(surface_name, (str, unicode)):
+        raise TypeError("surface_name must be a string but got {0}".format(type(surface_name)))
+
+    deserializedData = _load_serialized_geometry(serialized_data)
+    if deserializedData.get("meshes"):
+        return _deserialize_mesh_data(surface_name, deserializedData)
+
+    return _deserialize_nurbs_surface_data(surface_name, deserializedData)
+
+
+# parsed surface templates keyed by absolute path, with the file mtime
+_SURFACE_TEMPLATE_CACHE = {}  # type: dict[str, tuple[float, dict[str, object]]]
+
+_MA_SURFACE_RE = re.compile(r'setAttr\s+"\.cc"\s+-type\s+"nurbsSurface"(?P<data>[^;]*);')
+_MA_TRANSFORM_RE = re.compile(r'setAttr\s+"\.(?P<attr>[trs])"\s+-type\s+"double3"(?P<data>[^;]*);')
+_MA_SHAPE_ATTR_RE = re.compile(r'setAttr\s+"\.(?P<attr>[A-Za-z]+)"\s+(?P<value>yes|no|-?[\d.][^\s;]*)\s*;')
+_MA_SURFACE_FORMS = {
+    0: om.MFnNurbsSurface.kOpen,
+    1: om.MFnNurbsSurface.kClosed,
+    2: om.MFnNurbsSurface.kPeriodic,
+}
+
+
+def _parse_ma_nurbs_surface(text: str) -> dict[str, object]:
+    """Parse the first nurbsSurface of a Maya ASCII scene.
+
+    The cached surface (".cc"), the parent transform values and the
+    single value shape attributes (".cpr", ".dvu", ".vir", ...) are read.
+    Array and flagged entries such as ".covm[0]" or ``-k off ".v"`` are
+    skipped, slider surface assets only hold their default values there.
+    """
+    found = _MA_SURFACE_RE.search(text)
+    if not found:
+        raise ValueError("No nurbsSurface data found")
+
+    tokens = found.group("data").split()
+    degree_u, degree_v, form_u, form_v = (int(x) for x in tokens[:4])
+    rational = tokens[4] == "yes"
+    pos = 5
+
+    num_knots_u = int(tokens[pos])
+    knots_u = [float(x) for x in tokens[pos + 1:pos + 1 + num_knots_u]]
+    pos += 1 + num_knots_u
+
+    num_knots_v = int(tokens[pos])
+    knots_v = [float(x) for x in tokens[pos + 1:pos + 1 + num_knots_v]]
+    pos += 1 + num_knots_v
+
+    num_cvs = int(tokens[pos])
+    stride = 4 if rational else 3
+    values = [float(x) for x in tokens[pos + 1:pos + 1 + num_cvs * stride]]
+    cvs = [tuple(values[i:i + stride]) for i in range(0, len(values), stride)]
+
+    # transform values come before the shape in the file
+    transform = {"t": (0.0, 0.0, 0.0), "r": (0.0, 0.0, 0.0), "s": (1.0, 1.0, 1.0)}
+    for m in _MA_TRANSFORM_RE.finditer(text, 0, found.start()):
+        transform[m.group("attr")] = tuple(float(x) for x in m.group("data").split())
+
+    # simple setAttr lines of the shape, up to the next node
+    shape_start = text.rfind("createNode nurbsSurface", 0, found.start())
+    shape_end = text.find("createNode ", found.end())
+    if shape_end < 0:
+        shape_end = len(text)
+    shape_attrs = {}
+    for m in _MA_SHAPE_ATTR_RE.finditer(text, max(shape_start, 0), shape_end):
+        value = m.group("value")
+        if value in ("yes", "no"):
+            shape_attrs[m.group("attr")] = value == "yes"
+        elif value.lstrip("-").isdigit():
+            shape_attrs[m.group("attr")] = int(value)
+        else:
+            shape_attrs[m.group("attr")] = float(value)
+
+    return {
+        "degreeU": degree_u,
+        "degreeV": degree_v,
+        "formU": form_u,
+        "formV": form_v,
+        "rational": rational,
+        "knotsU": knots_u,
+        "knotsV": knots_v,
+        "cvs": cvs,
+        "translate": transform["t"],
+        "rotate": transform["r"],
+        "scale": transform["s"],
+        "shapeAttrs": shape_attrs,
+    }
+
+
+def get_nurbs_surface_template(path: str) -> dict[str, object]:
+    """Get the surface description of a .ma asset, parsed once per session.
+
+    The file is parsed again only when its modification time changes.
+    """
+    path = os.path.abspath(path)
+    mtime = os.path.getmtime(path)
+
+    cached = _SURFACE_TEMPLATE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r") as f:
+        description = _parse_ma_nurbs_surface(f.read())
+
+    _SURFACE_TEMPLATE_CACHE[path] = (mtime, description)
+    return description
+
+
+def clear_nurbs_surface_template_cache() -> None:
+    """Drop every parsed surface template, see get_nurbs_surface_template."""
+    _SURFACE_TEMPLATE_CACHE.clear()
+
+
+def create_nurbs_surface_from_template(path: str, surface_name: str) -> str:
+    """Create a NURBS surface from a .ma asset without importing the file.
+
+    Args:
+        path: The .ma file, see get_nurbs_surface_template
+        surface_name: Name of the new transform
+
+    Returns:
+        The name of the new transform
+    """
+    description = get_nurbs_surface_template(path)
+
+    container = cmds.createNode("transform", name=surface_name)
+    cmds.setAttr("{0}.translate".format(container), *description["translate"])
+    cmds.setAttr("{0}.rotate".format(container), *description["rotate"])
+    cmds.setAttr("{0}.scale".format(container), *description["scale"])
+
+    points = om.MPointArray()
+    for cv in description["cvs"]:
+        points.append(om.MPoint(*cv))
+
+    surface_fn = om.MFnNurbsSurface()
+    shape = surface_fn.create(
+        points,
+        om.MDoubleArray(description["knotsU"]),
+        om.MDoubleArray(description["knotsV"]),
+        description["degreeU"],
+        description["degreeV"],
+        _MA_SURFACE_FORMS[description["formU"]],
+        _MA_SURFACE_FORMS[description["formV"]],
+        description["rational"],
+        parent=getAsMFnNode(container, om.MFnTransform).object(),
+    )
+    shape_name = om.MFnDependencyNode(shape).setName("{0}Shape".format(container.split("|")[-1]))
+    for attr, value in description["shapeAttrs"].items():
+        cmds.setAttr("{0}.{1}".format(shape_name, attr), value)
+    cmds.sets(shape_name, edit=True, forceElement="initialShadingGroup")
+
+    return container
+
+
+class GeometryCache(object):
+    """Memoized shape, dag path and function set lookups, see geometry_cache.
+
+    Entries are keyed by (kind, node name). hits / misses count the lookups
+    per kind.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], object] = {}
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+
+    def get(self, kind: str, key: str, factory: Callable[[], object]) -> object:
+        try:
+            value = self._entries[(kind, key)]
+
+        except KeyError:
+            self.misses[kind] = self.misses.get(kind, 0) + 1
+            value = self._entries[(kind, key)] = factory()
+            return value
+
+        self.hits[kind] = self.hits.get(kind, 0) + 1
+        return value
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop every entry of the node, or the whole cache if key is None."""
+
+        if key is None:
+            self._entries.clear()
+            return
+
+        for entry in [x for x in self._entries if x[1] == key]:
+            del self._entries[entry]
+
+    def report(self) -> str:
+
+        kinds = sorted(set(self.hits) | set(self.misses))
+        lines = ["{}: {} hits / {} misses".format(
+            kind, self.hits.get(kind, 0), self.misses.get(kind, 0)) for kind in kinds]
+
+        return "geometry cache, " + ", ".join(lines or ["no lookup"])
+
+
+_ACTIVE_GEOMETRY_CACHE: GeometryCache | None = None
+
+
+@contextlib.contextmanager
+def geometry_cache() -> Iterator[GeometryCache]:
+    """Memoize geometry lookups of the rivet and uv helpers within the scope.
+
+    Nested scopes share the outermost cache. Call invalidate_geometry_cache
+    after changing the shapes or the history of a node inside the scope.
+
+    Example:
+        with geometry_cache() as cache:
+            for target in targets:
+                create_rivet_pin(surface, cmds.xform(target, q=True, ws=True, t=True))
+        print(cache.report())
+    """
+
+    global _ACTIVE_GEOMETRY_CACHE
+    if _ACTIVE_GEOMETRY_CACHE is not None:
+        yield _ACTIVE_GEOMETRY_CACHE
+        return
+
+    cache = GeometryCache()
+    _ACTIVE_GEOMETRY_CACHE = cache
+    try:
+        yield cache
+
+    finally:
+        _ACTIVE_GEOMETRY_CACHE = None
+        if cache.hits or cache.misses:
+            logger.info(cache.report())
+
+
+def invalidate_geometry_cache(name: str | None = None) -> None:
+    """Drop the cached lookups of the node, or all of them if name is None."""
+
+    if _ACTIVE_GEOMETRY_CACHE is not None:
+        _ACTIVE_GEOMETRY_CACHE.invalidate(None if name is None else str(name))
+
+
+def _geometry_cached(kind: str, name: str, factory: Callable[[], object]) -> object:
+
+    if _ACTIVE_GEOMETRY_CACHE is None:
+        return factory()
+
+    return _ACTIVE_GEOMETRY_CACHE.get(kind, str(name), factory)
+
+
+def _get_geometry_dag_path(name: str) -> om.MDagPath:
+
+    def _resolve() -> om.MDagPath:
+        sel = om.MSelectionList()
+        sel.add(name)
+        return sel.getDagPath(0)
+
+    return _geometry_cached("dag_path", name, _resolve)
+
+
+def _get_geometry_shape(name: str) -> tuple[str, str]:
+    """Return the shape and its type, the first shape if name is a transform."""
+
+    def _resolve() -> tuple[str, str]:
+        obj_type = cmds.objectType(name)
+        if obj_type != "transform":
+            return name, obj_type
+
+        shapes = cmds.listRelatives(name, shapes=True, fullPath=True) or []
+        if not shapes:
+            raise TypeError("mesh_name must be a mesh or nurbsSurface but got {0}".format(obj_type))
+
+        return shapes[0], cmds.objectType(shapes[0])
+
+    return _geometry_cached("shape", name, _resolve)
+
+
+def _get_mfn_mesh(mesh_name: str) -> om.MFnMesh:
+
+    return _geometry_cached("mesh_fn", mesh_name, lambda: om.MFnMesh(_get_geometry_dag_path(mesh_name)))
+
+
+def _get_mfn_nurbs_surface(surface_name: str) -> om.MFnNurbsSurface:
+
+    return _geometry_cached(
+        "surface_fn", surface_name, lambda: om.MFnNurbsSurface(_get_geometry_dag_path(surface_name)))
+
+
+def get_mesh_intersector(mesh_name: str) -> om.MMeshIntersector:
+    """Return a MMeshIntersector of the mesh working in world space."""
+
+    def _create() -> om.MMeshIntersector:
+        path = om.MDagPath(_get_geometry_dag_path(mesh_name))
+        path.extendToShape()
+        intersector = om.MMeshIntersector()
+        intersector.create(path.node(), path.inclusiveMatrix())
+        return intersector
+
+    return _geometry_cached("mesh_intersector", mesh_name, _create)
+
+
 def create_rivet_pin(mesh_name: Text, position: Tuple[Text, Text, Text], name: Optional[Text] = None) -> Text:
     """Apply uvPin constrain to given world position"""
 
     pin = cmds.createNode("uvPin")
     orig, deformed = get_original_and_deformed_mesh(mesh_name)
-    obj_type = cmds.objectType(mesh_name)
-    if obj_type == "transform":
-        mesh_name = cmds.listRelatives(mesh_name, shapes=True, fullPath=True)[0]
+    mesh_name, obj_type = _get_geometry_shape(mesh_name)
 
     if orig and deformed:
-        obj_type = cmds.objectType(mesh_name)
-
         if obj_type == "mesh":
             orig_attr = "{}.outMesh".format(orig)
             deform_attr = "{}.outMesh".format(deformed)
@@ -1387,6 +2021,11 @@ def get_original_and_deformed_mesh(mesh_name: Text) -> Tuple[Text, Text]:
         tuple: The original and deformed mesh shape.
     """
 
+    return _geometry_cached("orig_shape", mesh_name, lambda: _find_original_and_deformed_mesh(mesh_name))
+
+
+def _find_original_and_deformed_mesh(mesh_name: Text) -> Tuple[Text, Text]:
+
     try:
         shapes = cmds.listRelatives(mesh_name, shapes=True, fullPath=True) or []
     except TypeError:
@@ -1416,14 +2055,7 @@ def get_original_and_deformed_mesh(mesh_name: Text) -> Tuple[Text, Text]:
 def get_uv_at_position(mesh_name: Text, position: Tuple[Text, Text, Text]) -> Tuple[Text, Text]:
     """Get uv at given world position"""
 
-    obj_type = cmds.objectType(mesh_name)
-    if obj_type == "transform":
-        try:
-            shape = cmds.listRelatives(mesh_name, shapes=True, fullPath=True)[0]
-        except IndexError:
-            raise TypeError("mesh_name must be a mesh or nurbsSurface but got {0}".format(obj_type))
-
-        obj_type = cmds.objectType(shape)
+    _, obj_type = _get_geometry_shape(mesh_name)
 
     if obj_type == "mesh":
         uv = get_uv_at_mesh_position(mesh_name, position)
@@ -1440,10 +2072,7 @@ def get_uv_at_position(mesh_name: Text, position: Tuple[Text, Text, Text]) -> Tu
 def get_uv_at_mesh_position(mesh_name: Text, position: Tuple[Text, Text, Text]) -> Tuple[Text, Text]:
     """Get uv at given world position"""
 
-    sel = om.MSelectionList()
-    sel.add(mesh_name)
-    mesh_dag = sel.getDagPath(0)
-    mfn_mesh = om.MFnMesh(mesh_dag)
+    mfn_mesh = _get_mfn_mesh(mesh_name)
     point = om.MPoint(position)
     uv = mfn_mesh.getUVAtPoint(point, space=om.MSpace.kWorld)
 
@@ -1453,14 +2082,19 @@ def get_uv_at_mesh_position(mesh_name: Text, position: Tuple[Text, Text, Text])
 def get_uv_at_nurbs_surface_position(surface_name: Text, position: Tuple[Text, Text, Text]) -> Tuple[Text, Text]:
     """Get uv at given world position"""
 
-    sel = om.MSelectionList()
-    sel.add(surface_name)
-    surface_dag = sel.getDagPath(0)
-    mfn_surface = om.MFnNurbsSurface(surface_dag)
+    mfn_surface = _get_mfn_nurbs_surface(surface_name)
 
     point = om.MPoint(position)
     closest_point, u, v = mfn_surface.closestPoint(point, space=om.MSpace.kWorld)
 
+    max_range_u, max_range_v = _geometry_cached(
+        "surface_range", surface_name, lambda: _get_nurbs_surface_uv_range(surface_name, mfn_surface))
+
+    return u / max_range_u, v / max_range_v
+
+
+def _get_nurbs_surface_uv_range(surface_name: Text, mfn_surface: om.MFnNurbsSurface) -> Tuple[float, float]:
+
     formU = cmds.getAttr("{0}.formU".format(surface_name))
     formV = cmds.getAttr("{0}.formV".format(surface_name))
     if formU == 0 and formV == 0:
@@ -1470,16 +2104,13 @@ def get_uv_at_nurbs_surface_position(surface_name: Text, position: Tuple[Text, T
         max_range_u = mfn_surface.numSpansInU
         max_range_v = mfn_surface.numSpansInV
 
-    return u / max_range_u, v / max_range_v
+    return max_range_u, max_range_v
 
 
 def apply_rivet_constrain_on_vertex(mesh: Text, vertex_id: int) -> Text:
     """Apply uvPin constrain to given world position"""
 
-    sel = om.MSelectionList()
-    sel.add(mesh)
-    mesh_dag = sel.getDagPath(0)
-    mfn_mesh = om.MFnMesh(mesh_dag)
+    mfn_mesh = _get_mfn_mesh(mesh)
     position = mfn_mesh.getPoint(vertex_id)
 
     return create_rivet_pin(mesh, position)
@@ -1495,17 +2126,18 @@ def apply_rivet_constrain_to_selected(mesh: Text, targets: List[Text]|Text) -> L
         mesh = mesh.name()
 
     pins = []
-    for target in targets:
-        if isinstance(target, nodetypes.Transform):
-            target = target.name()
+    with geometry_cache():
+        for target in targets:
+            if isinstance(target, nodetypes.Transform):
+                target = target.name()
 
-        if not cmds.objExists(target):
-            raise Exception("target({}) {} not found".format(type(target), target))
+            if not cmds.objExists(target):
+                raise Exception("target({}) {} not found".format(type(target), target))
 
-        pos = cmds.xform(target, q=True, ws=True, t=True)
-        pin = create_rivet_pin(mesh, pos)
-        pin = cmds.rename(pin, target + "_rivet")
-        pins.append(pin)
+            pos = cmds.xform(target, q=True, ws=True, t=True)
+            pin = create_rivet_pin(mesh, pos)
+            pin = cmds.rename(pin, target + "_rivet")
+            pins.append(pin)
 
     return pins
 
@@ -1519,7 +2151,7 @@ def apply_rivet_constrain_using_skin_weight(mesh: str, targets: list[str]|str) -
     if isinstance(mesh, nodetypes.Transform):
         mesh = mesh.name()
 
-    cns = []
+    names = []
     for target in targets:
         if isinstance(target, nodetypes.Transform):
             target = target.name()
@@ -1527,7 +2159,13 @@ def apply_rivet_constrain_using_skin_weight(mesh: str, targets: list[str]|str) -
         if not cmds.objExists(target):
             raise Exception("target({}) {} not found".format(type(target), target))
 
-        weights = __get_skin_weights(mesh, target)
+        names.append(target)
+
+    positions = [cmds.xform(target, q=True, ws=True, t=True) for target in names]
+    weights_list = __get_skin_weights_of_positions(mesh, positions)
+
+    res = []
+    for target, weights in zip(names, weights_list):
         if not weights:
             continue
 
@@ -1537,15 +2175,13 @@ def apply_rivet_constrain_using_skin_weight(mesh: str, targets: list[str]|str) -
         for i, parent in enumerate(parents):
             short = parent.split("|")[-1].split(":")[-1].split("|")[0]
             cmds.setAttr("{0}.{1}W{2}".format(cns[0], short, i), weights[parent])
-        cns.append(cns[0])
+        res.append(cns[0])
 
-    return cns
+    return res
 
 
 def __get_skin_weights(mesh_name: str, cns_name: str) -> Dict[str, float]:
 
-    # find closest vertex
-    mesh_path = om.MGlobal.getSelectionListByName(mesh_name).getDagPath(0)
     pos = cmds.xform(cns_name, q=True, ws=True, t=True)
 
     return __get_skin_weights_of_position(mesh_name, pos)
@@ -1553,22 +2189,41 @@ def __get_skin_weights(mesh_name: str, cns_name: str) -> Dict[str, float]:
 
 def __get_skin_weights_of_position(mesh_name: str, position: str) -> dict[str, float]:
 
-    # find closest vertex
+    return __get_skin_weights_of_positions(mesh_name, [position])[0]
+
+
+def __get_skin_weights_of_positions(mesh_name: str, positions: Sequence[Sequence[float]]) -> list[dict[str, float]]:
+    """Return the skin weights of the closest vertex for each position.
+
+    The weights of all the closest vertices are fetched with a single
+    getWeights call and the influence names are resolved once.
+    """
+
+    # find closest vertices
     mesh_path = om.MGlobal.getSelectionListByName(mesh_name).getDagPath(0)
-    point = om.MPoint(position)
+    index = get_mesh_point_index(mesh_path)
+    vertices = [index.nearest(om.MPoint(position))[0] for position in positions]
 
-    vertex, distance = get_nearest_vertex_on_point(mesh_path, point)
+    unique_vertices = sorted(set(vertices))
     comp = om.MFnSingleIndexedComponent().create(om.MFn.kMeshVertComponent)
+    om.MFnSingleIndexedComponent(comp).addElements(unique_vertices)
 
     # get weights
     skin_cluster = cmds.listConnections(mesh_name + ".inMesh", type="skinCluster")[0]
     sel = om.MGlobal.getSelectionListByName(skin_cluster).getDependNode(0)
     skin_fn = oma.MFnSkinCluster(sel)
     weights, count = skin_fn.getWeights(mesh_path, comp)
+    influences = [x.partialPathName() for x in skin_fn.influenceObjects()]
+
+    rows = {}
+    for row, vertex in enumerate(unique_vertices):
+        res = {}
+        for i, w in enumerate(weights[row * count:(row + 1) * count]):
+            if w > 0:
+                res[influences[i]] = w
+        rows[vertex] = res
 
-    w = weights[vertex * count:(vertex + 1) * count]
-    influences = get_influences(skin_fn, w)
-    return influences
+    return [dict(rows[vertex]) for vertex in vertices]
 
 
 def get_influences(skin_fn: oma.MFnSkinCluster, weights: list[float]) -> dict[str, float]:
@@ -1582,7 +2237,180 @@ def get_influences(skin_fn: oma.MFnSkinCluster, weights: list[float]) -> dict[st
     return res
 
 
-def get_nearest_vertex_on_point(mesh_fn: om.MFnMesh, pos1: om.MPoint) -> tuple[int, float]:
+class MeshPointIndex(object):
+    """KD-tree over world space vertex positions for nearest vertex queries.
+
+    Built from a single MFnMesh.getPoints call, each query then visits
+    O(log n) vertices instead of iterating the whole mesh.
+    """
+
+    leaf_size = 8
+
+    def __init__(self, points: Sequence[Sequence[float]]) -> None:
+        self.points = [(p[0], p[1], p[2]) for p in points]
+
+        # (axis, split, left, right, indices), leaves have indices only
+        self._nodes = []
+        if self.points:
+            self._build(list(range(len(self.points))))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _build(self, indices: list[int]) -> int:
+
+        node_id = len(self._nodes)
+        if len(indices) <= self.leaf_size:
+            self._nodes.append((-1, 0.0, -1, -1, indices))
+            return node_id
+
+        # split along the axis with the largest spread
+        spreads = []
+        for axis in range(3):
+            values = [self.points[i][axis] for i in indices]
+            spreads.append(max(values) - min(values))
+        axis = spreads.index(max(spreads))
+        if spreads[axis] == 0.0:
+            self._nodes.append((-1, 0.0, -1, -1, indices))
+            return node_id
+
+        indices.sort(key=lambda i: self.points[i][axis])
+        mid = len(indices) // 2
+        split = self.points[indices[mid]][axis]
+
+        self._nodes.append(None)
+        left = self._build(indices[:mid])
+        right = self._build(indices[mid:])
+        self._nodes[node_id] = (axis, split, left, right, None)
+
+        return node_id
+
+    def nearest(self, point: om.MPoint | Sequence[float]) -> tuple[int, float]:
+        """Return the closest vertex index and its distance to the point.
+
+        Ties are resolved to the lowest vertex index, the same as
+        get_nearest_vertex_on_point_exhaustive.
+        """
+
+        if not self._nodes:
+            om.MGlobal.displayError("Vertex not found")
+            raise ValueError("Vertex not found")
+
+        p = (point[0], point[1], point[2])
+        points = self.points
+        best_index = -1
+        best_distance = float("inf")
+
+        stack = [(0, 0.0)]
+        while stack:
+            node_id, bound = stack.pop()
+            if bound > best_distance:
+                continue
+
+            axis, split, left, right, indices = self._nodes[node_id]
+            if indices is not None:
+                for i in indices:
+                    q = points[i]
+                    d = ((q[0] - p[0]) ** 2
+                         + (q[1] - p[1]) ** 2
+                         + (q[2] - p[2]) ** 2)
+                    if d < best_distance or (d == best_distance and i < best_index):
+                        best_distance = d
+                        best_index = i
+                continue
+
+            diff = p[axis] - split
+            if diff < 0.0:
+                near, far = left, right
+            else:
+                near, far = right, left
+
+            # visit the near side first, the far side only when the
+            # splitting plane is closer than the best match so far
+            stack.append((far, max(bound, diff * diff)))
+            stack.append((near, bound))
+
+        return best_index, math.sqrt(best_distance)
+
+
+# mesh full path -> (dirty key, MeshPointIndex)
+_MESH_POINT_INDEX_CACHE: dict[str, tuple[tuple, MeshPointIndex]] = {}
+
+
+def _get_mesh_dag_path(mesh: str | om.MDagPath | om.MFnMesh) -> om.MDagPath:
+
+    if isinstance(mesh, om.MFnMesh):
+        path = mesh.getPath()
+    elif isinstance(mesh, om.MDagPath):
+        path = om.MDagPath(mesh)
+    else:
+        path = om.MGlobal.getSelectionListByName(str(mesh)).getDagPath(0)
+
+    if not path.hasFn(om.MFn.kMesh):
+        raise TypeError("{} is not a mesh".format(path.fullPathName()))
+    path.extendToShape()
+
+    return path
+
+
+def _get_mesh_point_index_key(path: om.MDagPath) -> tuple:
+    """Cheap dirty check, changes with topology, deformation or transform."""
+
+    mesh_fn = om.MFnMesh(path)
+    bbox = mesh_fn.boundingBox
+
+    return (mesh_fn.numVertices,
+            mesh_fn.numPolygons,
+            tuple(bbox.min),
+            tuple(bbox.max),
+            tuple(path.inclusiveMatrix()))
+
+
+def get_mesh_point_index(mesh: str | om.MDagPath | om.MFnMesh) -> MeshPointIndex:
+    """Return the cached spatial index of the mesh world space vertices.
+
+    The index is rebuilt when the vertex / face count, the local bounding
+    box or the world matrix of the mesh changed since it was built.
+
+    Args:
+        mesh (str | om.MDagPath | om.MFnMesh): The mesh or its transform
+
+    Returns:
+        MeshPointIndex: The spatial index
+    """
+
+    path = _get_mesh_dag_path(mesh)
+    name = path.fullPathName()
+    key = _get_mesh_point_index_key(path)
+
+    cached = _MESH_POINT_INDEX_CACHE.get(name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    points = om.MFnMesh(path).getPoints(om.MSpace.kWorld)
+    index = MeshPointIndex(points)
+    _MESH_POINT_INDEX_CACHE[name] = (key, index)
+
+    return index
+
+
+def clear_mesh_point_index_cache(mesh: str | om.MDagPath | om.MFnMesh | None = None) -> None:
+    """Drop the cached spatial index of the mesh, or of every mesh if None."""
+
+    if mesh is None:
+        _MESH_POINT_INDEX_CACHE.clear()
+        return
+
+    _MESH_POINT_INDEX_CACHE.pop(_get_mesh_dag_path(mesh).fullPathName(), None)
+
+
+def get_nearest_vertex_on_point(mesh_fn: om.MFnMesh | om.MDagPath | str, pos1: om.MPoint) -> tuple[int, float]:
+
+    return get_mesh_point_index(mesh_fn).nearest(pos1)
+
+
+def get_nearest_vertex_on_point_exhaustive(mesh_fn: om.MFnMesh, pos1: om.MPoint) -> tuple[int, float]:
+    """Reference implementation iterating every vertex of the mesh."""
 
     it_vertex = om.MItMeshVertex(mesh_fn)
 
@@ -1927,3 +2755,42 @@ _SPACE = {
     "pre":       om.MSpace.kPreTransform,
     "post":      om.MSpace.kPostTransform,
 }
+
+
+def benchmark_playback(start: float = None, end: float = None, repeat: int = 3) -> float:
+    """Measure the average evaluation time per frame of the current scene.
+
+    Steps the current time over the playback range without drawing, the
+    best of the repeats is returned in milliseconds per frame.
+
+    Args:
+        start (float, optional): First frame, the playback start if None
+        end (float, optional): Last frame, the playback end if None
+        repeat (int, optional): Number of passes over the range
+
+    Returns:
+        float: Milliseconds per frame
+    """
+    if start is None:
+        start = cmds.playbackOptions(q=True, minTime=True)
+    if end is None:
+        end = cmds.playbackOptions(q=True, maxTime=True)
+
+    frames = int(end - start) + 1
+    current = cmds.currentTime(q=True)
+    best = float("inf")
+    cmds.refresh(suspend=True)
+    try:
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            for i in range(frames):
+                cmds.currentTime(start + i, update=True)
+            best = min(best, (time.perf_counter() - begin) / frames)
+
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.currentTime(current)
+
+    ms = best * 1000.0
+    logger.info("%d frames, %.3f ms per frame, %.1f fps", frames, ms, 1000.0 / ms if ms else float("inf"))
+    return ms
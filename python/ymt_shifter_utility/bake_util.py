@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""Bake world space animation onto transforms without moving the timeline.
+
+Matrices are evaluated through a DG context and keys are written per
+channel, see computeLocalTransforms and keyTransforms.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+
+from ymt_shifter_utility.type_protocols import DagNodeLike
+
+
+# (attribute, anim curve type) baked for each destination node
+BAKE_CHANNELS = (
+    ("translateX", oma.MFnAnimCurve.kAnimCurveTL),
+    ("translateY", oma.MFnAnimCurve.kAnimCurveTL),
+    ("translateZ", oma.MFnAnimCurve.kAnimCurveTL),
+    ("rotateX", oma.MFnAnimCurve.kAnimCurveTA),
+    ("rotateY", oma.MFnAnimCurve.kAnimCurveTA),
+    ("rotateZ", oma.MFnAnimCurve.kAnimCurveTA),
+    ("scaleX", oma.MFnAnimCurve.kAnimCurveTU),
+    ("scaleY", oma.MFnAnimCurve.kAnimCurveTU),
+    ("scaleZ", oma.MFnAnimCurve.kAnimCurveTU),
+)
+
+
+def _getDagPath(node: DagNodeLike) -> om.MDagPath:
+    sel = om.MSelectionList()
+    sel.add(node.name())
+    return sel.getDagPath(0)
+
+
+def _getInstancedPlug(path: om.MDagPath, attr: str) -> om.MPlug:
+    plug = om.MFnDependencyNode(path.node()).findPlug(attr, False)
+    return plug.elementByLogicalIndex(path.instanceNumber())
+
+
+def evaluateMatrixPlugs(plugs: list[om.MPlug], frames: list[float]) -> list[list[om.MMatrix]]:
+    """Evaluate matrix plugs at each frame through a DG context.
+
+    The current time is never changed, so nothing else in the scene is
+    evaluated and no viewport refresh is triggered.
+
+    Args:
+        plugs (list[om.MPlug]): Matrix plugs to evaluate
+        frames (list[float]): Frames in the current ui time unit
+
+    Returns:
+        list[list[om.MMatrix]]: matrices[frame index][plug index]
+    """
+
+    unit = om.MTime.uiUnit()
+    res = []
+    for frame in frames:
+        context = om.MDGContext(om.MTime(frame, unit))
+        previous = context.makeCurrent()
+        try:
+            res.append([om.MFnMatrixData(p.asMObject()).matrix() for p in plugs])
+        finally:
+            previous.makeCurrent()
+
+    return res
+
+
+def getWorldMatricesAtFrames(nodes: list[DagNodeLike], frames: list[float]) -> list[list[om.MMatrix]]:
+    """returns world matrices List[frame][node] evaluated in DG context."""
+
+    plugs = [_getInstancedPlug(_getDagPath(n), "worldMatrix") for n in nodes]
+    return evaluateMatrixPlugs(plugs, frames)
+
+
+def _getEulerQuaternion(depNode: om.MFnDependencyNode, attr: str) -> om.MQuaternion:
+    """Quaternion of an xyz ordered angle attribute such as rotateAxis."""
+    values = [depNode.findPlug(attr + axis, False).asMAngle().asRadians() for axis in "XYZ"]
+    return om.MEulerRotation(values[0], values[1], values[2]).asQuaternion()
+
+
+def _getDoubles(plugs: list[om.MPlug], frames: list[float]) -> list[list[float]]:
+    """Evaluate double plugs at each frame through a DG context."""
+
+    unit = om.MTime.uiUnit()
+    res = []
+    for frame in frames:
+        context = om.MDGContext(om.MTime(frame, unit))
+        previous = context.makeCurrent()
+        try:
+            res.append([p.asDouble() for p in plugs])
+        finally:
+            previous.makeCurrent()
+
+    return res
+
+
+def computeLocalTransforms(nodes: list[DagNodeLike], frames: list[float], worldMatrices: list[list[om.MMatrix]]) -> list[dict[str, list[float]]]:
+    """Compute the local channel values giving nodes the world matrices.
+
+    Nodes may be parented under each other (e.g. a fk chain), the parent
+    matrix of a node below another baked node is rebuilt from the new
+    world matrix of that ancestor instead of its current animation.
+
+    The channels are solved against the whole transform stack, same as
+    xform: offsetParentMatrix and the inverse parent scale of joints are
+    evaluated per frame, rotateAxis, jointOrient and the scale and rotate
+    pivots are read once at the current time.
+
+    Args:
+        nodes (list[DagNodeLike]): Destination nodes
+        frames (list[float]): Frames to evaluate the parent matrices at
+        worldMatrices (list[list[om.MMatrix]]): target matrices[frame][node]
+
+    Returns:
+        list[dict[str, list[float]]]: per node, attribute name to values
+            in internal units, one value per frame
+    """
+
+    paths = [_getDagPath(n) for n in nodes]
+    fullNames = [p.fullPathName() for p in paths]
+    depNodes = [om.MFnDependencyNode(p.node()) for p in paths]
+
+    # nearest baked ancestor of each node, None when not under another one
+    ancestors = []
+    for path in paths:
+        ancestor = None
+        parent = om.MDagPath(path)
+        while parent.length() > 1:
+            parent.pop()
+            if parent.fullPathName() in fullNames:
+                ancestor = fullNames.index(parent.fullPathName())
+                break
+        ancestors.append(ancestor)
+
+    count = len(nodes)
+    plugs = [_getInstancedPlug(p, "parentMatrix") for p in paths]
+    plugs.extend([_getInstancedPlug(p, "worldMatrix") for p in paths])
+
+    # offsetParentMatrix sits between the parent matrix and the local matrix
+    offsetIndices = {}
+    for j, depNode in enumerate(depNodes):
+        if depNode.hasAttribute("offsetParentMatrix"):
+            offsetIndices[j] = len(plugs)
+            plugs.append(depNode.findPlug("offsetParentMatrix", False))
+    evaluated = evaluateMatrixPlugs(plugs, frames)
+
+    # joints with segment scale compensate undo the scale of their parent
+    scalePlugs = []
+    scaleIndices = {}
+    for j, (path, depNode) in enumerate(zip(paths, depNodes)):
+        if (path.hasFn(om.MFn.kJoint)
+                and depNode.findPlug("segmentScaleCompensate", False).asBool()):
+            scaleIndices[j] = len(scalePlugs)
+            scalePlugs.extend(depNode.findPlug("inverseScale" + axis, False) for axis in "XYZ")
+    inverseScales = _getDoubles(scalePlugs, frames) if scalePlugs else []
+
+    rotateOrders = [
+        depNode.findPlug("rotateOrder", False).asInt() for depNode in depNodes]
+
+    # local rotation = rotateAxis * rotate * jointOrient
+    rotateAxes = [_getEulerQuaternion(d, "rotateAxis").inverse() for d in depNodes]
+    jointOrients = [
+        _getEulerQuaternion(d, "jointOrient").inverse()
+        if p.hasFn(om.MFn.kJoint) else om.MQuaternion()
+        for p, d in zip(paths, depNodes)]
+
+    # current transformation carrying the pivots, None for joints whose
+    # translate is the translation of the local matrix
+    pivotTransforms = [
+        None if p.hasFn(om.MFn.kJoint)
+        else om.MFnTransform(p).transformation()
+        for p in paths]
+
+    res = [{attr: [] for attr, _ in BAKE_CHANNELS} for _ in nodes]
+    previousRotations = [None] * count
+    for i, matrices in enumerate(evaluated):
+        parentMatrices = matrices[:count]
+        currentWorlds = matrices[count:count * 2]
+
+        for j in range(count):
+            parentMatrix = parentMatrices[j]
+            a = ancestors[j]
+            if a is not None:
+                parentMatrix = (parentMatrix
+                                * currentWorlds[a].inverse()
+                                * worldMatrices[i][a])
+            if j in offsetIndices:
+                parentMatrix = matrices[offsetIndices[j]] * parentMatrix
+
+            local = worldMatrices[i][j] * parentMatrix.inverse()
+            translation = om.MVector(local.getElement(3, 0),
+                                     local.getElement(3, 1),
+                                     local.getElement(3, 2))
+
+            # the pivots only move the translation, the linear part is
+            # scale * shear * rotateAxis * rotate * jointOrient * inverseScale
+            linear = om.MMatrix(local)
+            for k in range(3):
+                linear.setElement(3, k, 0.0)
+            if j in scaleIndices:
+                offset = scaleIndices[j]
+                parentScale = om.MMatrix()
+                for k in range(3):
+                    parentScale.setElement(k, k, inverseScales[i][offset + k])
+                linear = linear * parentScale
+
+            decomposed = om.MTransformationMatrix(linear)
+            sc = decomposed.scale(om.MSpace.kTransform)
+            shear = decomposed.shear(om.MSpace.kTransform)
+            quat = rotateAxes[j] * decomposed.rotation(True) * jointOrients[j]
+
+            rot = quat.asEulerRotation().reorder(rotateOrders[j])
+            if previousRotations[j] is not None:
+                rot = rot.closestSolution(previousRotations[j])
+            previousRotations[j] = rot
+
+            if pivotTransforms[j] is not None:
+                pivoted = om.MTransformationMatrix(pivotTransforms[j])
+                pivoted.setScale(sc, om.MSpace.kTransform)
+                pivoted.setShear(shear, om.MSpace.kTransform)
+                pivoted.setRotation(rot)
+                pivoted.setTranslation(om.MVector(), om.MSpace.kTransform)
+                pivotOffset = pivoted.asMatrix()
+                translation -= om.MVector(pivotOffset.getElement(3, 0),
+                                          pivotOffset.getElement(3, 1),
+                                          pivotOffset.getElement(3, 2))
+
+            t = translation
+            values = (t.x, t.y, t.z, rot.x, rot.y, rot.z, sc[0], sc[1], sc[2])
+            for (attr, _), v in zip(BAKE_CHANNELS, values):
+                res[j][attr].append(v)
+
+    return res
+
+
+def keyChannel(plugName: str, curveType: int, frames: list[float], values: list[float]) -> None:
+    """Key all values on the attribute at once.
+
+    The keys are added to a temporary anim curve with MFnAnimCurve.addKeys
+    and merged onto the attribute with copyKey / pasteKey, so that the
+    result is still recorded in the undo queue. This overwrites the
+    keyframe clipboard.
+
+    Args:
+        plugName (str): "node.attribute" to key
+        curveType (int): oma.MFnAnimCurve.kAnimCurveTL, TA or TU
+        frames (list[float]): Frames in the current ui time unit
+        values (list[float]): Values in internal units
+    """
+
+    if not frames:
+        return
+
+    unit = om.MTime.uiUnit()
+    times = om.MTimeArray([om.MTime(x, unit) for x in frames])
+
+    fn = oma.MFnAnimCurve()
+    curve = fn.create(curveType)
+    try:
+        fn.addKeys(times, om.MDoubleArray(values))
+        cmds.copyKey(om.MFnDependencyNode(curve).name())
+        cmds.pasteKey(plugName, option="merge", time=(frames[0], frames[0]))
+
+    finally:
+        modifier = om.MDGModifier()
+        modifier.deleteNode(curve)
+        modifier.doIt()
+
+
+def keyTransforms(nodes: list[DagNodeLike], frames: list[float], transforms: list[dict[str, list[float]]], attrs: Sequence[str] | None = None) -> None:
+    """Key the values returned by computeLocalTransforms, skips locked channels.
+
+    attrs restricts the keyed channels to the given attribute names.
+    """
+
+    for node, values in zip(nodes, transforms):
+        depNode = om.MFnDependencyNode(_getDagPath(node).node())
+        for attr, curveType in BAKE_CHANNELS:
+            if attrs is not None and attr not in attrs:
+                continue
+            if depNode.findPlug(attr, False).isLocked:
+                continue
+
+            keyChannel("{}.{}".format(node.name(), attr),
+                       curveType,
+                       frames,
+                       values[attr])
@@ -18,6 +18,15 @@ This module provides two high‑level helpers:
   Re‑creates the animation curves in the *current* scene and reconnects
   them, optionally remapping namespaces / node names.
 
+Reading goes through OpenMayaAnim by default; pass ``bulk=False`` to use
+the per‑key ``cmds`` path instead.  Importing defaults to the per‑key
+``cmds`` path, which is recorded in the undo queue; pass ``bulk=True`` to
+create the curves through OpenMayaAnim, which is faster but cannot be
+undone.
+
+The dump can also be stored in a compact columnar layout
+(``to_columnar`` / ``from_columnar``), as JSON or as a NumPy ``.npz``.
+
 Motivation
 ~~~~~~~~~~
 While Maya allows you to copy/paste driven‑keys between scenes via the
@@ -35,6 +44,13 @@ from collections.abc import Iterator
 from typing import Any, Optional, Sequence, Union
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # -------------------------------------------------------------
 # Internal helpers
@@ -53,6 +69,43 @@ _ANIM_TYPES = {
 
 _FLOAT_ATTR_RE = re.compile(r"^[^\.]+\.[^\.]+$")  # quick sanity check
 
+# curve types handled by the OpenMayaAnim path, others go through cmds
+_API_CURVE_TYPES = {
+    "animCurveUU": oma.MFnAnimCurve.kAnimCurveUU,
+    "animCurveUA": oma.MFnAnimCurve.kAnimCurveUA,
+    "animCurveUL": oma.MFnAnimCurve.kAnimCurveUL,
+    "animCurveTL": oma.MFnAnimCurve.kAnimCurveTL,
+    "animCurveTU": oma.MFnAnimCurve.kAnimCurveTU,
+    "animCurveTA": oma.MFnAnimCurve.kAnimCurveTA,
+}
+
+# keyTangent names <-> MFnAnimCurve tangent types
+_TANGENT_TYPES = {
+    name: getattr(oma.MFnAnimCurve, attr)
+    for name, attr in (
+        ("global", "kTangentGlobal"),
+        ("fixed", "kTangentFixed"),
+        ("linear", "kTangentLinear"),
+        ("flat", "kTangentFlat"),
+        ("spline", "kTangentSmooth"),
+        ("step", "kTangentStep"),
+        ("slow", "kTangentSlow"),
+        ("fast", "kTangentFast"),
+        ("clamped", "kTangentClamped"),
+        ("plateau", "kTangentPlateau"),
+        ("stepnext", "kTangentStepNext"),
+        ("auto", "kTangentAuto"),
+        ("automix", "kTangentAutoMix"),
+        ("autoease", "kTangentAutoEase"),
+        ("autocustom", "kTangentAutoCustom"),
+    )
+    if hasattr(oma.MFnAnimCurve, attr)
+}
+_TANGENT_NAMES = {v: k for k, v in _TANGENT_TYPES.items()}
+
+COLUMNAR_FORMAT = "driven_keys_columnar"
+COLUMNAR_VERSION = 1
+
 
 def _iter_anim_curves(driven_node: str) -> Iterator[tuple[str, str]]:
     """Yield (driven_plug, animCurve) pairs for every driven attr on *driven_node*."""
@@ -113,6 +166,184 @@ def _anim_curve_data(anim: str) -> dict[str, Any]:
     }
 
 
+def _find_plug(plug_name: str) -> Optional[om.MPlug]:
+    sel = om.MSelectionList()
+    try:
+        sel.add(plug_name)
+    except RuntimeError:
+        return None
+    return sel.getPlug(0)
+
+
+def _get_mobject(node: str) -> om.MObject:
+    return om.MSelectionList().add(node).getDependNode(0)
+
+
+def _value_to_ui(node_type: str, value: float) -> float:
+    """Internal unit curve value to the unit ``cmds.keyframe`` returns."""
+    if node_type in ("animCurveUA", "animCurveTA"):
+        return om.MAngle(value).asUnits(om.MAngle.uiUnit())
+    if node_type in ("animCurveUL", "animCurveTL"):
+        return om.MDistance(value).asUnits(om.MDistance.uiUnit())
+    return value
+
+
+def _value_from_ui(node_type: str, value: float) -> float:
+    if node_type in ("animCurveUA", "animCurveTA"):
+        return om.MAngle(value, om.MAngle.uiUnit()).asRadians()
+    if node_type in ("animCurveUL", "animCurveTL"):
+        return om.MDistance(value, om.MDistance.uiUnit()).asCentimeters()
+    return value
+
+
+def _iter_anim_curves_api(driven_node: str) -> Iterator[tuple[str, str]]:
+    """Same pairs as :func:`_iter_anim_curves`, from a single connection query."""
+    sources: dict[str, list[str]] = defaultdict(list)
+    node_fn = om.MFnDependencyNode(_get_mobject(driven_node))
+    for plug in node_fn.getConnections():
+        if not plug.isDestination:
+            continue
+        src = plug.source()
+        if src.isNull or not src.node().hasFn(om.MFn.kAnimCurve):
+            continue
+        attr = plug.partialName(useLongNames=True)
+        sources[attr].append(om.MFnDependencyNode(src.node()).name())
+
+    for attr in cmds.listAttr(driven_node, k=True, s=True) or []:
+        for anim in sources.get(attr, []):
+            if cmds.nodeType(anim) not in _ANIM_TYPES:
+                continue  # ignore non‑key driven connections
+            yield f"{driven_node}.{attr}", anim
+
+
+def _anim_curve_data_api(anim: str) -> dict[str, Any]:
+    """Same dump as :func:`_anim_curve_data`, read through MFnAnimCurve."""
+    obj = _get_mobject(anim)
+    node_type = om.MFnDependencyNode(obj).typeName
+    if node_type not in _API_CURVE_TYPES:
+        return _anim_curve_data(anim)
+
+    fn = oma.MFnAnimCurve(obj)
+    key_count = fn.numKeys
+    if not key_count:
+        cmds.warning(f"AnimCurve '{anim}' has no keys.")
+        return {}
+
+    unitless = fn.isUnitlessInput
+    time_unit = om.MTime.uiUnit()
+    keys = [
+        {
+            "input": fn.unitlessInput(i) if unitless else fn.input(i).asUnits(time_unit),
+            "output": _value_to_ui(node_type, fn.value(i)),
+            "inTan": _TANGENT_NAMES.get(fn.inTangentType(i), "auto"),
+            "outTan": _TANGENT_NAMES.get(fn.outTangentType(i), "auto"),
+        }
+        for i in range(key_count)
+    ]
+
+    src = fn.findPlug("input", False).source()
+    driver = "" if src.isNull else src.partialName(includeNodeName=True, useLongNames=True)
+
+    return {
+        "nodeType": node_type,
+        "name": anim,
+        "driver": driver,
+        "keys": keys,
+        "preInfinity": fn.preInfinityType,
+        "postInfinity": fn.postInfinityType,
+        "weightedTangents": fn.isWeighted,
+    }
+
+
+def _import_curve_cmds(curve: dict[str, Any], driver: str, target: str) -> str:
+    """Create one driven‑key curve with ``cmds.setDrivenKeyframe``."""
+    # Build keys via Maya’s native driven‑key command
+    for k in curve["keys"]:
+        cmds.setDrivenKeyframe(
+            target,
+            cd=driver,
+            dv=k["input"],
+            v=k["output"],
+            itt=k["inTan"],
+            ott=k["outTan"],
+        )
+
+    # Fetch the freshly created animCurve and set infinity / weighting
+    anim = cmds.listConnections(target, s=True, d=False, t="animCurve")[-1]
+    cmds.setAttr(f"{anim}.preInfinity", curve["preInfinity"])
+    cmds.setAttr(f"{anim}.postInfinity", curve["postInfinity"])
+    try:
+        cmds.setAttr(f"{anim}.weightedTangents", curve["weightedTangents"])
+    except RuntimeError:
+        # weightedTangents is not available on all curve types
+        pass
+
+    return anim
+
+
+def _create_curve_api(curve: dict[str, Any], target: str) -> om.MObject:
+    """Create an unconnected anim curve holding the keys of *curve*."""
+    node_type = curve["nodeType"]
+    fn = oma.MFnAnimCurve()
+    obj = fn.create(_API_CURVE_TYPES[node_type])
+
+    keys = curve["keys"]
+    in_types = [_TANGENT_TYPES.get(k["inTan"], oma.MFnAnimCurve.kTangentGlobal) for k in keys]
+    out_types = [_TANGENT_TYPES.get(k["outTan"], oma.MFnAnimCurve.kTangentGlobal) for k in keys]
+    values = [_value_from_ui(node_type, k["output"]) for k in keys]
+
+    if not fn.isUnitlessInput and len(set(in_types)) <= 1 and len(set(out_types)) <= 1:
+        # addKeys takes times only and a single tangent type per side
+        unit = om.MTime.uiUnit()
+        times = om.MTimeArray([om.MTime(k["input"], unit) for k in keys])
+        fn.addKeys(times, om.MDoubleArray(values), in_types[0], out_types[0])
+    else:
+        unit = om.MTime.uiUnit()
+        for k, value, itt, ott in zip(keys, values, in_types, out_types):
+            at = k["input"] if fn.isUnitlessInput else om.MTime(k["input"], unit)
+            fn.addKey(at, value, itt, ott)
+
+    fn.setPreInfinityType(curve["preInfinity"])
+    fn.setPostInfinityType(curve["postInfinity"])
+    fn.setIsWeighted(bool(curve["weightedTangents"]))
+
+    # same naming as setDrivenKeyframe, setName makes it unique
+    name = target.split("|")[-1].split(":")[-1].replace(".", "_")
+    om.MFnDependencyNode(obj).setName(name)
+
+    return obj
+
+
+def _diff_dumps(expected: Any, actual: Any, tolerance: float, path: str = "") -> list[str]:
+    """Return the paths where two dumps differ, floats compared with *tolerance*."""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        res = []
+        for key in sorted(set(expected) | set(actual)):
+            if key not in expected or key not in actual:
+                res.append(f"{path}/{key}: missing")
+                continue
+            res.extend(_diff_dumps(expected[key], actual[key], tolerance, f"{path}/{key}"))
+        return res
+
+    if isinstance(expected, (list, tuple)) and isinstance(actual, (list, tuple)):
+        if len(expected) != len(actual):
+            return [f"{path}: length {len(expected)} != {len(actual)}"]
+        res = []
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            res.extend(_diff_dumps(a, b, tolerance, f"{path}[{i}]"))
+        return res
+
+    if isinstance(expected, float) or isinstance(actual, float):
+        if abs(float(expected) - float(actual)) > tolerance:
+            return [f"{path}: {expected} != {actual}"]
+        return []
+
+    if expected != actual:
+        return [f"{path}: {expected!r} != {actual!r}"]
+
+    return []
+
+
 # -------------------------------------------------------------
 # Public API
 # -------------------------------------------------------------
@@ -120,6 +351,7 @@ def _anim_curve_data(anim: str) -> dict[str, Any]:
 def dump_driven_keys(
     node: Union[str, Sequence[str]],
     world_space: bool = False,
+    bulk: bool = True,
 ) -> list[dict[str, Any]]:
     """Export all driven‑key relationships that affect *node* to *filepath*.
 
@@ -130,13 +362,16 @@ def dump_driven_keys(
     world_space
         If *True*, bake local‑space curves to world‑space values before
         export.  (This is rarely needed; default *False*.)
+    bulk
+        If *True* (default), read the curves with ``MFnAnimCurve``,
+        otherwise query each curve with ``cmds.keyframe`` / ``keyTangent``.
 
     Returns the absolute file path written so callers can print/log it.
     """
     result: list[dict[str, Any]] = []
     if not isinstance(node, str):
         for n in node:
-            result.extend(dump_driven_keys(n, world_space=world_space))
+            result.extend(dump_driven_keys(n, world_space=world_space, bulk=bulk))
 
         return result
 
@@ -150,8 +385,16 @@ def dump_driven_keys(
         "curves": [],
     }
 
-    for driven_plug, anim in _iter_anim_curves(node):
-        curve_info = _anim_curve_data(anim)
+    if bulk:
+        pairs = _iter_anim_curves_api(node)
+    else:
+        pairs = _iter_anim_curves(node)
+
+    for driven_plug, anim in pairs:
+        if bulk:
+            curve_info = _anim_curve_data_api(anim)
+        else:
+            curve_info = _anim_curve_data(anim)
         curve_info["targetPlug"] = driven_plug
         data["curves"].append(curve_info)
 
@@ -168,6 +411,8 @@ def export_driven_keys_to_file(
     filepath: str,
     *,
     world_space: bool = False,
+    columnar: bool = False,
+    bulk: bool = True,
 ) -> str:
     """Export all driven‑key relationships that affect *node* to *filepath*.
 
@@ -177,26 +422,189 @@ def export_driven_keys_to_file(
         The *driven* node you want to export from.  Must exist.
     filepath
         Destination .json path.  Parent folder is created automatically.
+        A ``.npz`` path is written in the columnar layout (needs NumPy).
     world_space
         If *True*, bake local‑space curves to world‑space values before
         export.  (This is rarely needed; default *False*.)
+    columnar
+        If *True*, write the JSON in the columnar layout, see
+        :func:`to_columnar`.
+    bulk
+        See :func:`dump_driven_keys`.
 
     Returns the absolute file path written so callers can print/log it.
     """
-    data = dump_driven_keys(node, world_space=world_space)
+    data = dump_driven_keys(node, world_space=world_space, bulk=bulk)
     if not os.path.isdir(os.path.dirname(filepath)):
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
+    if filepath.lower().endswith(".npz"):
+        save_columnar_npz(filepath, to_columnar(data))
+        return os.path.abspath(filepath)
+
+    if columnar:
+        with open(filepath, "w", encoding="utf‑8") as fh:
+            json.dump(to_columnar(data), fh, separators=(",", ":"))
+        return os.path.abspath(filepath)
+
     with open(filepath, "w", encoding="utf‑8") as fh:
         json.dump(data, fh, indent=4)
 
     return os.path.abspath(filepath)
 
 
+def to_columnar(data: list[dict[str, Any]]) -> dict[str, Any]:
+    """Convert a :func:`dump_driven_keys` result to a columnar layout.
+
+    Every curve field becomes one list indexed by curve, every key field
+    one list indexed by key.  ``curves["keyCount"]`` gives the number of
+    consecutive keys of each curve and tangent types are stored as indices
+    into ``tangentTypes``.  Curves without keys are left out, they cannot
+    be imported anyway.
+    """
+    tangent_types: list[str] = []
+    tangent_index: dict[str, int] = {}
+
+    def _tangent(name: str) -> int:
+        if name not in tangent_index:
+            tangent_index[name] = len(tangent_types)
+            tangent_types.append(name)
+        return tangent_index[name]
+
+    curve_fields = ("nodeType", "name", "driver", "targetPlug",
+                    "preInfinity", "postInfinity", "weightedTangents")
+    curves: dict[str, list[Any]] = {k: [] for k in ("node", "keyCount") + curve_fields}
+    keys: dict[str, list[Any]] = {k: [] for k in ("input", "output", "inTan", "outTan")}
+
+    for node_index, doc in enumerate(data):
+        for curve in doc["curves"]:
+            if "keys" not in curve:
+                continue
+            curves["node"].append(node_index)
+            curves["keyCount"].append(len(curve["keys"]))
+            for field in curve_fields:
+                curves[field].append(curve[field])
+            for k in curve["keys"]:
+                keys["input"].append(k["input"])
+                keys["output"].append(k["output"])
+                keys["inTan"].append(_tangent(k["inTan"]))
+                keys["outTan"].append(_tangent(k["outTan"]))
+
+    return {
+        "format": COLUMNAR_FORMAT,
+        "version": COLUMNAR_VERSION,
+        "maya": [doc.get("maya") for doc in data],
+        "exporter": [doc.get("exporter") for doc in data],
+        "drivenNode": [doc["drivenNode"] for doc in data],
+        "tangentTypes": tangent_types,
+        "curves": curves,
+        "keys": keys,
+    }
+
+
+def from_columnar(columnar: dict[str, Any]) -> list[dict[str, Any]]:
+    """Convert a :func:`to_columnar` layout back to the record layout."""
+    if columnar.get("format") != COLUMNAR_FORMAT:
+        raise ValueError("Not a columnar driven key layout.")
+    if columnar.get("version", 0) > COLUMNAR_VERSION:
+        raise ValueError(f"Unsupported columnar layout version: {columnar.get('version')}")
+
+    tangent_types = list(columnar["tangentTypes"])
+    curves = columnar["curves"]
+    keys = columnar["keys"]
+
+    data = [
+        {"maya": maya, "exporter": exporter, "drivenNode": node, "curves": []}
+        for maya, exporter, node in zip(columnar["maya"], columnar["exporter"], columnar["drivenNode"])
+    ]
+
+    start = 0
+    for i, count in enumerate(curves["keyCount"]):
+        count = int(count)
+        data[int(curves["node"][i])]["curves"].append({
+            "nodeType": str(curves["nodeType"][i]),
+            "name": str(curves["name"][i]),
+            "driver": str(curves["driver"][i]),
+            "keys": [
+                {
+                    "input": float(keys["input"][j]),
+                    "output": float(keys["output"][j]),
+                    "inTan": tangent_types[int(keys["inTan"][j])],
+                    "outTan": tangent_types[int(keys["outTan"][j])],
+                }
+                for j in range(start, start + count)
+            ],
+            "preInfinity": int(curves["preInfinity"][i]),
+            "postInfinity": int(curves["postInfinity"][i]),
+            "weightedTangents": bool(curves["weightedTangents"][i]),
+            "targetPlug": str(curves["targetPlug"][i]),
+        })
+        start += count
+
+    return data
+
+
+def save_columnar_npz(filepath: str, columnar: dict[str, Any]) -> None:
+    """Write a :func:`to_columnar` layout as a compressed ``.npz``."""
+    if np is None:
+        raise ImportError("NumPy is required to write the npz layout.")
+
+    arrays = {
+        "meta": np.array(json.dumps({
+            k: columnar[k] for k in ("format", "version", "maya", "exporter", "drivenNode", "tangentTypes")
+        })),
+    }
+    for group in ("curves", "keys"):
+        for field, values in columnar[group].items():
+            arrays[f"{group}.{field}"] = np.asarray(values)
+
+    np.savez_compressed(filepath, **arrays)
+
+
+def load_columnar_npz(filepath: str) -> dict[str, Any]:
+    """Read a ``.npz`` written by :func:`save_columnar_npz`."""
+    if np is None:
+        raise ImportError("NumPy is required to read the npz layout.")
+
+    with np.load(filepath, allow_pickle=False) as npz:
+        columnar = json.loads(str(npz["meta"]))
+        columnar["curves"] = {}
+        columnar["keys"] = {}
+        for name in npz.files:
+            if name == "meta":
+                continue
+            group, field = name.split(".", 1)
+            columnar[group][field] = npz[name].tolist()
+
+    return columnar
+
+
+def check_bulk_parity(
+    node: Union[str, Sequence[str]],
+    tolerance: float = 1e-6,
+) -> list[str]:
+    """Compare the OpenMayaAnim export against the ``cmds`` export.
+
+    Also checks that the columnar layout round‑trips.  Returns the list of
+    differences, empty when both paths agree.
+    """
+    legacy = dump_driven_keys(node, bulk=False)
+    bulk = dump_driven_keys(node, bulk=True)
+
+    mismatches = [f"bulk{x}" for x in _diff_dumps(legacy, bulk, tolerance)]
+
+    with_keys = [dict(doc, curves=[c for c in doc["curves"] if "keys" in c]) for doc in legacy]
+    columnar = from_columnar(json.loads(json.dumps(to_columnar(legacy))))
+    mismatches.extend(f"columnar{x}" for x in _diff_dumps(with_keys, columnar, tolerance))
+
+    return mismatches
+
+
 def import_driven_keys(
     data: Union[list[dict[str, Any]], dict[str, Any]],
     namespace_map: Optional[dict[str, str]] = None,
     strict: bool = False,
+    bulk: bool = False,
 ) -> list[str]:
     """Import driven‑key relationships from *filepath* into the current scene.
 
@@ -213,12 +621,23 @@ def import_driven_keys(
         If *True*, raise an error as soon as a target or driver plug is not
         found.  If *False* (default), missing plugs are skipped with a
         warning so that partial imports still succeed.
+    bulk
+        If *True*, create the curves with ``MFnAnimCurve`` and connect them
+        all with one ``MDGModifier``.  This path is not recorded in the undo
+        queue.  Targets that are already connected and curve types
+        OpenMayaAnim cannot create fall back to ``cmds.setDrivenKeyframe``,
+        which is also used for everything when *False* (default).
 
     Returns a list of newly created animCurve nodes.
     """
     if isinstance(data, list):
+        created: list[str] = []
         for d in data:
-            import_driven_keys(d, namespace_map=namespace_map, strict=strict)
+            created.extend(import_driven_keys(d, namespace_map=namespace_map, strict=strict, bulk=bulk))
+        return created
+
+    if isinstance(data, dict) and data.get("format") == COLUMNAR_FORMAT:
+        return import_driven_keys(from_columnar(data), namespace_map=namespace_map, strict=strict, bulk=bulk)
 
     if not isinstance(data, dict):
         raise TypeError("Invalid data format: expected a list of dicts.")
@@ -236,6 +655,7 @@ def import_driven_keys(
         return out
 
     created_anim_curves: list[str] = []
+    modifier = om.MDGModifier()
 
     for curve in data.get("curves", []):
 
@@ -251,40 +671,34 @@ def import_driven_keys(
         driver = _map(curve["driver"])
         target = _map(curve["targetPlug"])
 
-        if not cmds.objExists(driver):
+        driver_plug = _find_plug(driver)
+        if driver_plug is None:
             msg = f"Driver '{driver}' missing."
             if strict:
                 raise RuntimeError(msg)
             print("[driven_key_transfer] WARNING:", msg)
             continue
-        if not cmds.objExists(target):
+        target_plug = _find_plug(target)
+        if target_plug is None:
             msg = f"Target '{target}' missing."
             if strict:
                 raise RuntimeError(msg)
             print("[driven_key_transfer] WARNING:", msg)
             continue
 
-        # Build keys via Maya’s native driven‑key command
-        for k in curve["keys"]:
-            cmds.setDrivenKeyframe(
-                target,
-                cd=driver,
-                dv=k["input"],
-                v=k["output"],
-                itt=k["inTan"],
-                ott=k["outTan"],
-            )
-
-        # Fetch the freshly created animCurve and set infinity / weighting
-        anim = cmds.listConnections(target, s=True, d=False, t="animCurve")[-1]
-        created_anim_curves.append(anim)
-        cmds.setAttr(f"{anim}.preInfinity", curve["preInfinity"])
-        cmds.setAttr(f"{anim}.postInfinity", curve["postInfinity"])
-        try:
-            cmds.setAttr(f"{anim}.weightedTangents", curve["weightedTangents"])
-        except RuntimeError:
-            # weightedTangents is not available on all curve types
-            pass
+        if not bulk or curve["nodeType"] not in _API_CURVE_TYPES or target_plug.isDestination:
+            # setDrivenKeyframe adds to an existing curve or inserts a
+            # blendWeighted node when the target is already driven
+            created_anim_curves.append(_import_curve_cmds(curve, driver, target))
+            continue
+
+        obj = _create_curve_api(curve, target)
+        curve_fn = om.MFnDependencyNode(obj)
+        modifier.connect(driver_plug, curve_fn.findPlug("input", False))
+        modifier.connect(curve_fn.findPlug("output", False), target_plug)
+        created_anim_curves.append(curve_fn.name())
+
+    modifier.doIt()
 
     print(f"[driven_key_transfer] Imported {len(created_anim_curves)} driven‑key curves")
     return created_anim_curves
@@ -294,11 +708,15 @@ def import_driven_keys_from_file(
     filepath: str,
     namespace_map: Optional[dict[str, str]] = None,
     strict: bool = False,
+    bulk: bool = False,
 ) -> list[str]:
-    with open(filepath, "r", encoding="utf‑8") as fh:
-        data = json.load(fh)
+    if filepath.lower().endswith(".npz"):
+        data = load_columnar_npz(filepath)
+    else:
+        with open(filepath, "r", encoding="utf‑8") as fh:
+            data = json.load(fh)
 
-    return import_driven_keys(data, namespace_map=namespace_map, strict=strict)
+    return import_driven_keys(data, namespace_map=namespace_map, strict=strict, bulk=bulk)
 
 
 # -------------------------------------------------------------
@@ -318,6 +736,7 @@ if __name__ == "__main__":
     imp = sub.add_parser("import")
     imp.add_argument("filepath", help="Source JSON file.")
     imp.add_argument("--strict", action="store_true", help="Fail if any plug is missing.")
+    imp.add_argument("--bulk", action="store_true", help="Create curves through OpenMayaAnim (not undoable).")
 
     args = parser.parse_args()
 
@@ -326,9 +745,9 @@ if __name__ == "__main__":
         pass
 
     if args.cmd == "export":
-        export_driven_keys(args.node, args.filepath)
+        export_driven_keys_to_file(args.node, args.filepath)
     elif args.cmd == "import":
-        import_driven_keys(args.filepath, strict=args.strict)
+        import_driven_keys_from_file(args.filepath, strict=args.strict, bulk=args.bulk)
     else:
         parser.print_help()
         sys.exit(1)
@@ -6,20 +6,38 @@ This module intentionally keeps the scope narrow:
 * fixed sample parameters captured from the initial curves
 * analytic distance-loss gradients
 * one optional scene write-back at the end
+
+When NumPy is importable the optimizer loop runs on dense basis/CV arrays.
+The ``om2`` based evaluator stays the reference implementation and is used
+whenever NumPy is missing or ``backend="python"`` is requested.
+
+With a fixed sample basis the objective is quadratic in the CV positions, so
+``optimizer="lstsq"`` solves its normal equations directly instead of running
+gradient steps. That mode requires NumPy.
 """
 from __future__ import annotations
 
 import math
+import time
 from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from logging import DEBUG, INFO, StreamHandler, getLogger
 from typing import Literal, Union
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 import maya.api.OpenMaya as om2
 import maya.cmds as cmds
 
+import ymt_fit_curve_kernel as fit_kernel
+from ymt_fit_curve_kernel import ArrayFitContext, ArrayFitJob
+from ymt_fit_curve_kernel import ConvergenceTracker as _ConvergenceTracker
+
 from . import curve
 from .type_protocols import PymelNode
 
@@ -31,7 +49,9 @@ BasisSequence = Sequence[SparseBasis]
 PointSequence = Sequence[om2.MPoint]
 VectorSequence = Sequence[om2.MVector]
 SourceSampleMode = Literal["parameter", "length"]
-OptimizerName = Literal["adam", "lion"]
+OptimizerName = Literal["adam", "lion", "lstsq"]
+BackendName = Literal["auto", "python", "numpy"]
+ExecutorName = Literal["serial", "thread", "process"]
 SymmetryAxis = Literal["X", "Y", "Z", "x", "y", "z"]
 
 
@@ -102,6 +122,22 @@ class FitResult:
     scene_smoothness_loss_after_write: float | None = None
     scene_objective_loss_after_write: float | None = None
     max_write_error: float | None = None
+    converged: bool = False
+    stop_reason: str = "max_iterations"
+    loss_history: list[float] = field(default_factory=list)
+    gradient_norm_history: list[float] = field(default_factory=list)
+
+
+@dataclass
+class BatchFitResult:
+    """Per-curve results and aggregate timing of ``fit_curves_batch``."""
+
+    results: list[FitResult]
+    snapshot_seconds: float
+    optimize_seconds: float
+    write_seconds: float
+    total_seconds: float
+    executor: str = "serial"
 
 
 @dataclass
@@ -111,6 +147,7 @@ class EvaluatorValidation:
     max_error: float
     mean_error: float
     num_samples: int
+    max_gradient_error: float | None = None
 
 
 def _as_mfn_curve(curve_like: CurveLike) -> om2.MFnNurbsCurve:
@@ -837,6 +874,192 @@ def _adam_update_positions(
     return updated
 
 
+def is_array_backend_available() -> bool:
+    """Return whether the NumPy optimizer backend can be used."""
+    return np is not None
+
+
+def _resolve_backend(backend: BackendName) -> str:
+    if backend == "auto":
+        return "numpy" if is_array_backend_available() else "python"
+    if backend == "numpy":
+        if not is_array_backend_available():
+            raise ImportError("fit_curve backend 'numpy' requires NumPy.")
+        return backend
+    if backend == "python":
+        return backend
+    raise ValueError("Unsupported backend: {}".format(backend))
+
+
+def _points_to_array(points: PointSequence) -> np.ndarray:
+    return np.array([(point.x, point.y, point.z) for point in points], dtype=np.float64).reshape(-1, 3)
+
+
+def _array_to_points(values: np.ndarray) -> list[om2.MPoint]:
+    return [om2.MPoint(float(x), float(y), float(z)) for x, y, z in values]
+
+
+def _periodic_degree(snapshot: NurbsCurveSnapshot) -> int:
+    """Number of trailing bound CVs, see ``fit_kernel.sync_periodic_bound_cvs``."""
+    return snapshot.degree if snapshot.is_periodic else 0
+
+
+def build_array_context(context: FitContext) -> ArrayFitContext:
+    """Convert the sparse per-sample bases into dense folded matrices."""
+    if not is_array_backend_available():
+        raise ImportError("build_array_context requires NumPy.")
+
+    snapshot = context.source
+    basis = np.zeros((len(context.sample_basis), snapshot.num_cvs), dtype=np.float64)
+    for row, sample_basis in enumerate(context.sample_basis):
+        for cv_index, weight in sample_basis:
+            basis[row, _master_cv_index(snapshot, cv_index)] += weight
+
+    triples = _smoothness_indices(snapshot)
+    smoothness = np.zeros((len(triples), snapshot.num_cvs), dtype=np.float64)
+    for row, (prev_index, cv_index, next_index) in enumerate(triples):
+        smoothness[row, prev_index] += 1.0
+        smoothness[row, cv_index] -= 2.0
+        smoothness[row, next_index] += 1.0
+
+    return ArrayFitContext(
+        basis=basis,
+        smoothness=smoothness,
+        target_points=_points_to_array(context.target_points),
+        cvs_world=_points_to_array(snapshot.cvs_world),
+    )
+
+
+def validate_array_evaluator(context: FitContext, cvs_world: PointSequence | None = None, smoothness_weight: float = 0.2) -> EvaluatorValidation:
+    """Compare the NumPy evaluator and gradients with the ``om2`` reference."""
+    arrays = build_array_context(context)
+    positions = _sync_periodic_bound_cvs(context.source, context.source.cvs_world if cvs_world is None else cvs_world)
+    values = _points_to_array(positions)
+
+    reference_points = _points_to_array(evaluate_points(positions, context.sample_basis))
+    point_errors = np.linalg.norm(arrays.basis @ values - reference_points, axis=1)
+
+    reference_gradients = compute_objective_gradients(positions, context, smoothness_weight=smoothness_weight)
+    gradients = fit_kernel.objective_gradients(values, arrays, smoothness_weight)
+    gradient_errors = np.linalg.norm(gradients - _points_to_array(reference_gradients), axis=1)
+
+    return EvaluatorValidation(
+        max_error=float(point_errors.max()),
+        mean_error=float(point_errors.mean()),
+        num_samples=len(point_errors),
+        max_gradient_error=float(gradient_errors.max()),
+    )
+
+
+def _gradient_norm(gradients: VectorSequence, cv_indices: Sequence[int]) -> float:
+    return math.sqrt(sum(gradients[cv_index] * gradients[cv_index] for cv_index in cv_indices))
+
+
+def _max_displacement(points_a: PointSequence, points_b: PointSequence, cv_indices: Sequence[int]) -> float:
+    return max(
+        ((points_a[cv_index] - points_b[cv_index]).length() for cv_index in cv_indices),
+        default=0.0,
+    )
+
+
+def _optimize_positions_python(
+    context: FitContext,
+    positions: PointSequence,
+    cv_indices: Sequence[int],
+    num_iterations: int,
+    learning_rate: float,
+    beta: float,
+    optimizer: OptimizerName,
+    smoothness_weight: float,
+    adam_beta1: float,
+    adam_beta2: float,
+    adam_epsilon: float,
+    tracker: _ConvergenceTracker,
+) -> list[om2.MPoint]:
+    first_moment = [om2.MVector(0.0, 0.0, 0.0) for _ in range(context.source.num_cvs)]
+    second_moment = [om2.MVector(0.0, 0.0, 0.0) for _ in range(context.source.num_cvs)]
+
+    for step in range(1, num_iterations + 1):
+        previous = positions
+        gradients = compute_objective_gradients(
+            positions,
+            context,
+            cv_indices=cv_indices,
+            smoothness_weight=smoothness_weight,
+        )
+        if optimizer == "adam":
+            positions = _adam_update_positions(
+                positions,
+                first_moment,
+                second_moment,
+                gradients,
+                cv_indices,
+                learning_rate,
+                adam_beta1,
+                adam_beta2,
+                adam_epsilon,
+                step,
+            )
+        else:
+            positions = _lion_update_positions(
+                positions,
+                first_moment,
+                gradients,
+                cv_indices,
+                beta,
+                learning_rate,
+            )
+        positions = _sync_periodic_bound_cvs(context.source, positions)
+
+        tracker.iterations = step
+        if not tracker.enabled:
+            continue
+        objective = None
+        if tracker.needs_objective:
+            objective = compute_objective_loss(positions, context, smoothness_weight)[0]
+        if tracker.update(
+            step,
+            objective,
+            _gradient_norm(gradients, cv_indices),
+            _max_displacement(previous, positions, cv_indices),
+        ):
+            break
+
+    return list(positions)
+
+
+def _solve_positions_lstsq(
+    context: FitContext,
+    positions: PointSequence,
+    cv_indices: Sequence[int],
+    smoothness_weight: float,
+) -> list[om2.MPoint]:
+    """Solve the quadratic objective for the active CVs in one step.
+
+    Inactive CVs stay constant, so their contribution is already part of the
+    gradient at the current positions. Solving ``N * delta = -gradient / 2``
+    with the active-column normal matrix ``N`` therefore lands on the optimum,
+    and ``lstsq`` picks the smallest move when a CV has no sample support.
+    """
+    arrays = build_array_context(context)
+    values = _points_to_array(positions)
+    active = np.asarray(cv_indices, dtype=np.intp)
+    if not len(active):
+        return _array_to_points(values)
+
+    basis = arrays.basis[:, active]
+    normal = basis.T @ basis / float(len(arrays.target_points))
+    if smoothness_weight != 0.0 and len(arrays.smoothness):
+        smoothness = arrays.smoothness[:, active]
+        normal += smoothness.T @ smoothness * (smoothness_weight / float(len(arrays.smoothness)))
+
+    gradients = fit_kernel.objective_gradients(values, arrays, smoothness_weight)[active]
+    delta = np.linalg.lstsq(normal, gradients * -0.5, rcond=None)[0]
+    values[active] += delta
+    fit_kernel.sync_periodic_bound_cvs(values, _periodic_degree(context.source))
+    return _array_to_points(values)
+
+
 @contextmanager
 def _undo_chunk(name: str) -> Iterator[None]:
     if not cmds.undoInfo(query=True, state=True):
@@ -915,6 +1138,52 @@ def symmetry_curve(curve_like: CurveLike, axis: SymmetryAxis = "X", undoable: bo
     return positions[:_independent_cv_count(snapshot)]
 
 
+def _create_executor(executor: ExecutorName, max_workers: int | None) -> Executor | None:
+    if executor == "serial":
+        return None
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if executor == "process":
+        # spawned workers start sys.executable, which is maya.exe in a GUI
+        # session rather than a plain interpreter
+        if not cmds.about(batch=True):
+            raise RuntimeError("fit_curve executor 'process' is only supported in batch sessions such as mayapy.")
+        if not is_array_backend_available():
+            raise ImportError("fit_curve executor 'process' requires NumPy.")
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError("Unsupported executor: {}".format(executor))
+
+
+def _optimize_contexts(
+    contexts: Sequence[FitContext],
+    executor: ExecutorName,
+    max_workers: int | None,
+    optimize_options: dict,
+) -> list[FitResult]:
+    if executor == "process" and optimize_options.get("backend", "auto") == "python":
+        raise ValueError("fit_curve executor 'process' cannot run backend 'python'.")
+
+    pool = _create_executor(executor, max_workers)
+    if pool is None:
+        return [optimize_context(context, **optimize_options) for context in contexts]
+
+    with pool:
+        if executor == "process":
+            # only the array loop runs in the workers, see ymt_fit_curve_kernel
+            started = [_begin_optimize(context, **optimize_options) for context in contexts]
+            futures = [
+                None if job is None else pool.submit(fit_kernel.run_job, job)
+                for _, job in started
+            ]
+            return [
+                _end_optimize(prepared, None if future is None else future.result())
+                for (prepared, _), future in zip(started, futures)
+            ]
+
+        futures = [pool.submit(optimize_context, context, **optimize_options) for context in contexts]
+        return [future.result() for future in futures]
+
+
 def _max_position_error(points_a: PointSequence, points_b: PointSequence) -> float:
     max_error = 0.0
     for point_a, point_b in zip(points_a, points_b):
@@ -922,7 +1191,42 @@ def _max_position_error(points_a: PointSequence, points_b: PointSequence) -> flo
     return max_error
 
 
-def optimize_context(
+def _record_scene_write(mfn_curve: om2.MFnNurbsCurve, context: FitContext, result: FitResult) -> None:
+    scene_positions = _sync_periodic_bound_cvs(
+        context.source,
+        mfn_curve.cvPositions(om2.MSpace.kWorld),
+    )
+    scene_objective, scene_distance, scene_smoothness = compute_objective_loss(
+        scene_positions,
+        context,
+        result.effective_smoothness_weight,
+    )
+    result.scene_loss_after_write = scene_distance
+    result.scene_smoothness_loss_after_write = scene_smoothness
+    result.scene_objective_loss_after_write = scene_objective
+    result.max_write_error = _max_position_error(result.positions_world, scene_positions)
+
+
+@dataclass
+class _PreparedFit:
+    """State carried from ``_begin_optimize`` to ``_end_optimize``."""
+
+    context: FitContext
+    positions: list[om2.MPoint]
+    tracker: _ConvergenceTracker
+    smoothness_weight: float
+    effective_smoothness_weight: float
+    smoothness_cv_scale: float
+    target_complexity: float
+    smoothness_complexity_scale: float
+    initial_loss: float
+    initial_smoothness_loss: float
+    initial_objective_loss: float
+    symmetry: bool
+    symmetry_axis: SymmetryAxis
+
+
+def _begin_optimize(
     context: FitContext,
     cv_indices: Sequence[int] | None = None,
     num_iterations: int = 30,
@@ -937,8 +1241,18 @@ def optimize_context(
     adam_epsilon: float = 1e-8,
     symmetry: bool = False,
     symmetry_axis: SymmetryAxis = "X",
-) -> FitResult:
-    """Optimize the snapshot CV array without updating any scene curve."""
+    backend: BackendName = "auto",
+    objective_tolerance: float | None = None,
+    gradient_tolerance: float | None = None,
+    displacement_tolerance: float | None = None,
+    patience: int = 1,
+    record_history: bool = False,
+) -> tuple[_PreparedFit, ArrayFitJob | None]:
+    """Run every step of ``optimize_context`` up to the NumPy loop.
+
+    Returns the job for ``fit_kernel.run_job`` when the NumPy loop is still
+    to run, or None when the positions are already final.
+    """
     cv_indices = _normalized_cv_indices(context.source, cv_indices)
     if symmetry:
         _axis_index(symmetry_axis)
@@ -953,75 +1267,186 @@ def optimize_context(
     effective_smoothness_weight, cv_scale, target_complexity, complexity_scale = smoothness_weight_data
     positions = _sync_periodic_bound_cvs(context.source, context.source.cvs_world)
 
-    first_moment = [om2.MVector(0.0, 0.0, 0.0) for _ in range(context.source.num_cvs)]
-    second_moment = [om2.MVector(0.0, 0.0, 0.0) for _ in range(context.source.num_cvs)]
     initial_objective_loss, initial_loss, initial_smoothness_loss = compute_objective_loss(
         positions,
         context,
         effective_smoothness_weight,
     )
 
-    if optimizer not in ("adam", "lion"):
+    if optimizer not in ("adam", "lion", "lstsq"):
         raise ValueError("Unsupported optimizer: {}".format(optimizer))
 
-    for step in range(1, num_iterations + 1):
-        gradients = compute_objective_gradients(
-            positions,
-            context,
-            cv_indices=cv_indices,
+    tracker = _ConvergenceTracker(
+        initial_objective_loss,
+        objective_tolerance,
+        gradient_tolerance,
+        displacement_tolerance,
+        patience,
+        record_history,
+    )
+    prepared = _PreparedFit(
+        context=context,
+        positions=positions,
+        tracker=tracker,
+        smoothness_weight=smoothness_weight,
+        effective_smoothness_weight=effective_smoothness_weight,
+        smoothness_cv_scale=cv_scale,
+        target_complexity=target_complexity,
+        smoothness_complexity_scale=complexity_scale,
+        initial_loss=initial_loss,
+        initial_smoothness_loss=initial_smoothness_loss,
+        initial_objective_loss=initial_objective_loss,
+        symmetry=bool(symmetry),
+        symmetry_axis=symmetry_axis,
+    )
+
+    resolved_backend = _resolve_backend(backend)
+    if optimizer == "lstsq":
+        if backend == "python":
+            raise ValueError("fit_curve optimizer 'lstsq' cannot run on backend 'python', use 'auto' or 'numpy'.")
+        if resolved_backend != "numpy":
+            raise ImportError("fit_curve optimizer 'lstsq' requires NumPy.")
+        prepared.positions = _solve_positions_lstsq(context, positions, cv_indices, effective_smoothness_weight)
+        tracker.iterations = 1
+        tracker.converged = True
+        tracker.stop_reason = "solved"
+        return prepared, None
+
+    if resolved_backend == "numpy":
+        job = ArrayFitJob(
+            arrays=build_array_context(context),
+            values=_points_to_array(positions),
+            cv_indices=list(cv_indices),
+            periodic_degree=_periodic_degree(context.source),
+            num_iterations=num_iterations,
+            learning_rate=learning_rate,
+            beta=beta,
+            optimizer=optimizer,
             smoothness_weight=effective_smoothness_weight,
+            adam_beta1=adam_beta1,
+            adam_beta2=adam_beta2,
+            adam_epsilon=adam_epsilon,
+            tracker=tracker,
         )
-        if optimizer == "adam":
-            positions = _adam_update_positions(
-                positions,
-                first_moment,
-                second_moment,
-                gradients,
-                cv_indices,
-                learning_rate,
-                adam_beta1,
-                adam_beta2,
-                adam_epsilon,
-                step,
-            )
-        else:
-            positions = _lion_update_positions(
-                positions,
-                first_moment,
-                gradients,
-                cv_indices,
-                beta,
-                learning_rate,
-            )
-        positions = _sync_periodic_bound_cvs(context.source, positions)
+        return prepared, job
 
-    if symmetry:
-        positions = apply_symmetry_projection(context.source, positions, symmetry_axis)
+    prepared.positions = _optimize_positions_python(
+        context,
+        positions,
+        cv_indices,
+        num_iterations,
+        learning_rate,
+        beta,
+        optimizer,
+        effective_smoothness_weight,
+        adam_beta1,
+        adam_beta2,
+        adam_epsilon,
+        tracker,
+    )
+    return prepared, None
+
+
+def _end_optimize(
+    prepared: _PreparedFit,
+    job_result: tuple[np.ndarray, _ConvergenceTracker] | None = None,
+) -> FitResult:
+    """Apply the ``fit_kernel.run_job`` output, symmetry and final losses."""
+    positions = prepared.positions
+    tracker = prepared.tracker
+    if job_result is not None:
+        values, tracker = job_result
+        positions = _array_to_points(values)
+
+    context = prepared.context
+    if prepared.symmetry:
+        positions = apply_symmetry_projection(context.source, positions, prepared.symmetry_axis)
 
     final_objective_loss, final_loss, final_smoothness_loss = compute_objective_loss(
         positions,
         context,
-        effective_smoothness_weight,
+        prepared.effective_smoothness_weight,
     )
     return FitResult(
         positions_world=positions,
-        initial_loss=initial_loss,
+        initial_loss=prepared.initial_loss,
         final_loss=final_loss,
-        iterations=num_iterations,
-        initial_smoothness_loss=initial_smoothness_loss,
+        iterations=tracker.iterations,
+        initial_smoothness_loss=prepared.initial_smoothness_loss,
         final_smoothness_loss=final_smoothness_loss,
-        initial_objective_loss=initial_objective_loss,
+        initial_objective_loss=prepared.initial_objective_loss,
         final_objective_loss=final_objective_loss,
-        smoothness_weight=smoothness_weight,
-        effective_smoothness_weight=effective_smoothness_weight,
-        smoothness_cv_scale=cv_scale,
-        target_complexity=target_complexity,
-        smoothness_complexity_scale=complexity_scale,
-        symmetry=bool(symmetry),
-        symmetry_axis=symmetry_axis.upper(),
+        smoothness_weight=prepared.smoothness_weight,
+        effective_smoothness_weight=prepared.effective_smoothness_weight,
+        smoothness_cv_scale=prepared.smoothness_cv_scale,
+        target_complexity=prepared.target_complexity,
+        smoothness_complexity_scale=prepared.smoothness_complexity_scale,
+        symmetry=prepared.symmetry,
+        symmetry_axis=prepared.symmetry_axis.upper(),
+        converged=tracker.converged,
+        stop_reason=tracker.stop_reason,
+        loss_history=tracker.loss_history,
+        gradient_norm_history=tracker.gradient_norm_history,
     )
 
 
+def optimize_context(
+    context: FitContext,
+    cv_indices: Sequence[int] | None = None,
+    num_iterations: int = 30,
+    learning_rate: float = 0.01,
+    beta: float = 0.9,
+    optimizer: OptimizerName = "adam",
+    smoothness_weight: float = 0.2,
+    smoothness_auto_scale: bool = True,
+    smoothness_complexity_gain: float = 1.0,
+    adam_beta1: float = 0.9,
+    adam_beta2: float = 0.999,
+    adam_epsilon: float = 1e-8,
+    symmetry: bool = False,
+    symmetry_axis: SymmetryAxis = "X",
+    backend: BackendName = "auto",
+    objective_tolerance: float | None = None,
+    gradient_tolerance: float | None = None,
+    displacement_tolerance: float | None = None,
+    patience: int = 1,
+    record_history: bool = False,
+) -> FitResult:
+    """Optimize the snapshot CV array without updating any scene curve.
+
+    ``backend="auto"`` runs the loop on NumPy arrays when available and falls
+    back to the ``om2`` evaluator otherwise. ``optimizer="lstsq"`` replaces the
+    iterations with a single normal-equation solve and reports one iteration.
+
+    Any tolerance left as ``None`` is disabled; with all of them disabled the
+    loop always runs ``num_iterations`` steps. ``record_history`` stores the
+    objective after each step and the gradient norm that drove it.
+    """
+    prepared, job = _begin_optimize(
+        context,
+        cv_indices,
+        num_iterations,
+        learning_rate,
+        beta,
+        optimizer,
+        smoothness_weight,
+        smoothness_auto_scale,
+        smoothness_complexity_gain,
+        adam_beta1,
+        adam_beta2,
+        adam_epsilon,
+        symmetry,
+        symmetry_axis,
+        backend,
+        objective_tolerance,
+        gradient_tolerance,
+        displacement_tolerance,
+        patience,
+        record_history,
+    )
+    return _end_optimize(prepared, None if job is None else fit_kernel.run_job(job))
+
+
 def fit_curve_on_curve(
     curve_a: CurveLike,
     curve_b: CurveLike,
@@ -1040,6 +1465,12 @@ def fit_curve_on_curve(
     adam_epsilon: float = 1e-8,
     symmetry: bool = False,
     symmetry_axis: SymmetryAxis = "X",
+    backend: BackendName = "auto",
+    objective_tolerance: float | None = None,
+    gradient_tolerance: float | None = None,
+    displacement_tolerance: float | None = None,
+    patience: int = 1,
+    record_history: bool = False,
     write_back: bool = True,
     undoable: bool = True,
 ) -> FitResult:
@@ -1049,6 +1480,7 @@ def fit_curve_on_curve(
     after the optimization loop. Set it false to benchmark or inspect the result
     without changing the scene. ``undoable`` controls whether that final write
     uses Maya commands so Ctrl+Z/redo can restore it as a single undo item.
+    ``optimizer="lstsq"`` ignores the iteration and learning-rate settings.
     """
     mfn_a = _as_mfn_curve(curve_a)
     context = build_fit_context(
@@ -1072,6 +1504,12 @@ def fit_curve_on_curve(
         adam_epsilon=adam_epsilon,
         symmetry=symmetry,
         symmetry_axis=symmetry_axis,
+        backend=backend,
+        objective_tolerance=objective_tolerance,
+        gradient_tolerance=gradient_tolerance,
+        displacement_tolerance=displacement_tolerance,
+        patience=patience,
+        record_history=record_history,
     )
 
     if write_back:
@@ -1081,19 +1519,7 @@ def fit_curve_on_curve(
             undoable=undoable,
             undo_name="fit_curve fit",
         )
-        scene_positions = _sync_periodic_bound_cvs(
-            context.source,
-            mfn_a.cvPositions(om2.MSpace.kWorld),
-        )
-        scene_objective, scene_distance, scene_smoothness = compute_objective_loss(
-            scene_positions,
-            context,
-            result.effective_smoothness_weight,
-        )
-        result.scene_loss_after_write = scene_distance
-        result.scene_smoothness_loss_after_write = scene_smoothness
-        result.scene_objective_loss_after_write = scene_objective
-        result.max_write_error = _max_position_error(result.positions_world, scene_positions)
+        _record_scene_write(mfn_a, context, result)
 
     om2.MGlobal.displayInfo(
         "fit_curve distance loss: {} -> {}".format(result.initial_loss, result.final_loss),
@@ -1120,6 +1546,13 @@ def fit_curve_on_curve(
             result.smoothness_complexity_scale,
         ),
     )
+    om2.MGlobal.displayInfo(
+        "fit_curve iterations: {}, converged={}, stop_reason={}".format(
+            result.iterations,
+            result.converged,
+            result.stop_reason,
+        ),
+    )
     om2.MGlobal.displayInfo(
         "fit_curve symmetry post-process: enabled={}, axis={}".format(
             result.symmetry,
@@ -1135,3 +1568,74 @@ def fit_curve_on_curve(
             ),
         )
     return result
+
+
+def fit_curves_batch(
+    pairs: Sequence[tuple[CurveLike, CurveLike]],
+    num_samples: int = 100,
+    source_sample_mode: SourceSampleMode = "parameter",
+    executor: ExecutorName = "thread",
+    max_workers: int | None = None,
+    write_back: bool = True,
+    undoable: bool = True,
+    **optimize_options,
+) -> BatchFitResult:
+    """Fit every ``(curve_a, curve_b)`` pair with one shared worker pool.
+
+    Scene reads happen on the calling (main) thread while the fit contexts are
+    built. Only ``optimize_context`` runs in the pool, with
+    ``optimize_options`` forwarded to every call. ``executor="process"`` is
+    for batch sessions such as ``mayapy`` and needs NumPy: the contexts are
+    prepared here and only the array loop of ``ymt_fit_curve_kernel`` runs
+    in the workers, which import neither Maya nor this package. The lstsq
+    solve stays on the calling process. All results are written back in a
+    single undo chunk.
+    """
+    start = time.perf_counter()
+    mfn_curves = []
+    contexts = []
+    for curve_a, curve_b in pairs:
+        mfn_a = _as_mfn_curve(curve_a)
+        mfn_curves.append(mfn_a)
+        contexts.append(build_fit_context(
+            mfn_a,
+            curve_b,
+            num_samples=num_samples,
+            source_sample_mode=source_sample_mode,
+        ))
+    snapshot_end = time.perf_counter()
+
+    results = _optimize_contexts(contexts, executor, max_workers, optimize_options)
+    optimize_end = time.perf_counter()
+
+    if write_back:
+        with _undo_chunk("fit_curves_batch"):
+            for mfn_curve, result in zip(mfn_curves, results):
+                set_scene_cv_positions(
+                    mfn_curve,
+                    result.positions_world,
+                    undoable=undoable,
+                    undo_name="fit_curves_batch",
+                )
+        for mfn_curve, context, result in zip(mfn_curves, contexts, results):
+            _record_scene_write(mfn_curve, context, result)
+    write_end = time.perf_counter()
+
+    batch_result = BatchFitResult(
+        results=results,
+        snapshot_seconds=snapshot_end - start,
+        optimize_seconds=optimize_end - snapshot_end,
+        write_seconds=write_end - optimize_end,
+        total_seconds=write_end - start,
+        executor=executor,
+    )
+    om2.MGlobal.displayInfo(
+        "fit_curves_batch: {} curves, executor={}, snapshot={:.3f}s, optimize={:.3f}s, write={:.3f}s".format(
+            len(results),
+            executor,
+            batch_result.snapshot_seconds,
+            batch_result.optimize_seconds,
+            batch_result.write_seconds,
+        ),
+    )
+    return batch_result
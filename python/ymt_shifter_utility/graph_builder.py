@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Record DG nodes, attribute values and connections, then commit them at once.
+
+Building node networks one cmds.createNode / connectAttr call at a time is
+slow on long chains. DGGraph queues everything and commits it with two
+modifier passes: one creating and naming the nodes, one setting the values
+and making the connections in the order they were recorded.
+
+Example:
+    graph = DGGraph()
+    blend = graph.createNode("blendWeighted", name="twistBlend")
+    graph.connect("ctl.rotateX", (blend, "input[0]"))
+    graph.setAttr((blend, "weight[0]"), 0.5)
+    graph.commit()
+    print(blend.name())
+
+The modifiers are not registered as a command, so the result is not in the
+undo queue.
+"""
+from __future__ import annotations
+
+from typing import Tuple, Union
+
+import maya.api.OpenMaya as om
+
+
+class GraphNode(object):
+    """A node queued on a DGGraph, its name is known once committed."""
+
+    def __init__(self, obj: om.MObject, name: str | None) -> None:
+        self.obj = obj
+        self.requestedName = name
+
+    def name(self) -> str:
+        if self.obj.hasFn(om.MFn.kDagNode):
+            return om.MFnDagNode(self.obj).partialPathName()
+        return om.MFnDependencyNode(self.obj).name()
+
+    def __str__(self) -> str:
+        return self.name()
+
+
+# "node.attr" of an existing node, or (node, "attr") with node a name or a GraphNode
+PlugSpec = Union[str, Tuple[Union[str, GraphNode], str]]
+
+
+class DGGraph(object):
+    """Queue node creation, attribute values and connections, see module doc."""
+
+    def __init__(self) -> None:
+        self._dgModifier = om.MDGModifier()
+        self._dagModifier = om.MDagModifier()
+        self._nodes: list[GraphNode] = []
+        self._ops: list[tuple[str, PlugSpec, object]] = []
+
+    def createNode(self, nodeType: str, name: str | None = None, parent: str | GraphNode | None = None, dag: bool | None = None) -> GraphNode:
+        """Queue a new node.
+
+        Args:
+            nodeType (str): Node type
+            name (str): Requested name, made unique on commit
+            parent (str or GraphNode): Parent of a dag node
+            dag (bool): Whether nodeType is a dag node, guessed from parent
+                and the node type when omitted
+        """
+
+        if dag is None:
+            dag = parent is not None or nodeType in ("transform", "joint")
+
+        if dag:
+            parentObj = self._getObject(parent) if parent is not None else om.MObject.kNullObj
+            obj = self._dagModifier.createNode(nodeType, parentObj)
+        else:
+            obj = self._dgModifier.createNode(nodeType)
+
+        node = GraphNode(obj, name)
+        self._nodes.append(node)
+        return node
+
+    def setAttr(self, plug: PlugSpec, value: object) -> None:
+        """Queue an attribute value, sequences are set on the compound children."""
+        self._ops.append(("set", plug, value))
+
+    def connect(self, src: PlugSpec, dst: PlugSpec) -> None:
+        """Queue a connection."""
+        self._ops.append(("connect", src, dst))
+
+    def commit(self) -> list[GraphNode]:
+        """Create the queued nodes, then apply the values and connections.
+
+        Returns:
+            list[GraphNode]: The created nodes
+        """
+
+        self._dgModifier.doIt()
+        self._dagModifier.doIt()
+        for node in self._nodes:
+            if node.requestedName:
+                om.MFnDependencyNode(node.obj).setName(node.requestedName)
+
+        modifier = om.MDGModifier()
+        for op, plug, value in self._ops:
+            if op == "connect":
+                modifier.connect(self._getPlug(plug), self._getPlug(value))
+            else:
+                _queuePlugValue(modifier, self._getPlug(plug), value)
+        modifier.doIt()
+
+        nodes = self._nodes
+        self._dgModifier = om.MDGModifier()
+        self._dagModifier = om.MDagModifier()
+        self._nodes = []
+        self._ops = []
+
+        return nodes
+
+    @staticmethod
+    def _getObject(node: str | GraphNode) -> om.MObject:
+        if isinstance(node, GraphNode):
+            return node.obj
+        return om.MSelectionList().add(node).getDependNode(0)
+
+    @staticmethod
+    def _getPlug(plug: PlugSpec) -> om.MPlug:
+        if isinstance(plug, tuple):
+            node, attr = plug
+            plug = "{}.{}".format(node, attr)
+        return om.MSelectionList().add(plug).getPlug(0)
+
+
+def _queuePlugValue(modifier: om.MDGModifier, plug: om.MPlug, value: object) -> None:
+
+    if isinstance(value, (list, tuple)):
+        for i, v in enumerate(value):
+            _queuePlugValue(modifier, plug.child(i), v)
+
+    elif isinstance(value, bool):
+        modifier.newPlugValueBool(plug, value)
+
+    elif isinstance(value, int):
+        modifier.newPlugValueInt(plug, value)
+
+    else:
+        modifier.newPlugValueDouble(plug, float(value))
@@ -9,6 +9,7 @@ import os
 import re
 import sys
 import xml.etree.ElementTree as ET
+from collections import defaultdict
 from collections.abc import Iterator, Sequence
 from logging import DEBUG, INFO, WARN, StreamHandler, getLogger  # NOQA
 
@@ -191,6 +192,127 @@ def get_nodes(node_name: str) -> Optional[list[OpenMaya2.MDagPath]]:
     return dag_paths
 
 
+class NameIndex:
+    """One-shot index of the scene transforms by short name.
+
+    Resolves names like ``cmds.ls(name, recursive=True)`` does, without a
+    scene query per name.  Nodes are stored as object handles so the paths
+    stay valid when a node is re-parented while matching.
+
+    Args:
+        option: MGOption used to expand src / dst aliases
+    """
+
+    def __init__(self, option: Optional[MGOption] = None) -> None:
+        """Initialize NameIndex."""
+        self.option = option
+        self.unresolved = []  # type: list[str]
+        self._nodes = defaultdict(list)  # type: dict[str, list[tuple[str, OpenMaya2.MObjectHandle]]]
+        self._resolved = {}  # type: dict[str, list[OpenMaya2.MObjectHandle]]
+        self._aliases = {}  # type: dict[tuple[str, str], str]
+
+        seen = set()
+        it = OpenMaya2.MItDag(OpenMaya2.MItDag.kDepthFirst, OpenMaya2.MFn.kTransform)
+        while not it.isDone():
+            handle = OpenMaya2.MObjectHandle(it.currentItem())
+            if handle.hashCode() not in seen:
+                seen.add(handle.hashCode())
+                name = OpenMaya2.MFnDependencyNode(handle.object()).name()
+                self._nodes[name.split(":")[-1]].append((name, handle))
+            it.next()
+
+    def expand(self, name: str, side: str) -> str:
+        """Apply the alias definition to a src or dst name.
+
+        Args:
+            name: Original name
+            side: "src" or "dst"
+
+        Returns:
+            Aliased name or original name if no alias applies
+        """
+        option = self.option
+        if not option or option.alias_definition is None:
+            return name
+        if not (option.src_alias if side == "src" else option.dst_alias):
+            return name
+
+        key = (name, side)
+        if key not in self._aliases:
+            self._aliases[key] = apply_alias(name, option.alias_definition)
+        return self._aliases[key]
+
+    def _lookup(self, query: str) -> list[OpenMaya2.MObjectHandle]:
+        if query in self._resolved:
+            return self._resolved[query]
+
+        if not query or query.startswith(":") or any(c in query for c in "|*?["):
+            # paths and patterns are left to cmds.ls
+            handles = [OpenMaya2.MObjectHandle(x) for x in self._query_scene(query)]
+        else:
+            candidates = self._nodes.get(query.split(":")[-1], [])
+            if ":" in query:
+                handles = [h for n, h in candidates if n == query or n.endswith(":" + query)]
+            else:
+                handles = [h for _, h in candidates]
+
+            if not handles:
+                # not a transform, e.g. a shape or a dependency node
+                handles = [OpenMaya2.MObjectHandle(x) for x in self._query_scene(query)]
+
+        if not handles:
+            self.unresolved.append(query)
+
+        self._resolved[query] = handles
+        return handles
+
+    @staticmethod
+    def _query_scene(query: str) -> list[OpenMaya2.MObject]:
+        res = []
+        for candidate in cmds.ls(query, recursive=True) if query else []:
+            try:
+                res.append(OpenMaya2.MGlobal.getSelectionListByName(candidate).getDependNode(0))
+            except RuntimeError:
+                pass
+        return res
+
+    def resolve(self, query: str) -> Optional[list[OpenMaya2.MDagPath]]:
+        """Same as :func:`get_nodes` using the index."""
+        res = []
+        for handle in self._lookup(query):
+            if not handle.isValid():
+                continue
+            obj = handle.object()
+            if obj.hasFn(OpenMaya2.MFn.kDagNode):
+                res.append(OpenMaya2.MDagPath.getAPathTo(obj))
+            else:
+                res.append(obj)
+        return res or None
+
+    def resolve_one(self, query: str) -> Optional[OpenMaya2.MDagPath]:
+        """Same as :func:`get_node` using the index."""
+        res = self.resolve(query)
+        return res[0] if res else None
+
+    def resolve_many(self, queries: Sequence[str]) -> dict[str, Optional[list[OpenMaya2.MDagPath]]]:
+        """Resolve several names at once.
+
+        Args:
+            queries: Names to resolve
+
+        Returns:
+            Dict of name to MDagPath list, None for unresolved names
+        """
+        return {q: self.resolve(q) for q in queries}
+
+    def report(self) -> None:
+        """Log the names that could not be resolved."""
+        if self.unresolved:
+            logger.warning(
+                "Unresolved names ({0}): {1}".format(len(self.unresolved), ", ".join(self.unresolved))
+            )
+
+
 def apply_alias(name: str, definition: dict[str, str]) -> str:
     """Apply alias to name if defined in the definition.
 
@@ -245,10 +367,64 @@ def get_rotation(
     return rotation
 
 
+def _joint_orient(dag_path: OpenMaya2.MDagPath) -> OpenMaya2.MQuaternion:
+    """Get jointOrient of a joint, identity for other transforms."""
+    if not dag_path.hasFn(OpenMaya2.MFn.kJoint):
+        return OpenMaya2.MQuaternion()
+
+    node = OpenMaya2.MFnDependencyNode(dag_path.node())
+    jo = [node.findPlug("jointOrient" + axis, False).asMAngle().asRadians() for axis in "XYZ"]
+    return OpenMaya2.MEulerRotation(jo[0], jo[1], jo[2]).asQuaternion()
+
+
+def _local_rotation_for_world(
+    dag_path: OpenMaya2.MDagPath,
+    quat: OpenMaya2.MQuaternion,
+) -> OpenMaya2.MEulerRotation:
+    """Get the rotate value that gives the node the world rotation *quat*.
+
+    World translation and scale are kept, same as parenting the node to the
+    world, setting the rotation and parenting it back.
+    """
+    transform = OpenMaya2.MFnTransform(dag_path)
+    current = transform.rotation(OpenMaya2.MSpace.kTransform)
+
+    world = OpenMaya2.MTransformationMatrix(dag_path.inclusiveMatrix())
+    world.setRotation(quat)
+    local = OpenMaya2.MTransformationMatrix(world.asMatrix() * dag_path.exclusiveMatrixInverse())
+
+    # local rotation = rotateAxis * rotate * jointOrient
+    rotate_axis = transform.transformation().rotationOrientation()
+    rot = rotate_axis.inverse() * local.rotation(True) * _joint_orient(dag_path).inverse()
+
+    return rot.asEulerRotation().reorderIt(current.order)
+
+
+def _queue_rotation(
+    modifier: OpenMaya2.MDGModifier,
+    dag_path: OpenMaya2.MDagPath,
+    euler: OpenMaya2.MEulerRotation,
+) -> None:
+    node = OpenMaya2.MFnDependencyNode(dag_path.node())
+    for axis, value in zip("XYZ", (euler.x, euler.y, euler.z)):
+        modifier.newPlugValueMAngle(node.findPlug("rotate" + axis, False), OpenMaya2.MAngle(value))
+
+
+def _queue_translation(
+    modifier: OpenMaya2.MDGModifier,
+    dag_path: OpenMaya2.MDagPath,
+    value: OpenMaya2.MVector,
+) -> None:
+    node = OpenMaya2.MFnDependencyNode(dag_path.node())
+    for axis, v in zip("XYZ", (value.x, value.y, value.z)):
+        modifier.newPlugValueMDistance(node.findPlug("translate" + axis, False), OpenMaya2.MDistance(v))
+
+
 def set_rotation(
     dag_path: OpenMaya2.MDagPath,
     quat: OpenMaya2.MQuaternion,
     space: Union[int, OpenMaya2.MSpace] = OpenMaya2.MSpace.kWorld,
+    modifier: Optional[OpenMaya2.MDGModifier] = None,
 ) -> None:
     """Set rotation of a node (Quaternion).
 
@@ -256,7 +432,13 @@ def set_rotation(
         dag_path: The MDagPath of the node
         quat: Quaternion rotation to set
         space: The coordinate space to set rotation in
+        modifier: If given, the rotate values are queued on it instead of
+            re-parenting the node to the world
     """
+    if modifier is not None:
+        _queue_rotation(modifier, dag_path, _local_rotation_for_world(dag_path, quat))
+        return
+
     transform = OpenMaya2.MFnTransform(dag_path)
     path_name = dag_path.fullPathName()
 
@@ -294,6 +476,7 @@ def set_translation(
     dag_path: OpenMaya2.MDagPath,
     value: OpenMaya2.MVector,
     space: Union[int, OpenMaya2.MSpace] = OpenMaya2.MSpace.kWorld,
+    modifier: Optional[OpenMaya2.MDGModifier] = None,
 ) -> None:
     """Set translation of a node.
 
@@ -301,9 +484,21 @@ def set_translation(
         dag_path: The MDagPath of the node
         value: MVector translation to set
         space: The coordinate space to set translation in
+        modifier: If given, the translate values are queued on it
     """
     transform = OpenMaya2.MFnTransform(dag_path)
-    transform.setTranslation(value, space)
+    if modifier is None:
+        transform.setTranslation(value, space)
+        return
+
+    local = transform.translation(OpenMaya2.MSpace.kTransform)
+    if space == OpenMaya2.MSpace.kWorld:
+        # translate moves the node through the parent matrix
+        delta = (value - transform.translation(space)) * dag_path.exclusiveMatrixInverse()
+        local += delta
+    else:
+        local = OpenMaya2.MVector(value)
+    _queue_translation(modifier, dag_path, local)
 
 
 ##############################################################################
@@ -487,50 +682,112 @@ def __tokenize_offset(
     return [_tokenize_value(x, i) for i, x in enumerate(offset)]
 
 
-def do_match(
+def _apply_t_offset(
+    destination: OpenMaya2.MDagPath,
+    t_offset: Sequence[Union[str, float]],
+    modifier: OpenMaya2.MDGModifier,
+) -> None:
+    """Queue a relative object space move, same as ``cmds.move(os=True, r=True, wd=True)``."""
+    t_val = __tokenize_offset(destination.fullPathName(), t_offset, "t")
+    delta = OpenMaya2.MVector(t_val[0], t_val[1], t_val[2]).rotateBy(get_rotation(destination))
+    set_translation(destination, get_translation(destination) + delta, modifier=modifier)
+
+
+def _apply_r_offset(
+    destination: OpenMaya2.MDagPath,
+    r_offset: Sequence[Union[str, float]],
+    modifier: OpenMaya2.MDGModifier,
+) -> None:
+    """Queue a relative object space rotation, same as ``cmds.rotate(os=True, r=True)``."""
+    r_val = __tokenize_offset(destination.fullPathName(), r_offset, "r")
+    unit = OpenMaya2.MAngle.uiUnit()
+    euler = OpenMaya2.MEulerRotation(*[OpenMaya2.MAngle(v, unit).asRadians() for v in r_val])
+    set_rotation(destination, euler.asQuaternion() * get_rotation(destination), modifier=modifier)
+
+
+def _get_match_mode(entry: dict[str, Any]) -> list[str]:
+    mode = entry.get("mode", ["t"])
+    if isinstance(mode, six.string_types):
+        mode = [mode]
+    return mode
+
+
+def _resolve_match_entry(
     entry: dict[str, Any],
     selection: Optional[list[str]] = None,
     option: Optional[MGOption] = None,
-    preserve_children: bool = False,
-) -> None:
-    """Match transform of source node to destination node.
+    index: Optional[NameIndex] = None,
+) -> Optional[tuple[OpenMaya2.MDagPath, OpenMaya2.MDagPath]]:
+    """Resolve the source and destination of a match entry.
 
-    Args:
-        entry: Dict defining the match operation (must contain "src", "dst", etc.)
-        selection: List of selected nodes to restrict operation to
-        option: MGOption for alias handling, etc.
-        preserve_children: Whether to preserve children hierarchies during match
+    Returns:
+        (source, destination) or None if the entry is skipped
     """
     s_query = util.displayable_path(entry["src"])
     d_query = util.displayable_path(entry["dst"])
 
     if not s_query:
         logger.debug(f"Skipping match, no source found in entry: {entry}")
-        return
+        return None
 
-    if option and option.alias_definition is not None:
-        if option.src_alias:
-            s_query = apply_alias(s_query, option.alias_definition)
-        if option.dst_alias:
-            d_query = apply_alias(d_query, option.alias_definition)
+    if index is not None:
+        s_query = index.expand(s_query, "src")
+        d_query = index.expand(d_query, "dst")
+        source = index.resolve_one(s_query)
+        destination = index.resolve_one(d_query)
 
-    source = get_node(s_query)
-    destination = get_node(d_query)
+    else:
+        if option and option.alias_definition is not None:
+            if option.src_alias:
+                s_query = apply_alias(s_query, option.alias_definition)
+            if option.dst_alias:
+                d_query = apply_alias(d_query, option.alias_definition)
+
+        source = get_node(s_query)
+        destination = get_node(d_query)
 
     if selection is not None and destination:
         # Check short name to see if it is in selection
         d_short_name = destination.fullPathName().split("|")[-1].split(":")[-1]
         if d_short_name not in selection:
             logger.debug(f"Skipping match, destination {d_short_name} not in selection.")
-            return
+            return None
 
     if not source or not destination:
         logger.debug(f"Skipping match, missing src or dst: {s_query}, {d_query}")
+        return None
+
+    return source, destination
+
+
+def do_match(
+    entry: dict[str, Any],
+    selection: Optional[list[str]] = None,
+    option: Optional[MGOption] = None,
+    preserve_children: bool = False,
+    index: Optional[NameIndex] = None,
+    modifier: Optional[OpenMaya2.MDagModifier] = None,
+) -> None:
+    """Match transform of source node to destination node.
+
+    Args:
+        entry: Dict defining the match operation (must contain "src", "dst", etc.)
+        selection: List of selected nodes to restrict operation to
+        option: MGOption for alias handling, etc.
+        preserve_children: Whether to preserve children hierarchies during match
+        index: NameIndex used to resolve names instead of querying the scene
+        modifier: MDagModifier the transform writes are done with, a new
+            one is used if omitted.  The writes are not undoable.
+    """
+    resolved = _resolve_match_entry(entry, selection, option, index)
+    if resolved is None:
         return
+    source, destination = resolved
 
-    mode = entry.get("mode", ["t"])
-    if isinstance(mode, six.string_types):
-        mode = [mode]
+    if modifier is None:
+        modifier = OpenMaya2.MDagModifier()
+
+    mode = _get_match_mode(entry)
 
     def _perform_match() -> None:
         logger.info(f"Matching mode({mode}) destination: {destination}, source: {source}")
@@ -538,26 +795,24 @@ def do_match(
         # Translation
         if "t" in mode:
             translation = get_translation(source)
-            set_translation(destination, translation)
+            set_translation(destination, translation, modifier=modifier)
+            modifier.doIt()
 
             t_offset = entry.get("t_offset")
             if t_offset:
-                t_val = __tokenize_offset(destination.fullPathName(), t_offset, "t")
-                cmds.move(t_val[0], t_val[1], t_val[2],
-                          destination.fullPathName(),
-                          os=True, relative=True, worldSpaceDistance=True)
+                _apply_t_offset(destination, t_offset, modifier)
+                modifier.doIt()
 
         # Rotation
         if "r" in mode:
             try:
                 quat = get_rotation(source)
-                set_rotation(destination, quat)
+                set_rotation(destination, quat, modifier=modifier)
+                modifier.doIt()
                 r_offset = entry.get("r_offset")
                 if r_offset:
-                    r_val = __tokenize_offset(destination.fullPathName(), r_offset, "r")
-                    cmds.rotate(r_val[0], r_val[1], r_val[2],
-                                destination.fullPathName(),
-                                os=True, r=True)
+                    _apply_r_offset(destination, r_offset, modifier)
+                    modifier.doIt()
             except TypeError:
                 logger.exception("Error applying rotation match")
 
@@ -568,12 +823,210 @@ def do_match(
         _perform_match()
 
 
-def do_connect(entry: dict[str, Any], option: Optional[MGOption] = None) -> None:
+##############################################################################
+# Match Planning
+##############################################################################
+
+
+class MatchStep:
+    """World space targets of one destination node.
+
+    Attributes:
+        destination (MDagPath): Node written by this step
+        depth (int): DAG depth of the destination
+        translation (MVector or None): World translation to set
+        rotation (MQuaternion or None): World rotation to set
+        t_offset (list or None): Translation offset applied after the write
+        r_offset (list or None): Rotation offset applied after the write
+        entries (list): Entries merged into this step, empty for children
+            kept in place by preserve_children
+    """
+
+    def __init__(self, destination: OpenMaya2.MDagPath) -> None:
+        """Initialize MatchStep."""
+        self.destination = destination
+        self.depth = destination.length()
+        self.translation = None  # type: Optional[OpenMaya2.MVector]
+        self.rotation = None  # type: Optional[OpenMaya2.MQuaternion]
+        self.t_offset = None
+        self.r_offset = None
+        self.entries = []  # type: list[dict[str, Any]]
+
+    def describe(self) -> str:
+        """Describe the writes of this step."""
+        name = self.destination.partialPathName()
+        srcs = ", ".join(str(e.get("src")) for e in self.entries) or "(preserve)"
+        writes = []
+        if self.translation is not None:
+            t = self.translation
+            writes.append("t=({0:.4f}, {1:.4f}, {2:.4f})".format(t.x, t.y, t.z))
+        if self.t_offset:
+            writes.append(f"t_offset={list(self.t_offset)}")
+        if self.rotation is not None:
+            r = self.rotation.asEulerRotation()
+            writes.append("r=({0:.4f}, {1:.4f}, {2:.4f})".format(
+                math.degrees(r.x), math.degrees(r.y), math.degrees(r.z)))
+        if self.r_offset:
+            writes.append(f"r_offset={list(self.r_offset)}")
+        return f"[{self.depth}] {name} <- {srcs}: {' '.join(writes)}"
+
+
+class MatchPlan:
+    """Match entries ordered by DAG depth with their world targets.
+
+    All targets are read from the scene when the plan is built, so sources
+    are taken before any destination is moved.  :meth:`apply` writes the
+    nodes parent first, each node once, one level at a time.
+
+    Attributes:
+        steps (list[MatchStep]): Steps sorted by depth
+        skipped (list[dict]): Entries that could not be resolved
+        merged (int): Entries that targeted an already planned node
+    """
+
+    def __init__(self) -> None:
+        """Initialize MatchPlan."""
+        self.steps = []  # type: list[MatchStep]
+        self.skipped = []  # type: list[dict[str, Any]]
+        self.merged = 0
+
+    def levels(self) -> list[list[MatchStep]]:
+        """Group the steps by DAG depth, shallowest first."""
+        levels = defaultdict(list)
+        for step in self.steps:
+            levels[step.depth].append(step)
+        return [levels[d] for d in sorted(levels)]
+
+    def report(self) -> list[str]:
+        """Describe the plan and the predicted writes."""
+        lines = [
+            "{0} nodes in {1} levels, {2} entries merged, {3} entries skipped".format(
+                len(self.steps), len(self.levels()), self.merged, len(self.skipped))
+        ]
+        lines.extend(step.describe() for step in self.steps)
+        return lines
+
+    def apply(self, modifier: Optional[OpenMaya2.MDagModifier] = None) -> None:
+        """Write the planned transforms.
+
+        Offsets are applied through the same modifier as the matched
+        values, so none of the writes are undoable.
+
+        Args:
+            modifier: MDagModifier the transform writes are done with
+        """
+        if modifier is None:
+            modifier = OpenMaya2.MDagModifier()
+
+        for level in self.levels():
+            # offsets are relative to the written values, so each channel
+            # is executed before its offsets are applied
+            for step in level:
+                if step.translation is not None:
+                    set_translation(step.destination, step.translation, modifier=modifier)
+            modifier.doIt()
+            for step in level:
+                if step.t_offset:
+                    _apply_t_offset(step.destination, step.t_offset, modifier)
+            modifier.doIt()
+
+            for step in level:
+                if step.rotation is not None:
+                    set_rotation(step.destination, step.rotation, modifier=modifier)
+            modifier.doIt()
+            for step in level:
+                if step.r_offset:
+                    _apply_r_offset(step.destination, step.r_offset, modifier)
+            modifier.doIt()
+
+
+def plan_match(
+    entries: Sequence[dict[str, Any]],
+    selection: Optional[list[str]] = None,
+    option: Optional[MGOption] = None,
+    index: Optional[NameIndex] = None,
+    preserve_children: bool = False,
+) -> MatchPlan:
+    """Build a MatchPlan from match entries.
+
+    Several entries on the same destination are merged, later entries win
+    per channel as they would when applied in order.  With
+    preserve_children, children that are not destinations themselves get a
+    step keeping their world transform, instead of being re-parented.
+
+    Args:
+        entries: Match entries (dicts with "src", "dst", etc.)
+        selection: List of selected nodes to restrict operation to
+        option: MGOption for alias handling, etc.
+        index: NameIndex used to resolve names, built if omitted
+        preserve_children: Whether to preserve children hierarchies during match
+
+    Returns:
+        The plan, nothing is written to the scene
+    """
+    if index is None:
+        index = NameIndex(option)
+
+    plan = MatchPlan()
+    steps = {}  # type: dict[str, MatchStep]
+
+    for entry in entries:
+        resolved = _resolve_match_entry(entry, selection, option, index)
+        if resolved is None:
+            plan.skipped.append(entry)
+            continue
+        source, destination = resolved
+
+        key = destination.fullPathName()
+        if key in steps:
+            plan.merged += 1
+        else:
+            steps[key] = MatchStep(destination)
+        step = steps[key]
+        step.entries.append(entry)
+
+        mode = _get_match_mode(entry)
+        if "t" in mode:
+            step.translation = get_translation(source)
+            step.t_offset = entry.get("t_offset")
+        if "r" in mode:
+            try:
+                step.rotation = get_rotation(source)
+                step.r_offset = entry.get("r_offset")
+            except TypeError:
+                logger.exception("Error reading rotation for match")
+
+    if preserve_children:
+        for key, step in list(steps.items()):
+            dag_fn = OpenMaya2.MFnDagNode(step.destination)
+            for i in range(dag_fn.childCount()):
+                child_obj = dag_fn.child(i)
+                if not child_obj.hasFn(OpenMaya2.MFn.kTransform):
+                    continue
+                child = OpenMaya2.MDagPath(step.destination)
+                child.push(child_obj)
+                if child.fullPathName() in steps:
+                    continue
+                kept = MatchStep(child)
+                kept.translation = get_translation(child)
+                kept.rotation = get_rotation(child)
+                steps[child.fullPathName()] = kept
+
+    plan.steps = sorted(steps.values(), key=lambda x: x.depth)
+    return plan
+
+
+def do_connect(
+    entry: dict[str, Any],
+    option: Optional[MGOption] = None,
+    index: Optional[NameIndex] = None,
+) -> None:
     """Connect or constrain one node to another.
 
     Args:
         entry: Dict defining the connection (contains "src", "dst", "mode", etc.)
         option: MGOption for alias handling, etc.
+        index: NameIndex used to resolve names instead of querying the scene
     """
     def _connect_single(
         src_query: str,
@@ -581,19 +1034,29 @@ def do_connect(entry: dict[str, Any], option: Optional[MGOption] = None) -> None
         _mode: str,
         _weight: Optional[float] = None,
     ) -> None:
-        if option and option.alias_definition:
-            if option.src_alias:
-                src_query = apply_alias(src_query, option.alias_definition)
-            if option.dst_alias:
-                dst_query = apply_alias(dst_query, option.alias_definition)
-
         dst_multi = option.dst_multiple if option else False
 
-        source = get_node(src_query)
-        if dst_multi:
-            destination = get_node(dst_query)
+        if index is not None:
+            src_query = index.expand(src_query, "src")
+            dst_query = index.expand(dst_query, "dst")
+            source = index.resolve_one(src_query)
+            if dst_multi:
+                destination = index.resolve_one(dst_query)
+            else:
+                destination = index.resolve(dst_query)
+
         else:
-            destination = get_nodes(dst_query)
+            if option and option.alias_definition:
+                if option.src_alias:
+                    src_query = apply_alias(src_query, option.alias_definition)
+                if option.dst_alias:
+                    dst_query = apply_alias(dst_query, option.alias_definition)
+
+            source = get_node(src_query)
+            if dst_multi:
+                destination = get_node(dst_query)
+            else:
+                destination = get_nodes(dst_query)
 
         if not source or not destination:
             if not source:
@@ -637,28 +1100,49 @@ def match(
     def_file_name: str = "test.yaml",
     domain: str = "guide_on_bone",
     option: Optional[MGOption] = None,
-) -> None:
+    dry_run: bool = False,
+    preserve_children: bool = False,
+) -> Optional[MatchPlan]:
     """Match transforms based on configuration file.
 
+    The matched values and their offsets are written through an
+    MDagModifier and are not undoable, Ctrl+Z does not revert any part of
+    a match.  Use dry_run to check the writes first.
+
     Args:
         def_file_name: YAML or JSON configuration file
         domain: Domain (key) to read from configuration
         option: MGOption for alias handling, etc.
+        dry_run: Only log the plan and the predicted writes
+        preserve_children: Whether to preserve children hierarchies during match
+
+    Returns:
+        The MatchPlan, or None if the configuration could not be processed
     """
     try:
         match_entries = anyconfig.load(def_file_name)
         if not isinstance(match_entries, dict):
             raise ValueError(f"Config file does not contain a valid dict: {def_file_name}")
 
-        selection = cmds.ls(sl=True)  # current selection
+        selection = set(cmds.ls(sl=True))  # current selection
+        index = NameIndex(option)
 
-        for entry in match_entries.get(domain, []):
-            logger.info(f"Processing entry: {entry}")
+        plan = plan_match(match_entries.get(domain, []), selection, option, index, preserve_children)
+        index.report()
+
+        if dry_run:
+            for line in plan.report():
+                logger.info(line)
+            return plan
+
+        logger.info(plan.report()[0])
+        plan.apply()
+        return plan
 
-            do_match(entry, selection, option)
     except Exception as e:
         logger.error(f"Error in match operation: {e}")
         logger.exception("Traceback:")
+        return None
 
 
 def connect_on_deformer(
@@ -678,11 +1162,14 @@ def connect_on_deformer(
         if not config_map or not isinstance(config_map, dict):
             raise ValueError(f"Could not load config as dict from file: {def_file_name}")
 
+        index = NameIndex(option)
         for entry in config_map.get(domain, []):
             try:
-                do_connect(entry, option=option)
+                do_connect(entry, option=option, index=index)
             except RuntimeError as ex:
                 logger.error(f"Connection error for entry {entry}: {ex}")
+
+        index.report()
     except Exception as e:
         logger.error(f"Error in connect_on_deformer: {e}")
         logger.exception("Traceback:")
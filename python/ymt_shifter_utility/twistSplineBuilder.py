@@ -25,6 +25,7 @@ SOFTWARE.
 
 from itertools import product
 from maya import cmds, OpenMaya
+from ymt_shifter_utility.graph_builder import DGGraph
 if cmds.about(apiVersion=True) >= 20260000:
 	addDoubleLinear = "addDL"
 	pointMatrixMult = "pointMatrixMultDL"
@@ -422,61 +423,51 @@ def buildTwistSpline(pfx, cvs, aoTans, aiTans, tws, maxParam, closed=False):
 	usedCVs = numCVs + 1 - shift  # Total number of CV's connected to the spline node
 
 	# build the spline object and set the spline Params
-	splineTfm = cmds.createNode("transform", name=SPLINE_FMT.format(pfx))
-	spline = cmds.createNode("twistSpline", parent=splineTfm, name=SPLINE_FMT.format(pfx) + "Shape")
+	graph = DGGraph()
+	splineTfm = graph.createNode("transform", name=SPLINE_FMT.format(pfx))
+	spline = graph.createNode("twistSpline", parent=splineTfm, name=SPLINE_FMT.format(pfx) + "Shape")
 
 	# Don't connect a first in tangent
 	for i, aiTan in enumerate(aiTans):
-		cmds.connectAttr("{}.worldMatrix[0]".format(aiTan), "{}.vertexData[{}].inTangent".format(spline, i+1))
+		graph.connect("{}.worldMatrix[0]".format(aiTan), (spline, "vertexData[{}].inTangent".format(i+1)))
 
 	# Don't connect a last out tangent
 	for i, aoTan in enumerate(aoTans):
-		cmds.connectAttr("{}.worldMatrix[0]".format(aoTan), "{}.vertexData[{}].outTangent".format(spline, i))
+		graph.connect("{}.worldMatrix[0]".format(aoTan), (spline, "vertexData[{}].outTangent".format(i)))
 
 	for u in range(usedCVs):
 		i = u % numCVs
-		cmds.connectAttr("{}.worldMatrix[0]".format(cvs[i]), "{}.vertexData[{}].controlVertex".format(spline, u))
-		cmds.connectAttr("{}.Pin".format(cvs[i]), "{}.vertexData[{}].paramWeight".format(spline, u))
+		graph.connect("{}.worldMatrix[0]".format(cvs[i]), (spline, "vertexData[{}].controlVertex".format(u)))
+		graph.connect("{}.Pin".format(cvs[i]), (spline, "vertexData[{}].paramWeight".format(u)))
 		if u != i:
 			# The paramValue needs an offset if we're at the last connection of a closed spline
-			adL = cmds.createNode(addDoubleLinear)
-			cmds.setAttr("{0}.input2".format(adL), maxParam)
-			cmds.connectAttr("{0}.PinParam".format(cvs[i]), "{0}.input1".format(adL), f=True)
-			cmds.connectAttr("{0}.output".format(adL), "{}.vertexData[{}].paramValue".format(spline, u), f=True)
+			adL = graph.createNode(addDoubleLinear)
+			graph.setAttr((adL, "input2"), maxParam)
+			graph.connect("{0}.PinParam".format(cvs[i]), (adL, "input1"))
+			graph.connect((adL, "output"), (spline, "vertexData[{}].paramValue".format(u)))
 		else:
-			cmds.connectAttr("{}.PinParam".format(cvs[i]), "{}.vertexData[{}].paramValue".format(spline, u))
-			cmds.setAttr("{}.PinParam".format(cvs[i]), (u * maxParam) / (usedCVs - 1.0))
+			graph.connect("{}.PinParam".format(cvs[i]), (spline, "vertexData[{}].paramValue".format(u)))
+			graph.setAttr("{}.PinParam".format(cvs[i]), (u * maxParam) / (usedCVs - 1.0))
 
-		cmds.connectAttr("{}.UseTwist".format(tws[i]), "{}.vertexData[{}].twistWeight".format(spline, u))
+		graph.connect("{}.UseTwist".format(tws[i]), (spline, "vertexData[{}].twistWeight".format(u)))
 		if i == 0 or i == (usedCVs - 1):
-			cmds.connectAttr("{}.rotateX".format(tws[i]), "{}.vertexData[{}].twistValue".format(spline, u))
+			graph.connect("{}.rotateX".format(tws[i]), (spline, "vertexData[{}].twistValue".format(u)))
 		else:
+			# first * ratioA + last * ratioB + own twist, in a single weighted sum
 			ratioA = float(i) / float(usedCVs)
 			ratioB = 1. - ratioA
-			multA = cmds.createNode("multiplyDivide")
-			multB = cmds.createNode("multiplyDivide")
-			add1 = cmds.createNode(addDoubleLinear)
-			add2 = cmds.createNode(addDoubleLinear)
+			blend = graph.createNode("blendWeighted")
+			for k, (tw, weight) in enumerate(((tws[0], ratioA), (tws[-1], ratioB), (tws[i], 1.0))):
+				graph.connect("{}.rotateX".format(tw), (blend, "input[{}]".format(k)))
+				graph.setAttr((blend, "weight[{}]".format(k)), weight)
 
-			cmds.setAttr("{0}.operation".format(multA), 1)
-			cmds.connectAttr("{}.rotateX".format(tws[0]), "{}.input1X".format(multA))
-			cmds.setAttr("{0}.input2".format(multA), ratioA, 1, 1)
+			graph.connect((blend, "output"), (spline, "vertexData[{}].twistValue".format(u)))
 
-			cmds.setAttr("{0}.operation".format(multB), 1)
-			cmds.connectAttr("{}.rotateX".format(tws[-1]), "{}.input1X".format(multB))
-			cmds.setAttr("{0}.input2".format(multB), ratioB, 1, 1)
+	graph.setAttr("{}.Pin".format(cvs[0]), 1.0)
+	graph.setAttr("{}.UseTwist".format(tws[0]), 1.0)
+	graph.commit()
 
-			cmds.connectAttr("{}.outputX".format(multA), "{}.input1".format(add1))
-			cmds.connectAttr("{}.outputX".format(multB), "{}.input2".format(add1))
-			cmds.connectAttr("{}.output".format(add1), "{}.input1".format(add2))
-			cmds.connectAttr("{}.rotateX".format(tws[i]), "{}.input2".format(add2))
-
-			cmds.connectAttr("{}.output".format(add2), "{}.vertexData[{}].twistValue".format(spline, u))
-
-	cmds.setAttr("{}.Pin".format(cvs[0]), 1.0)
-	cmds.setAttr("{}.UseTwist".format(tws[0]), 1.0)
-
-	return splineTfm, spline
+	return splineTfm.name(), spline.name()
 
 def buildRiders(pfx, spline, master, numJoints, closed=False):
 	""" Build rider joints and constrain them to the spline
@@ -495,36 +486,38 @@ def buildRiders(pfx, spline, master, numJoints, closed=False):
 		str: The constraint node
 	"""
 	# make the joints at origin. The constraint will put them in place
-	jointsGrp = cmds.createNode("transform", name=DFM_ORG_FMT.format(pfx))
+	graph = DGGraph()
+	jointsGrp = graph.createNode("transform", name=DFM_ORG_FMT.format(pfx))
 	jPars, joints = [], []
 	for i in range(numJoints):
-		jp = cmds.createNode("transform", name=DFM_BFR_FMT.format(pfx, i + 1), parent=jointsGrp)
-		j = cmds.createNode("joint", name=DFM_FMT.format(pfx, i + 1), parent=jp)
-		cmds.setAttr(j + ".radius", 1.2)
-		cmds.setAttr(jp + ".displayLocalAxis", 1)
+		jp = graph.createNode("transform", name=DFM_BFR_FMT.format(pfx, i + 1), parent=jointsGrp)
+		j = graph.createNode("joint", name=DFM_FMT.format(pfx, i + 1), parent=jp)
+		graph.setAttr((j, "radius"), 1.2)
+		graph.setAttr((jp, "displayLocalAxis"), True)
 		jPars.append(jp)
 		joints.append(j)
 
 	# build the constraint object
-	cnst = cmds.createNode("riderConstraint")
-	cmds.connectAttr("{}.Offset".format(master), "{}.globalOffset".format(cnst))
-	cmds.connectAttr("{}.Stretch".format(master), "{}.globalSpread".format(cnst))
+	cnst = graph.createNode("riderConstraint")
+	graph.connect("{}.Offset".format(master), (cnst, "globalOffset"))
+	graph.connect("{}.Stretch".format(master), (cnst, "globalSpread"))
 	if closed:
-		cmds.setAttr("{}.useCycle".format(cnst), 1)
+		graph.setAttr((cnst, "useCycle"), True)
 
 	# connect the constraints
-	cmds.connectAttr("{}.outputSpline".format(spline), "{}.inputSplines[0].spline".format(cnst))
+	graph.connect("{}.outputSpline".format(spline), (cnst, "inputSplines[0].spline"))
 	for i in range(len(jPars)):
 		if len(jPars) == 1:
-			cmds.setAttr("{0}.params[{1}].param".format(cnst, i), 0.5)
+			graph.setAttr((cnst, "params[{}].param".format(i)), 0.5)
 		else:
-			cmds.setAttr("{0}.params[{1}].param".format(cnst, i), i / (numJoints - 1.0))
-		cmds.connectAttr("{}.parentInverseMatrix[0]".format(jPars[i]), "{0}.params[{1}].parentInverseMatrix".format(cnst, i))
-		cmds.connectAttr("{0}.outputs[{1}].translate".format(cnst, i), "{}.translate".format(jPars[i]))
-		cmds.connectAttr("{0}.outputs[{1}].rotate".format(cnst, i), "{}.rotate".format(jPars[i]))
-		cmds.connectAttr("{0}.outputs[{1}].scale".format(cnst, i), "{}.scale".format(jPars[i]))
-
-	return jPars, joints, jointsGrp, cnst
+			graph.setAttr((cnst, "params[{}].param".format(i)), i / (numJoints - 1.0))
+		graph.connect((jPars[i], "parentInverseMatrix[0]"), (cnst, "params[{}].parentInverseMatrix".format(i)))
+		graph.connect((cnst, "outputs[{}].translate".format(i)), (jPars[i], "translate"))
+		graph.connect((cnst, "outputs[{}].rotate".format(i)), (jPars[i], "rotate"))
+		graph.connect((cnst, "outputs[{}].scale".format(i)), (jPars[i], "scale"))
+	graph.commit()
+
+	return [jp.name() for jp in jPars], [j.name() for j in joints], jointsGrp.name(), cnst.name()
 
 def makeTwistSpline(pfx, numCVs, numJoints=10, maxParam=None, spread=1.0, closed=False):
 	""" Make a twist spline
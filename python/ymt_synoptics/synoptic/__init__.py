@@ -1,4 +1,6 @@
 import os
+import time
+import traceback
 from contextlib import suppress
 from types import ModuleType
 from typing import Optional
@@ -61,6 +63,13 @@ class Synoptic(MayaQWidgetDockableMixin, QtWidgets.QDialog):
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         self.toolName = SYNOPTIC_WIDGET_NAME
+
+        # tab name -> SynopticTabWrapper, one instance per tab shared by
+        # every model, see updateTabs
+        self._tabCache = {}
+        # tab name -> (width, height) measured when the tab was built
+        self._tabSizes = {}
+
         # Delete old instances of the componet settings window.
         pyqt.deleteInstances(self, MayaQDockWidget)
         super(Synoptic, self).__init__(parent)
@@ -75,22 +84,33 @@ class Synoptic(MayaQWidgetDockableMixin, QtWidgets.QDialog):
         """
 
         # self.cbManager.removeAllManagedCB()
-        for i in range(self.tabs.count()):
-            tab = self.tabs.widget(i)
-            if isinstance(tab, SynopticTabWrapper):
-                synTab, resultBool = tab.searchMainSynopticTab()
-                if resultBool and hasattr(synTab, "cbManager"):
-                    synTab.cbManager.removeAllManagedCB()
-            tab.close()
-        self.tabs.clear()
+        self.detachTabs()
+        for tab in self._tabCache.values():
+            self.disposeTab(tab)
+        self._tabCache.clear()
+        self._tabSizes.clear()
         super(Synoptic, self).closeEvent(evnt)
 
+    def disposeTab(self, tab: QtWidgets.QWidget) -> None:
+        """Remove the maya callbacks of the tab and close it.
+
+        Args:
+            tab (QWidget): SynopticTabWrapper or placeholder to close
+        """
+
+        if isinstance(tab, SynopticTabWrapper):
+            synTab, resultBool = tab.searchMainSynopticTab()
+            if resultBool and hasattr(synTab, "cbManager"):
+                synTab.cbManager.removeAllManagedCB()
+        tab.close()
+
     def create_widgets(self) -> None:
         self.setupUi()
 
         # Connect Signal
         self.refresh_button.clicked.connect(self.updateModelList)
         self.model_list.currentIndexChanged.connect(self.updateTabs)
+        self.tabs.currentChanged.connect(self.onTabChanged)
 
         # Initialise
         self.updateModelList()
@@ -210,15 +230,19 @@ class Synoptic(MayaQWidgetDockableMixin, QtWidgets.QDialog):
         self.updateTabs()
 
     def updateTabs(self) -> None:
+        """Show the synoptic tabs of the current model.
+
+        Built tabs are kept in a per tab cache keyed by tab name and reused
+        on the next update, also for another model. The tab is retargeted
+        instead of rebuilt, tabs get their model through utils.getModel so
+        only the button index has to be dropped.
+        Cached tabs that are not shown do not listen to selection changes.
+        Tabs that are not cached yet are inserted as placeholders and only
+        built when they are displayed, see onTabChanged.
+        """
 
-        for i in range(self.tabs.count()):
-            tab = self.tabs.widget(i)
-            if isinstance(tab, SynopticTabWrapper):
-                synTab, resultBool = tab.searchMainSynopticTab()
-                if resultBool and hasattr(synTab, "cbManager"):
-                    synTab.cbManager.removeAllManagedCB()
-            tab.close()
-        self.tabs.clear()
+        start = time.perf_counter()
+        self.detachTabs()
 
         currentModelName = self.model_list.currentText()
         currentModels = pm.ls(currentModelName)
@@ -227,50 +251,189 @@ class Synoptic(MayaQWidgetDockableMixin, QtWidgets.QDialog):
 
         tab_names = currentModels[0].getAttr("synoptic").split(",")
 
-        max_h = 0
-        max_w = 0
-        for i, tab_name in enumerate(tab_names):
-            try:
-                if tab_name:
-                    # instantiate SynopticTab widget
-                    module = importTab(tab_name)
-                    synoptic_tab = module.SynopticTab()
-
-                    # set minimum size for auto fit (stretch) scroll area
-                    if synoptic_tab.minimumHeight() == 0:
-                        synoptic_tab.setMinimumHeight(synoptic_tab.height())
-                    if synoptic_tab.minimumWidth() == 0:
-                        synoptic_tab.setMinimumWidth(synoptic_tab.width())
+        self.tabs.blockSignals(True)
+        try:
+            shown = set()
+            for tab_name in tab_names:
+                if not tab_name:
+                    mes = "No synoptic tabs for %s" % currentModelName
+                    pm.displayWarning(mes)
+                    continue
 
-                    # store tab size for set container size later
-                    h = synoptic_tab.minimumHeight()
-                    w = synoptic_tab.minimumWidth()
+                if tab_name in shown:
+                    mes = "Synoptic tab: {0} is listed twice for {1}".format(
+                        tab_name, currentModelName)
+                    mgear.log(mes, mgear.sev_warning)
+                    continue
+                shown.add(tab_name)
 
-                    max_h = h if max_h < h else max_h
-                    max_w = w if max_w < w else max_w
+                tab = self.retargetCachedTab(tab_name)
+                if tab is None:
+                    tab = SynopticTabPlaceholder(tab_name)
+                self.tabs.addTab(tab, tab_name)
 
-                    tab = self.wrapTabContents(synoptic_tab)
-                    self.tabs.insertTab(i, tab, tab_name)
+        finally:
+            self.tabs.blockSignals(False)
+
+        built = 1 if self.ensureTabBuilt(self.tabs.currentIndex()) else 0
+        self.fitToTabs()
+
+        deferred = self.countPlaceholders()
+        mes = "Synoptic tabs for {0} opened in {1:.3f} sec " \
+              "({2} built, {3} cached, {4} deferred)".format(
+                  currentModelName,
+                  time.perf_counter() - start,
+                  built,
+                  self.tabs.count() - built - deferred,
+                  deferred)
+        mgear.log(mes, mgear.sev_info)
+
+    def detachTabs(self) -> None:
+        """Take every page out of the tab widget without destroying it.
+
+        Cached tabs are hidden and their selection callback is removed
+        until they are retargeted, placeholders are closed.
+        """
 
+        self.tabs.blockSignals(True)
+        try:
+            while self.tabs.count():
+                tab = self.tabs.widget(0)
+                self.tabs.removeTab(0)
+                if isinstance(tab, SynopticTabPlaceholder):
+                    tab.close()
                 else:
-                    mes = "No synoptic tabs for %s" % \
-                          self.model_list.currentText()
+                    synTab, resultBool = tab.searchMainSynopticTab()
+                    if resultBool and hasattr(synTab, "cbManager"):
+                        synTab.suspendSelectionCallback()
+                    tab.hide()
+        finally:
+            self.tabs.blockSignals(False)
 
-                    pm.displayWarning(mes)
+    def retargetCachedTab(
+            self,
+            tabName: str) -> Optional["SynopticTabWrapper"]:
+        """Return the cached tab retargeted to the current model.
+
+        Args:
+            tabName (str): Synoptic tab name
+
+        Returns:
+            SynopticTabWrapper: The cached tab, None if it was never built
+        """
+
+        tab = self._tabCache.get(tabName)
+        if tab is None:
+            return None
+
+        synTab, resultBool = tab.searchMainSynopticTab()
+        if resultBool:
+            synTab.invalidateButtonIndex()
+            synTab.resumeSelectionCallback()
+            synTab.selectChanged()
 
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
+        return tab
+
+    def ensureTabBuilt(self, index: int) -> bool:
+        """Replace the placeholder at index with the actual synoptic tab.
+
+        Args:
+            index (int): Index of the page in the tab widget
+
+        Returns:
+            bool: True if a synoptic tab was built
+        """
+
+        placeholder = self.tabs.widget(index)
+        if not isinstance(placeholder, SynopticTabPlaceholder):
+            return False
+
+        tab_name = placeholder.tabName
+        try:
+            # instantiate SynopticTab widget
+            module = importTab(tab_name)
+            synoptic_tab = module.SynopticTab()
 
-                mes = "Synoptic tab: %s Loading fail {0}\n{1}".format(
-                    tab_name, e)
+            # set minimum size for auto fit (stretch) scroll area
+            if synoptic_tab.minimumHeight() == 0:
+                synoptic_tab.setMinimumHeight(synoptic_tab.height())
+            if synoptic_tab.minimumWidth() == 0:
+                synoptic_tab.setMinimumWidth(synoptic_tab.width())
 
-                pm.displayError(mes)
+            # store tab size for set container size later
+            self._tabSizes[tab_name] = (synoptic_tab.minimumWidth(),
+                                        synoptic_tab.minimumHeight())
+
+            tab = self.wrapTabContents(synoptic_tab)
+
+        except Exception as e:
+            traceback.print_exc()
+
+            mes = "Synoptic tab: %s Loading fail {0}\n{1}".format(
+                tab_name, e)
+
+            pm.displayError(mes)
+            return False
+
+        self._tabCache[tab_name] = tab
+
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, tab, tab_name)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+
+        placeholder.close()
+        return True
+
+    def onTabChanged(self, index: int) -> None:
+
+        if index < 0:
+            return
+
+        start = time.perf_counter()
+        if not self.ensureTabBuilt(index):
+            return
+
+        self.fitToTabs(grow_only=True)
+        mes = "Synoptic tab {0} built in {1:.3f} sec".format(
+            self.tabs.tabText(index), time.perf_counter() - start)
+        mgear.log(mes, mgear.sev_info)
+
+    def countPlaceholders(self) -> int:
+
+        return len([i for i in range(self.tabs.count())
+                    if isinstance(self.tabs.widget(i), SynopticTabPlaceholder)])
+
+    def fitToTabs(self, grow_only: bool = False) -> None:
+        """Resize the dialog to the largest tab built so far.
+
+        Args:
+            grow_only (bool, optional): Only resize if the dialog would grow
+        """
+
+        max_h = 0
+        max_w = 0
+        for i in range(self.tabs.count()):
+            w, h = self._tabSizes.get(self.tabs.tabText(i), (0, 0))
+            max_h = h if max_h < h else max_h
+            max_w = w if max_w < w else max_w
 
         max_h = self.default_height if max_h == 0 else max_h
         max_w = self.default_width if max_w == 0 else max_w
         header_space = 45
-        self.resize(max_w + self.margin, max_h + self.margin + header_space)
+        width = max_w + self.margin
+        height = max_h + self.margin + header_space
+
+        if grow_only:
+            if width <= self.width() and height <= self.height():
+                return
+            width = max(width, self.width())
+            height = max(height, self.height())
+
+        self.resize(width, height)
 
     def wrapTabContents(self, synoptic_tab: QtWidgets.QWidget) -> QtWidgets.QWidget:
 
@@ -309,6 +472,19 @@ class Synoptic(MayaQWidgetDockableMixin, QtWidgets.QDialog):
         return wrapperWidget
 
 
+class SynopticTabPlaceholder(QtWidgets.QWidget):
+    """Empty page standing in for a synoptic tab until it is displayed."""
+
+    def __init__(
+            self,
+            tabName: str,
+            parent: Optional[QtWidgets.QWidget] = None) -> None:
+
+        super(SynopticTabPlaceholder, self).__init__(parent)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.tabName = tabName
+
+
 class SynopticTabWrapper(QtWidgets.QWidget):
     """Class for handling mouse rubberband Selection
 
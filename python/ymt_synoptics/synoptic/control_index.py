@@ -0,0 +1,263 @@
+"""Cached, ranked search over the controls of a rig.
+
+The control lister used to crawl the controllers set with one cmds.sets call
+per nested set on every refresh, and to substring-scan every control name on
+each keystroke. ControlIndex reads the flattened set membership once per rig
+and keeps a trigram index of the lower cased control names. Maya callbacks
+(scene open/new/import/reference changes and membership changes of the
+crawled sets) only mark the index dirty, it is rebuilt by the next query.
+
+Ranking of a query token:
+    1. substring matches, earlier and shorter names first
+    2. fuzzy matches, where the token characters appear in order (tokens
+       of three characters or more). Only names sharing at least one
+       trigram with the token are scored, so a name containing the token
+       characters in order but no three of them consecutively is not found.
+"""
+from typing import Dict, List, Optional, Set, Tuple
+
+import maya.api.OpenMaya as om
+
+from . import utils
+
+_SCENE_MESSAGES = (
+    "kAfterNew",
+    "kAfterOpen",
+    "kAfterImport",
+    "kAfterCreateReference",
+    "kAfterRemoveReference",
+    "kAfterLoadReference",
+    "kAfterUnloadReference",
+)
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def fuzzyScore(token: str, name: str) -> Optional[int]:
+    """Score of the characters of token appearing in order in name.
+
+    Consecutive characters and characters starting a name part ("_" separated)
+    score higher. Returns None when token is not a subsequence of name.
+    """
+
+    score = 0
+    pos = -1
+    for ch in token:
+        found = name.find(ch, pos + 1)
+        if found < 0:
+            return None
+        if found == pos + 1:
+            score += 3
+        if found == 0 or name[found - 1] in "_:|":
+            score += 2
+        score -= found - pos - 1
+        pos = found
+
+    return score
+
+
+def splitNamespace(token: str) -> Tuple[Optional[str], str]:
+    """Split "ns:ctl" into ("ns", "ctl"), (None, "ctl") without namespace."""
+
+    if ":" not in token:
+        return None, token
+    namespace, _, name = token.rpartition(":")
+    return namespace, name
+
+
+class ControlIndex(object):
+    """Controls of the controllers set of one rig, see the module doc."""
+
+    def __init__(self, controllerSet: str) -> None:
+        self.controllerSet = controllerSet
+        self.namespace = ""
+        self.names = []  # type: List[str]
+        self._lowerNames = []  # type: List[str]
+        self._trigrams = {}  # type: Dict[str, Set[int]]
+        self._callbacks = []  # type: List[int]
+        self._dirty = True
+        self.builds = 0
+
+    # ============================================
+    # BUILD
+    def invalidate(self, *args: object) -> None:
+        self._dirty = True
+
+    def _getSetMembers(self) -> Tuple[List[str], List[om.MObject]]:
+
+        sel = om.MSelectionList()
+        try:
+            sel.add(self.controllerSet)
+        except RuntimeError:
+            return [], []
+
+        # flattened membership in a single query, the nested sets are
+        # collected only to watch their membership
+        setObj = sel.getDependNode(0)
+        members = om.MFnSet(setObj).getMembers(True).getSelectionStrings()
+
+        sets = [setObj]
+        stack = [setObj]
+        while stack:
+            nested = om.MFnSet(stack.pop()).getMembers(False)
+            for i in range(nested.length()):
+                obj = nested.getDependNode(i)
+                if obj.hasFn(om.MFn.kSet):
+                    sets.append(obj)
+                    stack.append(obj)
+
+        return members, sets
+
+    def _removeCallbacks(self) -> None:
+        for callbackId in self._callbacks:
+            try:
+                om.MMessage.removeCallback(callbackId)
+            except RuntimeError:
+                # registered on a set which has been deleted since
+                pass
+        self._callbacks = []
+
+    def _addCallbacks(self, sets: List[om.MObject]) -> None:
+
+        for message in _SCENE_MESSAGES:
+            self._callbacks.append(om.MSceneMessage.addCallback(
+                getattr(om.MSceneMessage, message), self.invalidate))
+
+        for setObj in sets:
+            self._callbacks.append(
+                om.MObjectSetMessage.addSetMembersModifiedCallback(
+                    setObj, self.invalidate))
+            self._callbacks.append(
+                om.MNodeMessage.addNodePreRemovalCallback(
+                    setObj, self.invalidate))
+
+    def rebuild(self) -> None:
+        """Read the set membership and rebuild the index."""
+
+        self._removeCallbacks()
+
+        members, sets = self._getSetMembers()
+        self.namespace = utils.getNamespace(self.controllerSet) or ""
+        self.names = sorted(set(utils.stripNamespace(x) for x in members))
+        self._lowerNames = [x.lower() for x in self.names]
+
+        index = {}  # type: Dict[str, Set[int]]
+        for i, name in enumerate(self._lowerNames):
+            for tri in trigrams(name):
+                index.setdefault(tri, set()).add(i)
+        self._trigrams = index
+
+        self._addCallbacks(sets)
+        # without the set there is nothing to watch, look again next time
+        self._dirty = not sets
+        self.builds += 1
+
+    def ensure(self) -> None:
+        if self._dirty:
+            self.rebuild()
+
+    def dispose(self) -> None:
+        self._removeCallbacks()
+        self._dirty = True
+
+    # ============================================
+    # QUERY
+    def _namespaceMatches(self, namespace: Optional[str]) -> bool:
+        if not namespace:
+            return True
+        return namespace.lower() in self.namespace.lower()
+
+    def _candidates(self, token: str) -> Optional[Set[int]]:
+        """Rows that may contain token, None when every row may."""
+
+        if len(token) < 3:
+            return None
+
+        candidates = None
+        for tri in trigrams(token):
+            rows = self._trigrams.get(tri)
+            if not rows:
+                return set()
+            candidates = set(rows) if candidates is None else candidates & rows
+        return candidates
+
+    def _fuzzyCandidates(self, token: str) -> Set[int]:
+        """Rows sharing at least one trigram with token."""
+
+        candidates = set()  # type: Set[int]
+        for tri in trigrams(token):
+            candidates.update(self._trigrams.get(tri, ()))
+        return candidates
+
+    def searchToken(self, token: str) -> List[str]:
+        """Ranked control names (without namespace) matching one token.
+
+        Fuzzy scoring is limited to names sharing a trigram with the token.
+        """
+
+        self.ensure()
+
+        namespace, token = splitNamespace(token.strip().lower())
+        if not self._namespaceMatches(namespace):
+            return []
+        if not token:
+            return list(self.names)
+
+        substring = []
+        candidates = self._candidates(token)
+        rows = range(len(self.names)) if candidates is None else candidates
+        for i in rows:
+            pos = self._lowerNames[i].find(token)
+            if pos >= 0:
+                substring.append((pos, len(self.names[i]), self.names[i], i))
+        substring.sort()
+
+        names = [entry[2] for entry in substring]
+        if len(token) < 3:
+            # one or two letters are in order in nearly every name
+            return names
+
+        matched = {entry[3] for entry in substring}
+        fuzzy = []
+        for i in self._fuzzyCandidates(token) - matched:
+            name = self._lowerNames[i]
+            score = fuzzyScore(token, name)
+            if score is not None:
+                fuzzy.append((-score, len(name), self.names[i]))
+        fuzzy.sort()
+
+        return names + [entry[2] for entry in fuzzy]
+
+    def search(self, userInput: str) -> List[str]:
+        """Ranked names matching any of the comma separated tokens."""
+
+        results = []
+        seen = set()
+        for token in userInput.replace(" ", "").split(","):
+            for name in self.searchToken(token):
+                if name not in seen:
+                    seen.add(name)
+                    results.append(name)
+        return results
+
+
+# controller set name -> ControlIndex
+_INDEXES = {}  # type: Dict[str, ControlIndex]
+
+
+def getControlIndex(model: object) -> ControlIndex:
+    """Cached index of the controllers set of model."""
+
+    controllerSet = "{0}{1}".format(model, utils.CTRL_GRP_SUFFIX)
+    index = _INDEXES.get(controllerSet)
+    if index is None:
+        index = _INDEXES[controllerSet] = ControlIndex(controllerSet)
+    return index
+
+
+def clearControlIndexes() -> None:
+    for index in _INDEXES.values():
+        index.dispose()
+    _INDEXES.clear()
@@ -0,0 +1,377 @@
+"""Per rig mirror map for mirrorPose and animation mirroring.
+
+gatherMirrorData / calculateMirrorData query every attribute of every
+control (attributeQuery, invert and pivot check attributes) each time a pose
+is mirrored. A MirrorMap resolves this once per control and keeps it for the
+rig, keyed by the rig root node:
+
+    - the opposite control
+    - per mirrored channel: the opposite attribute, invert flag, pivot
+      offset, value kind and ui unit factor
+
+Mirroring is then one read pass over cached plugs and one write pass, see
+mirrorPose and mirrorAnimation. The maps are dropped on scene open/new and
+reference changes, call clearMirrorMaps after editing the inv* / invPivot*
+attributes of a rig.
+"""
+from __future__ import annotations
+
+import importlib
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+try:
+    pm = importlib.import_module("mgear.pymaya")
+except ImportError:
+    pm = importlib.import_module("pymel.core")
+
+import mgear
+import mgear.core.anim_utils as anim_utils
+from ymt_shifter_utility.bake_util import keyChannel
+from ymt_shifter_utility.type_protocols import AttrValue, DagNodeLike
+
+try:
+    node_utils = importlib.import_module("gml_maya.node")
+except ImportError:
+    node_utils = importlib.import_module("gml_maya.util.node_util")
+
+
+_SCENE_MESSAGES = (
+    "kAfterNew",
+    "kAfterOpen",
+    "kAfterCreateReference",
+    "kAfterRemoveReference",
+    "kAfterLoadReference",
+    "kAfterUnloadReference",
+)
+
+
+def getPivotCheckButtonAttrName(attrName: str) -> str:
+    return "invPivot{0}".format(attrName.lower().capitalize())
+
+
+def _nodeName(node: object) -> str:
+    name = getattr(node, "name", None)
+    return name() if callable(name) else str(node)
+
+
+def _findPlug(name: str) -> om.MPlug | None:
+    sel = om.MSelectionList()
+    try:
+        sel.add(name)
+        return sel.getPlug(0)
+    except RuntimeError:
+        return None
+
+
+def _plugKind(plug: om.MPlug) -> tuple[str, float, int]:
+    """Value kind ("float", "int", "bool" or None when not mirrored), the
+    internal to ui unit factor and the anim curve type of the plug.
+    """
+
+    attr = plug.attribute()
+    if attr.hasFn(om.MFn.kUnitAttribute):
+        unitType = om.MFnUnitAttribute(attr).unitType()
+        if unitType == om.MFnUnitAttribute.kAngle:
+            return ("float",
+                    om.MAngle(1.0, om.MAngle.kRadians).asUnits(om.MAngle.uiUnit()),
+                    oma.MFnAnimCurve.kAnimCurveTA)
+        if unitType == om.MFnUnitAttribute.kDistance:
+            return ("float",
+                    om.MDistance(1.0, om.MDistance.kCentimeters).asUnits(om.MDistance.uiUnit()),
+                    oma.MFnAnimCurve.kAnimCurveTL)
+        return ("float", 1.0, oma.MFnAnimCurve.kAnimCurveTU)
+
+    if attr.hasFn(om.MFn.kEnumAttribute):
+        return ("int", 1.0, oma.MFnAnimCurve.kAnimCurveTU)
+
+    if attr.hasFn(om.MFn.kNumericAttribute):
+        numericType = om.MFnNumericAttribute(attr).numericType()
+        if numericType == om.MFnNumericData.kBoolean:
+            return ("bool", 1.0, oma.MFnAnimCurve.kAnimCurveTU)
+        if numericType in (om.MFnNumericData.kByte,
+                           om.MFnNumericData.kChar,
+                           om.MFnNumericData.kShort,
+                           om.MFnNumericData.kInt):
+            return ("int", 1.0, oma.MFnAnimCurve.kAnimCurveTU)
+        return ("float", 1.0, oma.MFnAnimCurve.kAnimCurveTU)
+
+    return (None, 1.0, oma.MFnAnimCurve.kAnimCurveTU)
+
+
+def _readPlug(plug: om.MPlug, kind: str, toUi: float) -> AttrValue:
+    if kind == "bool":
+        return plug.asBool()
+    if kind == "int":
+        return plug.asInt()
+    return plug.asDouble() * toUi
+
+
+class MirrorChannel(object):
+    """One mirrored attribute of a control."""
+
+    __slots__ = ("attr", "targetAttr", "inv", "pivot", "kind", "toUi", "curveType")
+
+    def __init__(self, attr: str, targetAttr: str, inv: int, pivot: float, kind: str, toUi: float, curveType: int) -> None:
+        self.attr = attr
+        self.targetAttr = targetAttr
+        self.inv = inv
+        self.pivot = pivot
+        self.kind = kind
+        self.toUi = toUi
+        self.curveType = curveType
+
+    def mirrorValue(self, value: AttrValue) -> AttrValue:
+        if self.kind == "float":
+            return (value + self.pivot) * self.inv
+        return value * self.inv
+
+
+class MirrorControl(object):
+    """Opposite control and mirrored channels of a control."""
+
+    def __init__(self, name: str, target: str, channels: list[MirrorChannel]) -> None:
+        self.name = name
+        self.target = target
+        self.channels = channels
+
+
+class MirrorMap(object):
+    """Mirror data of the controls of one rig, resolved once per control."""
+
+    def __init__(self, nameSpace: str) -> None:
+        self.nameSpace = nameSpace
+        self.controls = {}  # type: dict[str, MirrorControl]
+        self._plugs = {}  # type: dict[str, tuple[om.MPlug, bool] | None]
+
+    def fullName(self, name: str) -> str:
+        return ":".join([self.nameSpace, name])
+
+    def plug(self, name: str) -> tuple[om.MPlug, bool] | None:
+        """Cached (plug, keyable) of "node.attr", None if it does not exist."""
+
+        if name not in self._plugs:
+            plug = _findPlug(name)
+            self._plugs[name] = None if plug is None else (plug, plug.isKeyable)
+        return self._plugs[name]
+
+    def control(self, node: DagNodeLike) -> MirrorControl:
+        """Mirror data of node, computed on first use."""
+
+        nodeName = _nodeName(node)
+        name = anim_utils.stripNamespace(nodeName).split("|")[-1]
+        control = self.controls.get(name)
+        if control is None:
+            control = self.controls[name] = self._buildControl(nodeName, name)
+        return control
+
+    def _buildControl(self, nodeName: str, name: str) -> MirrorControl:
+
+        if anim_utils.isSideElement(nodeName):
+            target = anim_utils.swapSideLabel(name)
+        else:
+            target = name
+
+        srcNode = pm.PyNode(nodeName)
+        channels = []
+        for attrName in anim_utils.listAttrForMirror(srcNode):
+
+            full_path = "{}.{}".format(nodeName, attrName)
+            if node_utils.is_proxy_attribute(full_path):
+                continue
+
+            plug = self.plug(full_path)
+            if plug is None:
+                continue
+            kind, toUi, curveType = _plugKind(plug[0])
+            if kind is None:
+                continue
+
+            # "invTx" for "tx", straight if it does not exist
+            inv = 1
+            invCheck = self.plug("{}.{}".format(
+                nodeName, anim_utils.getInvertCheckButtonAttrName(attrName)))
+            if invCheck is not None and invCheck[1] and invCheck[0].asBool():
+                inv = -1
+
+            # "invPivotTx" for "tx", no offset if it does not exist
+            pivot = 0.
+            pivotCheck = self.plug("{}.{}".format(
+                nodeName, getPivotCheckButtonAttrName(attrName)))
+            if pivotCheck is not None and pivotCheck[1]:
+                pivot = pivotCheck[0].asDouble()
+
+            # if attr name is side specified, record inverted attr name
+            if anim_utils.isSideElement(attrName):
+                targetAttr = anim_utils.swapSideLabel(attrName)
+            else:
+                targetAttr = attrName
+
+            channels.append(MirrorChannel(
+                attrName, targetAttr, inv, pivot, kind, toUi, curveType))
+
+        return MirrorControl(name, target, channels)
+
+    def writablePlug(self, name: str) -> om.MPlug | None:
+        """Plug of "node.attr" if it exists, is keyable, unlocked and not
+        driven by anything but an anim curve.
+        """
+
+        plug = self.plug(name)
+        if plug is None or not plug[1] or plug[0].isLocked:
+            return None
+
+        # connections are not cached, a constraint may have been added since
+        source = plug[0].source()
+        if not source.isNull and not source.node().hasFn(om.MFn.kAnimCurve):
+            return None
+        return plug[0]
+
+    def plan(self, nodes: list[DagNodeLike], flip: bool = False) -> list[tuple[str, MirrorChannel, str, str]]:
+        """(read plug, channel, write plug, node) of each mirrored value,
+        in the order of gatherMirrorData.
+        """
+
+        res = []
+        for node in nodes:
+            control = self.control(node)
+            src = self.fullName(control.name)
+            target = self.fullName(control.target)
+            if target == src:
+                doFlip = False
+            else:
+                doFlip = flip
+                if self.plug(target + ".message") is None:
+                    mgear.log("Can't find object : {}".format(target), mgear.sev_error)
+                    continue
+
+            for channel in control.channels:
+                if doFlip:
+                    res.append(("{}.{}".format(target, channel.attr), channel,
+                                "{}.{}".format(src, channel.targetAttr), src))
+                res.append(("{}.{}".format(src, channel.attr), channel,
+                            "{}.{}".format(target, channel.targetAttr), target))
+
+        return res
+
+
+def _removeCallbacks() -> None:
+    for callbackId in _CALLBACKS:
+        try:
+            om.MMessage.removeCallback(callbackId)
+        except RuntimeError:
+            pass
+    del _CALLBACKS[:]
+
+
+# a reload runs this module again in the same namespace, remove the
+# callbacks of the previous run before their ids are dropped
+if "_CALLBACKS" in globals():
+    _removeCallbacks()
+
+# rig root MObjectHandle hash -> (handle, MirrorMap)
+_MIRROR_MAPS = {}  # type: dict[int, tuple[om.MObjectHandle, MirrorMap]]
+_CALLBACKS = []  # type: list[int]
+
+
+def clearMirrorMaps(*args: object) -> None:
+    _MIRROR_MAPS.clear()
+
+
+def _ensureCallbacks() -> None:
+    if _CALLBACKS:
+        return
+    for message in _SCENE_MESSAGES:
+        _CALLBACKS.append(om.MSceneMessage.addCallback(
+            getattr(om.MSceneMessage, message), clearMirrorMaps))
+
+
+def _getRigRoot(nodeName: str) -> om.MObject:
+    sel = om.MSelectionList()
+    sel.add(nodeName)
+    path = sel.getDagPath(0)
+    path.pop(path.length() - 1)
+    return path.node()
+
+
+def getMirrorMap(node: DagNodeLike) -> MirrorMap:
+    """The cached mirror map of the rig node belongs to."""
+
+    _ensureCallbacks()
+
+    nodeName = _nodeName(node)
+    root = _getRigRoot(nodeName)
+    handle = om.MObjectHandle(root)
+    key = handle.hashCode()
+
+    entry = _MIRROR_MAPS.get(key)
+    if entry is None or not entry[0].isValid():
+        entry = _MIRROR_MAPS[key] = (handle, MirrorMap(anim_utils.getNamespace(nodeName)))
+
+    return entry[1]
+
+
+def _groupByRig(nodes: list[DagNodeLike]) -> list[tuple[MirrorMap, list[DagNodeLike]]]:
+    groups = {}  # type: dict[int, tuple[MirrorMap, list[DagNodeLike]]]
+    for node in nodes:
+        mirrorMap = getMirrorMap(node)
+        groups.setdefault(id(mirrorMap), (mirrorMap, []))[1].append(node)
+    return list(groups.values())
+
+
+def mirrorPose(nodes: list[DagNodeLike], flip: bool = False) -> None:
+    """Mirror or flip the pose of nodes, reading every value before writing."""
+
+    writes = []
+    for mirrorMap, rigNodes in _groupByRig(nodes):
+        for readName, channel, writeName, _ in mirrorMap.plan(rigNodes, flip):
+            readPlug = mirrorMap.plug(readName)
+            if readPlug is None or mirrorMap.writablePlug(writeName) is None:
+                continue
+            value = _readPlug(readPlug[0], channel.kind, channel.toUi)
+            writes.append((writeName, channel.mirrorValue(value)))
+
+    for writeName, value in writes:
+        try:
+            cmds.setAttr(writeName, value)
+        except RuntimeError:
+            mgear.log("applyMirror failed: {0}: {1}".format(writeName, value), mgear.sev_error)
+
+
+def mirrorAnimation(nodes: list[DagNodeLike], startFrame: float, endFrame: float, flip: bool = False) -> None:
+    """Mirror or flip the animation of nodes over a frame range.
+
+    Every frame is evaluated through a DG context without moving the time
+    slider, then each written channel is keyed in one go on all frames.
+    """
+
+    frames = [float(x) for x in range(int(startFrame), int(endFrame) + 1)]
+    if not frames:
+        return
+
+    plans = []
+    for mirrorMap, rigNodes in _groupByRig(nodes):
+        for readName, channel, writeName, _ in mirrorMap.plan(rigNodes, flip):
+            readPlug = mirrorMap.plug(readName)
+            if readPlug is None or mirrorMap.writablePlug(writeName) is None:
+                continue
+            plans.append((readPlug[0], channel, writeName))
+
+    values = [[] for _ in plans]  # type: list[list[float]]
+    unit = om.MTime.uiUnit()
+    for frame in frames:
+        context = om.MDGContext(om.MTime(frame, unit))
+        previous = context.makeCurrent()
+        try:
+            for i, (plug, channel, _) in enumerate(plans):
+                value = channel.mirrorValue(_readPlug(plug, channel.kind, channel.toUi))
+                values[i].append(float(value) / channel.toUi)
+        finally:
+            previous.makeCurrent()
+
+    for (_, channel, writeName), channelValues in zip(plans, values):
+        try:
+            keyChannel(writeName, channel.curveType, frames, channelValues)
+        except RuntimeError:
+            mgear.log("mirrorAnimation failed: {0}".format(writeName), mgear.sev_error)
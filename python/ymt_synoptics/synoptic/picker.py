@@ -0,0 +1,407 @@
+"""Data driven picker canvas.
+
+A PickerCanvas paints every select button of a layout description in one
+paintEvent instead of instantiating a SelectButton widget per control. The
+layout is the json (or yaml, when PyYAML is available) produced by
+``picker_convert.py`` from the generated ``widget.py`` modules::
+
+    {
+        "version": 1,
+        "size": [338, 700],
+        "items": [
+            {"name": "arm_L0_fk1_ctl", "style": "SelectBtn_RFkBox",
+             "rect": [244, 207, 20, 15], "objects": ["arm_L0_fk1_ctl"]}
+        ]
+    }
+
+"style" is a key of widgets.SELECTORS. An item can also give "shape" (see
+SHAPES) and "color" ([r, g, b, a]) directly, which take precedence.
+
+Items are looked up through a uniform grid, so hover and clicks only test
+the few items in the cell under the cursor.
+"""
+import json
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from mgear.vendor.Qt import QtCore, QtWidgets, QtGui
+
+from . import utils, widgets
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+LAYOUT_VERSION = 1
+CELL_SIZE = 32
+
+
+##################################################
+# SHAPES
+##################################################
+# Same geometry as the drawShape of the SelectBtn_* drawing classes, built
+# for a rectangle in canvas coordinates.
+
+
+def _innerRect(rect, borderWidth=1):
+    # type: (QtCore.QRectF, float) -> QtCore.QRectF
+    half = borderWidth / 2.0
+    return QtCore.QRectF(rect.x() + half,
+                         rect.y() + half,
+                         rect.width() - borderWidth,
+                         rect.height() - borderWidth)
+
+
+def _boxPath(rect):
+    # type: (QtCore.QRectF) -> QtGui.QPainterPath
+    rr = min(rect.width(), rect.height()) * 0.20
+    path = QtGui.QPainterPath()
+    path.addRoundedRect(_innerRect(rect), rr, rr)
+    return path
+
+
+def _outlineBoxPath(rect):
+    # type: (QtCore.QRectF) -> QtGui.QPainterPath
+    outer = _innerRect(rect)
+    rr = min(rect.width(), rect.height()) * 0.20
+    ow = min(rect.width(), rect.height()) * 0.33
+
+    pathOuter = QtGui.QPainterPath()
+    pathOuter.addRoundedRect(outer, rr, rr)
+    pathInner = QtGui.QPainterPath()
+    pathInner.addRoundedRect(outer.adjusted(ow, ow, -ow, -ow), rr * 0.2, rr * 0.2)
+
+    return pathOuter - pathInner
+
+
+def _circlePath(rect):
+    # type: (QtCore.QRectF) -> QtGui.QPainterPath
+    path = QtGui.QPainterPath()
+    path.addEllipse(_innerRect(rect))
+    return path
+
+
+def _outlineCirclePath(rect):
+    # type: (QtCore.QRectF) -> QtGui.QPainterPath
+    outer = _innerRect(rect)
+    ow = min(rect.width(), rect.height()) * 0.25
+
+    path = QtGui.QPainterPath()
+    path.addEllipse(outer)
+    pathInner = QtGui.QPainterPath()
+    pathInner.addEllipse(outer.adjusted(ow, ow, -ow, -ow))
+
+    return path - pathInner
+
+
+def _trianglePath(rect, pointLeft):
+    # type: (QtCore.QRectF, bool) -> QtGui.QPainterPath
+    x, y = rect.x(), rect.y()
+    w = rect.width() - 1
+    h = rect.height() - 1
+
+    if pointLeft:
+        points = [(1, h / 2), (w - 1, 0), (w - 1, h - 1)]
+    else:
+        points = [(-1, 0), (-1, h - 1), (w - 1, h / 2)]
+
+    path = QtGui.QPainterPath()
+    path.addPolygon(QtGui.QPolygonF(
+        [QtCore.QPointF(x + px, y + py) for px, py in points]))
+    path.closeSubpath()
+    return path
+
+
+SHAPES = {
+    "box": _boxPath,
+    "outlineBox": _outlineBoxPath,
+    "circle": _circlePath,
+    "outlineCircle": _outlineCirclePath,
+    "triangleLeft": lambda rect: _trianglePath(rect, True),
+    "triangleRight": lambda rect: _trianglePath(rect, False),
+}  # type: Dict[str, Callable[[QtCore.QRectF], QtGui.QPainterPath]]
+
+# drawing class of widgets.SELECTORS -> SHAPES key
+_SHAPE_OF_DRAW_CLASS = {
+    widgets.SelectBtn_Box: "box",
+    widgets.SelectBtn_OutlineBox: "outlineBox",
+    widgets.SelectBtn_Circle: "circle",
+    widgets.SelectBtn_OutlineCircle: "outlineCircle",
+    widgets.SelectBtn_TriangleLeft: "triangleLeft",
+    widgets.SelectBtn_OutlineTriangleLeft: "triangleLeft",
+    widgets.SelectBtn_TriangleRight: "triangleRight",
+    widgets.SelectBtn_OutlineTriangleRight: "triangleRight",
+}
+
+
+def resolveStyle(style):
+    # type: (str) -> Tuple[str, QtGui.QColor]
+    """Return the shape key and color of a widgets.SELECTORS entry."""
+
+    try:
+        colorClass, drawClass = widgets.SELECTORS[style]
+    except KeyError:
+        raise ValueError("unknown picker style: {}".format(style))
+
+    shape = _SHAPE_OF_DRAW_CLASS.get(drawClass)
+    if shape is None:
+        raise ValueError("picker style is not paintable: {}".format(style))
+
+    return shape, QtGui.QColor(colorClass.color)
+
+
+def loadLayout(path):
+    # type: (str) -> dict
+    """Read a layout from a json or yaml file."""
+
+    with open(path, "r", encoding="utf-8") as f:
+        if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+            if yaml is None:
+                raise RuntimeError("PyYAML is needed to read {}".format(path))
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+##################################################
+# ITEMS
+##################################################
+
+
+class PickerItem(object):
+    """One select button of a PickerCanvas.
+
+    It has the paintSelected / rectangleSelection methods of SelectButton so
+    the synoptic tab can drive both the same way.
+    """
+
+    def __init__(self, canvas, name, objects, rect, shape, color, visible=True):
+        # type: (PickerCanvas, str, List[str], QtCore.QRectF, str, QtGui.QColor, bool) -> None
+        self.canvas = canvas
+        self.name = name
+        self.objects = objects
+        self.rect = rect
+        self.shape = shape
+        self.color = color
+        self.visible = visible
+        self.path = SHAPES[shape](rect)
+        self.selected = False
+
+    def paintSelected(self, paint=False):
+        # type: (bool) -> None
+        if self.selected != bool(paint):
+            self.selected = bool(paint)
+            self.canvas.updateItem(self)
+
+    def rectangleSelection(self, event, firstLoop):
+        # type: (QtGui.QMouseEvent, bool) -> None
+        if firstLoop or event.modifiers():
+            key_modifier = event.modifiers()
+        else:
+            key_modifier = (QtCore.Qt.ControlModifier
+                            | QtCore.Qt.ShiftModifier)
+
+        model = utils.getModel(self.canvas)
+        utils.selectObj(model, self.objects, event.button(), key_modifier)
+
+
+##################################################
+# CANVAS
+##################################################
+
+
+class PickerCanvas(QtWidgets.QWidget):
+    """Paints and hit tests the select buttons of a picker layout."""
+
+    color_over = QtGui.QColor(255, 255, 255, 255)
+    color_selected = QtGui.QColor(255, 255, 255, 255)
+
+    def __init__(self, parent=None):
+        # type: (Optional[QtWidgets.QWidget]) -> None
+        super(PickerCanvas, self).__init__(parent)
+        self.setMouseTracking(True)
+        self.defaultBGColor = QtGui.QPalette().color(self.backgroundRole())
+
+        self._items = []  # type: List[PickerItem]
+        self._grid = {}  # type: Dict[Tuple[int, int], List[PickerItem]]
+        self._size = QtCore.QSize()
+        self._over = None  # type: Optional[PickerItem]
+
+    # ============================================
+    # LAYOUT
+    def loadLayout(self, layout):
+        # type: (Union[str, dict]) -> None
+        """Load a layout from a file path or an already parsed dict."""
+
+        if not isinstance(layout, dict):
+            layout = loadLayout(layout)
+
+        version = layout.get("version", LAYOUT_VERSION)
+        if version > LAYOUT_VERSION:
+            raise ValueError(
+                "picker layout version {} is newer than {}".format(
+                    version, LAYOUT_VERSION))
+
+        items = []
+        for entry in layout.get("items", []):
+            shape, color = None, None
+            if "style" in entry:
+                shape, color = resolveStyle(entry["style"])
+            if "shape" in entry:
+                shape = entry["shape"]
+            if "color" in entry:
+                color = QtGui.QColor(*entry["color"])
+
+            if shape is None or color is None:
+                raise ValueError(
+                    "picker item {} has no style, shape or color".format(
+                        entry.get("name")))
+
+            objects = entry["objects"]
+            if isinstance(objects, str):
+                objects = objects.split(",")
+
+            items.append(PickerItem(self,
+                                    entry.get("name", objects[0]),
+                                    list(objects),
+                                    QtCore.QRectF(*entry["rect"]),
+                                    shape,
+                                    color,
+                                    entry.get("visible", True)))
+
+        self._items = items
+        self._over = None
+        self._buildGrid()
+
+        if "size" in layout:
+            self._size = QtCore.QSize(*layout["size"])
+        else:
+            bounds = QtCore.QRectF()
+            for item in items:
+                bounds = bounds.united(item.rect)
+            corner = bounds.toAlignedRect().bottomRight()
+            self._size = QtCore.QSize(corner.x() + 1, corner.y() + 1)
+
+        self.updateGeometry()
+        self.update()
+
+    def _buildGrid(self):
+        # type: () -> None
+        grid = {}  # type: Dict[Tuple[int, int], List[PickerItem]]
+        for item in self._items:
+            if not item.visible:
+                continue
+            for cell in self._cells(item.rect):
+                grid.setdefault(cell, []).append(item)
+        self._grid = grid
+
+    @staticmethod
+    def _cells(rect):
+        # type: (QtCore.QRectF) -> Iterable[Tuple[int, int]]
+        x0 = int(rect.left() // CELL_SIZE)
+        x1 = int(rect.right() // CELL_SIZE)
+        y0 = int(rect.top() // CELL_SIZE)
+        y1 = int(rect.bottom() // CELL_SIZE)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
+
+    def items(self):
+        # type: () -> List[PickerItem]
+        return list(self._items)
+
+    def sizeHint(self):
+        # type: () -> QtCore.QSize
+        return self._size
+
+    # ============================================
+    # HIT TEST
+    def itemAt(self, pos):
+        # type: (Union[QtCore.QPoint, QtCore.QPointF]) -> Optional[PickerItem]
+        """Topmost item whose rectangle contains pos."""
+
+        pos = QtCore.QPointF(pos)
+        cell = (int(pos.x() // CELL_SIZE), int(pos.y() // CELL_SIZE))
+        for item in reversed(self._grid.get(cell, [])):
+            if item.rect.contains(pos):
+                return item
+        return None
+
+    def itemsInRect(self, rect):
+        # type: (Union[QtCore.QRect, QtCore.QRectF]) -> List[PickerItem]
+        """Items intersecting rect, in paint order."""
+
+        rect = QtCore.QRectF(rect)
+        found = set()
+        for cell in self._cells(rect):
+            for item in self._grid.get(cell, []):
+                if item.rect.intersects(rect):
+                    found.add(item)
+        return [item for item in self._items if item in found]
+
+    # ============================================
+    # PAINT
+    def updateItem(self, item):
+        # type: (PickerItem) -> None
+        self.update(item.rect.toAlignedRect().adjusted(-1, -1, 1, 1))
+
+    def paintEvent(self, event):
+        # type: (QtGui.QPaintEvent) -> None
+        exposed = QtCore.QRectF(event.rect())
+
+        painter = QtGui.QPainter()
+        painter.begin(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+
+        for item in self._items:
+            if not item.visible or not item.rect.intersects(exposed):
+                continue
+
+            if item is self._over:
+                painter.setBrush(self.color_over)
+            else:
+                painter.setBrush(item.color)
+
+            if item.selected:
+                painter.setPen(QtGui.QPen(self.color_selected, 1))
+            else:
+                painter.setPen(QtGui.QPen(self.defaultBGColor, 1))
+
+            painter.drawPath(item.path)
+
+        painter.end()
+
+    # ============================================
+    # EVENTS
+    def _setOver(self, item):
+        # type: (Optional[PickerItem]) -> None
+        if item is self._over:
+            return
+
+        previous, self._over = self._over, item
+        if previous is not None:
+            self.updateItem(previous)
+        if item is not None:
+            self.updateItem(item)
+            QtWidgets.QToolTip.showText(QtGui.QCursor.pos(),
+                                        ",".join(item.objects))
+
+    def mouseMoveEvent(self, event):
+        # type: (QtGui.QMouseEvent) -> None
+        self._setOver(self.itemAt(event.pos()))
+        event.ignore()
+
+    def leaveEvent(self, event):
+        # type: (QtCore.QEvent) -> None
+        self._setOver(None)
+
+    def mousePressEvent(self, event):
+        # type: (QtGui.QMouseEvent) -> None
+        item = self.itemAt(event.pos())
+        if item is None:
+            # let the tab handle clicks on empty space
+            event.ignore()
+            return
+
+        model = utils.getModel(self)
+        utils.selectObj(model, item.objects, event.button(), event.modifiers())
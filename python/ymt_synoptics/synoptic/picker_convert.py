@@ -0,0 +1,237 @@
+"""Convert pyside-uic generated synoptic modules into picker layouts.
+
+The generated ``widget.py`` modules instantiate one SelectButton widget per
+control. This reads such a module with ``ast`` (nothing is imported or
+executed, so it runs outside Maya as well) and collects for every
+``SelectBtn_*`` widget its absolute rectangle, its selector style and the
+controls of its ``object`` property. The result is the layout format read
+by ``picker.PickerCanvas``::
+
+    {
+        "version": 1,
+        "size": [338, 700],
+        "items": [
+            {"name": "arm_L0_fk1_ctl", "style": "SelectBtn_RFkBox",
+             "rect": [244, 207, 20, 15], "objects": ["arm_L0_fk1_ctl"]},
+            ...
+        ]
+    }
+
+Usage::
+
+    python picker_convert.py ymt_quadruped/widget.py -o quadruped.json
+"""
+import argparse
+import ast
+import json
+import sys
+from typing import Dict, List, Optional, Tuple
+
+LAYOUT_VERSION = 1
+
+Rect = Tuple[int, int, int, int]
+
+
+class _WidgetInfo(object):
+
+    def __init__(self, name: str, klass: str, parent: Optional[str]) -> None:
+        self.name = name
+        self.klass = klass
+        self.parent = parent
+        self.rect = None  # type: Optional[Rect]
+        self.visible = True
+        self.properties = {}  # type: Dict[str, str]
+
+
+def _attrName(node: ast.AST) -> Optional[str]:
+    """Return "x" for ``self.x`` and the name for a bare name."""
+
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        if node.value.id == "self":
+            return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+
+def _calleeName(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _constant(node: ast.AST) -> object:
+    """Literal value of node, unwrapping the ``translate(ctx, text, ...)`` calls."""
+
+    if isinstance(node, ast.Call) and len(node.args) >= 2:
+        callee = _calleeName(node.func)
+        if callee in ("translate", "fakeTranslate"):
+            return _constant(node.args[1])
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return None
+
+
+def _rect(node: ast.AST) -> Optional[Rect]:
+    if isinstance(node, ast.Call) and _calleeName(node.func) == "QRect":
+        values = [_constant(a) for a in node.args]
+        if len(values) == 4 and all(isinstance(v, int) for v in values):
+            return tuple(values)  # type: ignore
+    return None
+
+
+def _collectWidgets(tree: ast.AST) -> Tuple[Dict[str, _WidgetInfo], List[str], Optional[Tuple[int, int]]]:
+
+    setupUi = None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name == "setupUi":
+            setupUi = node
+            break
+    if setupUi is None:
+        raise ValueError("setupUi not found, is this a generated widget module?")
+
+    rootName = setupUi.args.args[1].arg
+    widgets = {}  # type: Dict[str, _WidgetInfo]
+    order = []  # type: List[str]
+    size = None
+
+    for node in ast.walk(tree):
+        # self.b = SelectBtn_RFkBox(parent)
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+            name = _attrName(node.targets[0])
+            klass = _calleeName(node.value.func)
+            if not name or not klass:
+                continue
+            parent = _attrName(node.value.args[0]) if node.value.args else None
+            widgets[name] = _WidgetInfo(name, klass, None if parent == rootName else parent)
+            order.append(name)
+
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            owner = _attrName(node.func.value)
+            method = node.func.attr
+
+            if owner == rootName and method == "resize" and len(node.args) == 2:
+                size = (_constant(node.args[0]), _constant(node.args[1]))
+                continue
+
+            info = widgets.get(owner)  # type: ignore
+            if info is None or not node.args:
+                continue
+
+            if method == "setGeometry":
+                info.rect = _rect(node.args[0])
+            elif method in ("setVisible", "setHidden") and len(node.args) == 1:
+                value = bool(_constant(node.args[0]))
+                info.visible = value if method == "setVisible" else not value
+            elif method == "setProperty" and len(node.args) == 2:
+                key = _constant(node.args[0])
+                value = _constant(node.args[1])
+                if isinstance(key, str) and isinstance(value, str):
+                    info.properties[key] = value
+
+    return widgets, order, size  # type: ignore
+
+
+def _absoluteRect(widgets: Dict[str, _WidgetInfo], info: _WidgetInfo) -> Optional[Rect]:
+
+    if info.rect is None:
+        return None
+
+    x, y, w, h = info.rect
+    parent = info.parent
+    while parent:
+        parentInfo = widgets.get(parent)
+        if parentInfo is None or parentInfo.rect is None:
+            # parented to a layout managed widget, no fixed position
+            return None
+        x += parentInfo.rect[0]
+        y += parentInfo.rect[1]
+        parent = parentInfo.parent
+
+    return (x, y, w, h)
+
+
+def layoutFromSource(source: str, filename: str = "<widget>") -> Dict[str, object]:
+    """Build a picker layout from the source of a generated widget module.
+
+    Args:
+        source (str): Python source of the module
+        filename (str): Only used in error messages
+
+    Returns:
+        dict: The layout, with the widgets which could not be converted
+            listed under "skipped"
+    """
+
+    tree = ast.parse(source, filename)
+    widgets, order, size = _collectWidgets(tree)
+
+    items = []
+    skipped = []
+    for name in order:
+        info = widgets[name]
+        if not info.klass.startswith("SelectBtn_"):
+            continue
+
+        rect = _absoluteRect(widgets, info)
+        objects = info.properties.get("object")
+        if info.klass == "SelectBtn_StyleSheet" or rect is None or not objects:
+            skipped.append(name)
+            continue
+
+        item = {
+            "name": name,
+            "style": info.klass,
+            "rect": list(rect),
+            "objects": objects.split(","),
+        }  # type: Dict[str, object]
+        if not info.visible:
+            item["visible"] = False
+        items.append(item)
+
+    layout = {"version": LAYOUT_VERSION, "items": items}  # type: Dict[str, object]
+    if size:
+        layout["size"] = list(size)
+    if skipped:
+        layout["skipped"] = skipped
+
+    return layout
+
+
+def convertModule(path: str, output: Optional[str] = None) -> Dict[str, object]:
+    """Convert the generated module at path, writing the layout as json to output."""
+
+    with open(path, "r", encoding="utf-8") as f:
+        layout = layoutFromSource(f.read(), path)
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(layout, f, indent=1)
+            f.write("\n")
+
+    return layout
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", help="generated widget.py")
+    parser.add_argument("-o", "--output", help="layout json, printed when omitted")
+    args = parser.parse_args(argv)
+
+    layout = convertModule(args.module, args.output)
+    if not args.output:
+        json.dump(layout, sys.stdout, indent=1)
+        sys.stdout.write("\n")
+
+    skipped = layout.get("skipped") or []
+    sys.stderr.write("{} buttons converted, {} skipped\n".format(
+        len(layout["items"]), len(skipped)))  # type: ignore
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@
 import traceback
 
 # dcc
+import maya.cmds as cmds
 import pymel.core as pm
 
 # mgear
@@ -9,7 +10,22 @@ import mgear
 from mgear.vendor.Qt import QtCore, QtWidgets, QtGui
 from mgear.core import callbackManager
 
-from .. import widgets, utils
+from .. import widgets, utils, picker
+
+
+class _TabCallbackManager(callbackManager.CallbackManager):
+    """CallbackManager remembering the selection callbacks registered
+    through it, see MainSynopticTab.suspendSelectionCallback.
+    """
+
+    def __init__(self):
+        super(_TabCallbackManager, self).__init__()
+        self.selectionCallbacks = {}  # callback name -> function
+
+    def selectionChangedCB(self, callback_name, func):
+        self.selectionCallbacks[callback_name] = func
+        return super(_TabCallbackManager, self).selectionChangedCB(
+            callback_name, func)
 
 
 ##################################################
@@ -26,6 +42,7 @@ class MainSynopticTab(QtWidgets.QDialog):
     description = "base calss of synoptic tab"
     name = ""
     bgPath = None
+    pickerLayout = None  # json/yaml layout painted by a picker.PickerCanvas
 
     buttons = []
     default_buttons = [
@@ -47,10 +64,16 @@ class MainSynopticTab(QtWidgets.QDialog):
 
         klass.setupUi(self)
         klass.setBackground()
+        klass.setPicker()
         klass.connectSignals()
         klass.connectMaya()
         self._buttonGeometry = {}  # for cachinig
 
+        # "namespace:control" -> [buttons], see __buildButtonIndex
+        self._buttonIndex = {}
+        self._buttonIndexKey = None
+        self._selectedButtonNames = set()
+
         # This is necessary for not to be zombie job on close.
         # Qt does not actually destroy the object by just pressing
         # close button by default.
@@ -63,6 +86,24 @@ class MainSynopticTab(QtWidgets.QDialog):
         if self.bgPath is not None:
             self.img_background.setPixmap(QtGui.QPixmap(self.bgPath))
 
+    def setPicker(self):
+        # type: () -> None
+
+        # Paint the select buttons of pickerLayout on a single canvas,
+        # stacked right above the background
+        self.picker = None
+        if self.pickerLayout is None:
+            return
+
+        self.picker = picker.PickerCanvas(self)
+        self.picker.loadLayout(self.pickerLayout)
+        self.picker.setGeometry(QtCore.QRect(QtCore.QPoint(0, 0),
+                                             self.picker.sizeHint()))
+        self.picker.lower()
+        background = getattr(self, "img_background", None)
+        if background is not None:
+            background.lower()
+
     def connectSignals(self):
         # type: () -> None
 
@@ -92,7 +133,8 @@ class MainSynopticTab(QtWidgets.QDialog):
         # ptr = long(QtCompat.getCppPointer(self))
         # ptr = QtCompat.getCppPointer(self)
 
-        self.cbManager = callbackManager.CallbackManager()
+        self.cbManager = _TabCallbackManager()
+        self._suspendedCallbacks = None
 
     def selectChanged(self, *args):
         # wrap to catch exception guaranteeing core does not stop at this
@@ -112,24 +154,42 @@ class MainSynopticTab(QtWidgets.QDialog):
             except RuntimeError:
                 pass
 
-    def __selectChanged(self, *args):
-
-        sels = []
-        [sels.append(x.name()) for x in pm.ls(sl=True)]
-
-        oModel = utils.getModel(self)
-        if not oModel:
-            mes = "model not found for synoptic {}".format(self.name)
-            mgear.log(mes, mgear.sev_info)
-
-            # self.close()
+    def invalidateButtonIndex(self):
+        # type: () -> None
+        """Drop the button index so it is rebuilt on the next selection change.
 
-            syn_widget = utils.getSynopticWidget(self)
-            syn_widget.updateModelList()
+        Call this when the model or its namespace changes.
+        """
+        self._buttonIndex = {}
+        self._buttonIndexKey = None
+        self._selectedButtonNames = set()
 
+    def suspendSelectionCallback(self):
+        # type: () -> None
+        """Remove the selection callbacks while the tab is not displayed.
+
+        Only the callbacks the tab registered are removed, and they are
+        registered again by resumeSelectionCallback. The button index is
+        dropped too, the model may change before the tab is shown again.
+        """
+        if self._suspendedCallbacks is None:
+            self._suspendedCallbacks = dict(self.cbManager.selectionCallbacks)
+            for callbackName in self._suspendedCallbacks:
+                self.cbManager.removeManagedCB(callbackName)
+        self.invalidateButtonIndex()
+
+    def resumeSelectionCallback(self):
+        # type: () -> None
+        """Register the callbacks removed by suspendSelectionCallback again."""
+        if self._suspendedCallbacks is None:
             return
 
-        nameSpace = utils.getNamespace(oModel.name())
+        suspended, self._suspendedCallbacks = self._suspendedCallbacks, None
+        for callbackName, func in suspended.items():
+            self.cbManager.selectionChangedCB(callbackName, func)
+
+    def __buildButtonIndex(self, nameSpace):
+        # type: (str) -> None
 
         selButtons = self.findChildren(widgets.SelectButton)
         selButtonsStyled = self.findChildren(widgets.SelectButtonStyleSheet)
@@ -138,6 +198,7 @@ class MainSynopticTab(QtWidgets.QDialog):
         buttons.extend(selButtons)
         buttons.extend(selButtonsStyled)
 
+        index = {}
         for selB in buttons:
             obj = str(selB.property("object")).split(",")
             if len(obj) == 1:
@@ -146,11 +207,65 @@ class MainSynopticTab(QtWidgets.QDialog):
                 else:
                     checkName = obj[0]
 
-                if checkName in sels:
+                index.setdefault(checkName, []).append(selB)
+
+        for canvas in self.findChildren(picker.PickerCanvas):
+            for item in canvas.items():
+                if len(item.objects) == 1:
+                    if nameSpace:
+                        checkName = ":".join([nameSpace, item.objects[0]])
+                    else:
+                        checkName = item.objects[0]
+
+                    index.setdefault(checkName, []).append(item)
+
+        self._buttonIndex = index
+
+    def __selectChanged(self, *args):
+
+        oModel = utils.getModel(self)
+        if not oModel:
+            mes = "model not found for synoptic {}".format(self.name)
+            mgear.log(mes, mgear.sev_info)
+
+            # self.close()
+
+            self.invalidateButtonIndex()
+            syn_widget = utils.getSynopticWidget(self)
+            syn_widget.updateModelList()
+
+            return
+
+        nameSpace = utils.getNamespace(oModel.name())
+        indexKey = (oModel.name(), nameSpace)
+        if indexKey != self._buttonIndexKey:
+            self.__buildButtonIndex(nameSpace)
+            self._buttonIndexKey = indexKey
+            previous = None
+        else:
+            previous = self._selectedButtonNames
+
+        sels = set(cmds.ls(sl=True) or [])
+        selected = sels.intersection(self._buttonIndex)
+
+        if previous is None:
+            # index was rebuilt, every button needs its state painted once
+            for checkName, buttons in self._buttonIndex.items():
+                state = checkName in selected
+                for selB in buttons:
+                    selB.paintSelected(state)
+
+        else:
+            for checkName in selected - previous:
+                for selB in self._buttonIndex[checkName]:
                     selB.paintSelected(True)
-                else:
+
+            for checkName in previous - selected:
+                for selB in self._buttonIndex[checkName]:
                     selB.paintSelected(False)
 
+        self._selectedButtonNames = selected
+
     def _getButtonAbsoluteGeometry(self, button):
         # type: (widgets.SelectButton) -> QtCore.QSize
 
@@ -198,6 +313,11 @@ class MainSynopticTab(QtWidgets.QDialog):
             if rect.intersects(self._getButtonAbsoluteGeometry(child)):
                 selected.append(child)
 
+        for canvas in self.findChildren(picker.PickerCanvas):
+            canvasRect = QtCore.QRect(canvas.mapFrom(self, rect.topLeft()),
+                                      rect.size())
+            selected.extend(canvas.itemsInRect(canvasRect))
+
         if selected:
             firstLoop = True
             with pm.UndoChunk():
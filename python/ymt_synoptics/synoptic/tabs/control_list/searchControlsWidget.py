@@ -1,7 +1,8 @@
 
 from maya import cmds
-from mgear.vendor.Qt import QtWidgets
+from mgear.vendor.Qt import QtCore, QtWidgets
 from ymt_synoptics.synoptic import utils
+from ymt_synoptics.synoptic import control_index
 
 
 def getControlsFromSets(desiredSet, listToPopulate):
@@ -59,6 +60,65 @@ def getTokens(userInput):
     return allTokens
 
 
+class ControlResultModel(QtCore.QAbstractListModel):
+    """list model of the search results, rows are handed to the view in
+    batches as it scrolls instead of all at once
+    """
+
+    BATCH_SIZE = 200
+
+    def __init__(self, parent=None):
+        super(ControlResultModel, self).__init__(parent)
+        self.results = []
+        self.loaded = 0
+
+    def setResults(self, results):
+        """replace the results, only the first batch is loaded
+
+        Args:
+            results (list): of control names
+        """
+        self.beginResetModel()
+        self.results = list(results)
+        self.loaded = min(len(self.results), self.BATCH_SIZE)
+        self.endResetModel()
+
+    def fetchAll(self):
+        """load every remaining row
+        """
+        while self.canFetchMore():
+            self.fetchMore()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.loaded
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self.loaded:
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self.results[index.row()]
+        return None
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return False
+        return self.loaded < len(self.results)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.BATCH_SIZE, len(self.results) - self.loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(),
+                             self.loaded,
+                             self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+
+
 class ControlListerUI(QtWidgets.QWidget):
     """widget for listing all controls under a namespace"""
 
@@ -69,6 +129,7 @@ class ControlListerUI(QtWidgets.QWidget):
         self.model = None
         self.modelControls = []
         self.namespace = None
+        self.controlIndex = None
         self.gui()
         self.connectSignals()
 
@@ -76,7 +137,8 @@ class ControlListerUI(QtWidgets.QWidget):
         """connect widgets/signals to the functions
         """
         self.searchLineEdit.textChanged.connect(self.queryNames)
-        self.resultWidget.itemSelectionChanged.connect(self.specificSelection)
+        self.resultWidget.selectionModel().selectionChanged.connect(
+            self.specificSelection)
         self.selectAllButton.clicked.connect(self.selectAllResults)
 
     def displayResults(self, resultsToDisplay):
@@ -85,8 +147,7 @@ class ControlListerUI(QtWidgets.QWidget):
         Args:
             resultsToDisplay (list): of results to display
         """
-        self.resultWidget.clear()
-        self.resultWidget.addItems(resultsToDisplay)
+        self.resultModel.setResults(resultsToDisplay)
 
     def getNodeWithNameSpace(self, node):
         """In the future this will need to change to allow for set name prefix
@@ -104,34 +165,30 @@ class ControlListerUI(QtWidgets.QWidget):
         return "{0}{1}".format(ns, node)
 
     def queryNames(self, userInput):
-        """Take the userInput and query against all controls
-        remove duplicates and sort
+        """Take the userInput and query against the control index,
+        ranked and without duplicates
 
         Args:
             userInput (string): from UI
         """
-        searchResults = set()
-        # userInput = userInput.toString()
-        allTokens = getTokens(userInput)
-        [searchResults.update(getMatching(token, self.modelControls))
-         for token in allTokens]
-        searchResults = sorted(searchResults)
-        self.displayResults(searchResults)
+        if self.controlIndex is None:
+            self.displayResults([])
+            return
+        self.displayResults(self.controlIndex.search(userInput))
 
     def setControlsToQuery(self):
-        """Query the controls set in the scene from the scene.
+        """Get the cached control index of the current model, it is only
+        rebuilt after the scene or the controllers set changed.
         TODO: Open this up to select multiple areas for query
         """
-        setControls = []
-        controlerSet = "{0}{1}".format(self.model, utils.CTRL_GRP_SUFFIX)
-        if cmds.objExists(controlerSet):
-            getControlsFromSets(controlerSet, setControls)
-        baseControlNames = set(getBaseNames(setControls))
-        self.modelControls = list(baseControlNames)
+        self.controlIndex = control_index.getControlIndex(self.model)
+        self.controlIndex.ensure()
+        self.modelControls = self.controlIndex.names
 
     def selectAllResults(self):
         """Select all items in results widget
         """
+        self.resultModel.fetchAll()
         self.resultWidget.clearSelection()
         self.resultWidget.selectAll()
 
@@ -142,8 +199,8 @@ class ControlListerUI(QtWidgets.QWidget):
             *args: unised signal information
         """
         selectionList = []
-        for item in self.resultWidget.selectedItems():
-            selectionList.append(self.getNodeWithNameSpace(item.text()))
+        for index in self.resultWidget.selectionModel().selectedRows():
+            selectionList.append(self.getNodeWithNameSpace(index.data()))
         cmds.select(selectionList)
 
     def refresh(self):
@@ -152,7 +209,7 @@ class ControlListerUI(QtWidgets.QWidget):
         self.model = utils.getModel(self)
         self.namespace = utils.getNamespace(self.model)
         self.searchLineEdit.clear()
-        self.resultWidget.clear()
+        self.resultModel.setResults([])
         self.setControlsToQuery()
         self.queryNames("")
 
@@ -168,7 +225,10 @@ class ControlListerUI(QtWidgets.QWidget):
         self.mainLayout.addWidget(self.searchLineEdit)
         self.mainLayout.addWidget(self.selectAllButton)
         #  -------------------------------------------------------------------
-        self.resultWidget = QtWidgets.QListWidget()
+        self.resultModel = ControlResultModel(self)
+        self.resultWidget = QtWidgets.QListView()
+        self.resultWidget.setModel(self.resultModel)
+        self.resultWidget.setUniformItemSizes(True)
         self.resultWidget.setSpacing(4)
         self.resultWidget.setAlternatingRowColors(True)
         selMode = QtWidgets.QAbstractItemView.ExtendedSelection
@@ -344,71 +344,132 @@ class SelectButton(QtWidgets.QWidget):
         painter.drawPath(path)
 
 
-class SelectButtonStyleSheet(QtWidgets.QFrame):
-    def __init__(self, parent=None):
-        """ This class allows you to charge a QFrame widget on your picker
-        that will maintain the StyleSheet compatibility coming form your UI
-        file.
-        """
-        super(SelectButtonStyleSheet, self).__init__(parent)
+class _ParsedStyleSheet(object):
+    """ The blocks of a parent style sheet, with the selected and unselected
+    style of every control resolved on first use.
+    """
+
+    declaration_re = re.compile(r"\S+[a-z][-][a-z].+\W;")
+
+    def __init__(self, style_sheet):
+        self.style_sheet = style_sheet
+        self.blocks = style_sheet.split("\n\n")
+        self.__states = {}
 
-    def __get_background_color(self, control, stylesheet):
-        """ Returns the background color for the given control on the
-        style sheet provided
+    def __get_background_color(self, control):
+        """ Returns the background and hover declarations of the control
         """
 
         current_style = ""
 
-        for i in stylesheet:
-            if (re.findall("\control_style={}".format(control), i) and
-                not i.count("disabled") or re.findall("\#{}".format(
-                    control), i) and not i.count("disabled")):
+        for i in self.blocks:
+            if (("control_style={}".format(control) in i
+                 or "#{}".format(control) in i)
+                    and not i.count("disabled")):
                 current_style += i
-        return re.findall(r"\S+[a-z][-][a-z].+\W;", current_style)
+        return self.declaration_re.findall(current_style)
 
-    def __create_new_style(self, control_object, control_style, paint):
-        """ Generates a simple qt style sheet update for the given control.
-        This needs to be done to force the Maya control selection give the
-        effect of the button been hovered.
+    def __create_new_styles(self, control_object, control_style):
+        """ Generates the simple qt style sheet update of the given control
+        for both selection states, as {painted: style}.
         """
 
-        # gets overall style sheet
-        style_sheet = self.parent().styleSheet()
-        widgets_styles = style_sheet.split("\n\n")
-        new_style = ""
+        new_styles = {True: "", False: ""}
 
         # handles # type style sheet
-        if style_sheet.count(control_object):
-            bg_color, hover_color = self.__get_background_color(control_object,
-                                                                widgets_styles)
-
-            for i in widgets_styles:
-                if i.count(control_object) and paint and not i.count("hover"):
-                    new_style = "QFrame#%s{\n    %s\n}" % (control_object,
-                                                           hover_color)
-                elif i.count(control_object) and not paint:
-                    new_style = "QFrame#%s{\n    %s\n}" % (control_object,
-                                                           bg_color)
-                    new_style += "QFrame#%s:hover{\n    %s\n}" % (
+        if self.style_sheet.count(control_object):
+            bg_color, hover_color = self.__get_background_color(
+                control_object)
+
+            for i in self.blocks:
+                if i.count(control_object) and not i.count("hover"):
+                    new_styles[True] = "QFrame#%s{\n    %s\n}" % (
+                        control_object, hover_color)
+                if i.count(control_object):
+                    new_styles[False] = "QFrame#%s{\n    %s\n}" % (
+                        control_object, bg_color)
+                    new_styles[False] += "QFrame#%s:hover{\n    %s\n}" % (
                         control_object, hover_color)
 
         # handles property type style sheet
-        elif style_sheet.count(control_style):
-            bg_color, hover_color = self.__get_background_color(control_style,
-                                                                widgets_styles)
+        elif self.style_sheet.count(control_style):
+            bg_color, hover_color = self.__get_background_color(control_style)
 
-            for i in widgets_styles:
-                if i.count(control_style) and paint and not i.count("hover"):
-                    new_style = "QFrame[control_style=%s]{\n    %s\n}" % (
+            for i in self.blocks:
+                if i.count(control_style) and not i.count("hover"):
+                    new_styles[True] = "QFrame[control_style=%s]{\n    %s\n}" % (
                         control_style, hover_color)
 
-                elif i.count(control_style) and not paint:
-                    new_style = "QFrame[control_style=%s]{\n    %s\n}" % (
+                if i.count(control_style):
+                    new_styles[False] = "QFrame[control_style=%s]{\n    %s\n}" % (
                         control_style, bg_color)
-                    new_style += "QFrame[control_style=%s]:hover{\n    %s\n}"\
-                                 % (control_style, hover_color)
+                    new_styles[False] += "QFrame[control_style=%s]:hover{\n    %s\n}"\
+                        % (control_style, hover_color)
+
+        return new_styles
+
+    def styles(self, control_object, control_style):
+        """ Returns {painted: style} for the control, parsed only once
+        """
+
+        key = (control_object, control_style)
+        if key not in self.__states:
+            self.__states[key] = self.__create_new_styles(control_object,
+                                                          control_style)
+        return self.__states[key]
+
+
+# parent style sheet text -> _ParsedStyleSheet
+_PARSED_STYLE_SHEETS = {}
+_PARSED_STYLE_SHEETS_MAX = 32
 
-        return new_style
+
+def _parse_style_sheet(style_sheet):
+    parsed = _PARSED_STYLE_SHEETS.get(style_sheet)
+    if parsed is None:
+        if len(_PARSED_STYLE_SHEETS) >= _PARSED_STYLE_SHEETS_MAX:
+            _PARSED_STYLE_SHEETS.clear()
+        parsed = _PARSED_STYLE_SHEETS[style_sheet] = _ParsedStyleSheet(
+            style_sheet)
+    return parsed
+
+
+class _StyleSheetWatcher(QtCore.QObject):
+    """ Drops the parsed style sheet cached on the watched widget when its
+    style changes.
+    """
+
+    def eventFilter(self, watched, event):
+        if event.type() == QtCore.QEvent.StyleChange:
+            watched._parsedStyleSheet = None
+        return False
+
+
+def _widget_style_sheet(widget):
+    """ Returns the _ParsedStyleSheet of the widget, cached on the widget
+    until its style changes
+    """
+
+    parsed = getattr(widget, "_parsedStyleSheet", None)
+    if parsed is None:
+        if getattr(widget, "_styleSheetWatcher", None) is None:
+            widget._styleSheetWatcher = _StyleSheetWatcher(widget)
+            widget.installEventFilter(widget._styleSheetWatcher)
+        parsed = _parse_style_sheet(widget.styleSheet())
+        widget._parsedStyleSheet = parsed
+    return parsed
+
+
+class SelectButtonStyleSheet(QtWidgets.QFrame):
+    def __init__(self, parent=None):
+        """ This class allows you to charge a QFrame widget on your picker
+        that will maintain the StyleSheet compatibility coming form your UI
+        file.
+        """
+        super(SelectButtonStyleSheet, self).__init__(parent)
+        self.__parsed = None  # _ParsedStyleSheet the styles come from
+        self.__styles = None  # {painted: style} of this button
+        self.__applied = None  # style currently set on this button
 
     def enterEvent(self, event):
         if not self.isEnabled():
@@ -460,21 +521,29 @@ class SelectButtonStyleSheet(QtWidgets.QFrame):
         """
         if not self.isEnabled():
             return
-        # get control name and control_style properties from the widget
-        control_object = str(self.property("object")).split(",")[0]
-        control_style = str(self.property("control_style")).split(",")[0]
-
-        # gets new style sheet
-        try:
-            new_style = self.__create_new_style(control_object,
-                                                control_style,
-                                                paint)
+
+        # the parsed parent style sheet is cached on the parent until its
+        # style changes, and the states of this button resolved once per
+        # parsed style sheet
+        parsed = _widget_style_sheet(self.parent())
+        if parsed is not self.__parsed:
+            # get control name and control_style properties from the widget
+            control_object = str(self.property("object")).split(",")[0]
+            control_style = str(self.property("control_style")).split(",")[0]
+
+            try:
+                self.__styles = parsed.styles(control_object, control_style)
+            except Exception as error:
+                message = "Something is wrong with your current style-sheet." \
+                          "Contact mGear development team with the following" \
+                          " error... "
+                raise RuntimeError(message) from error
+            self.__parsed = parsed
+
+        new_style = self.__styles[bool(paint)]
+        if new_style != self.__applied:
             self.setStyleSheet(new_style)
-        except Exception as error:
-            message = "Something is wrong with your current style-sheet." \
-                      "Contact mGear development team with the following" \
-                      " error... "
-            raise error(message)
+            self.__applied = new_style
 
 
 ##############################################################################
@@ -1,6 +1,7 @@
 # import re
 import importlib
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 try:
     pm = importlib.import_module("mgear.pymaya")
 except ImportError:
@@ -12,15 +13,20 @@ from mgear.core import attribute
 from mgear.core import pyqt
 import mgear.core.anim_utils as anim_utils
 import ymt_synoptics.synoptic.utils as syn_utils
+import ymt_synoptics.synoptic.mirror_map as mirror_map
 import mgear.core.utils as utils
 from typing import Optional
-from ymt_shifter_utility.type_protocols import AttrValue, DagNodeLike, MatrixValue, MouseEventLike
+from ymt_shifter_utility.type_protocols import DagNodeLike, MatrixValue, MouseEventLike
+from ymt_shifter_utility.bake_util import (  # noqa: F401
+    BAKE_CHANNELS,
+    computeLocalTransforms,
+    evaluateMatrixPlugs,
+    getWorldMatricesAtFrames,
+    keyChannel,
+    keyTransforms,
+)
 
 import gml_maya.decorator as deco
-try:
-    node_utils = importlib.import_module("gml_maya.node")
-except ImportError:
-    node_utils = importlib.import_module("gml_maya.util.node_util")
 
 from logging import (  # pylint: disable=unused-import, wrong-import-order
     StreamHandler,
@@ -43,14 +49,6 @@ logger.propagate = False
 # =============================================================================
 
 
-class MirrorEntry(object):
-
-    def __init__(self, target: DagNodeLike, attr: str, val: AttrValue) -> None:
-        self.target = target
-        self.attr = attr
-        self.val = val
-
-
 class MirrorPoseButton(QtWidgets.QPushButton):
 
     def mousePressEvent(self, event: MouseEventLike) -> None:
@@ -133,163 +131,25 @@ def mirrorPose(flip: bool=False, nodes: object=None) -> None:
     if nodes is None:
         nodes = pm.selected()
 
-    try:
-        nameSpace = False
-        if nodes:
-            nameSpace = syn_utils.getNamespace(nodes[0])
-
-        mirrorEntries = []
-        for oSel in nodes:
-            mirrorEntries.extend(gatherMirrorData(nameSpace, oSel, flip))
-    except:
-        import traceback
-        traceback.print_exc()
-
-    for dat in mirrorEntries:
-        applyMirror(nameSpace, dat)
-
-
-def applyMirror(nameSpace: str, mirrorEntry: MirrorEntry) -> None:
-    """Apply mirro pose
-
-    Args:
-        nameSpace (str): Namespace
-        mirrorEntry (list): List witht the mirror entry template
-    """
-    node = mirrorEntry.target
-    attr = mirrorEntry.attr
-    val = mirrorEntry.val
-
-    try:
-        if (
-            pm.attributeQuery(attr, node=node, shortName=True, exists=True, keyable=True) and not node.attr(attr).isLocked()
-        ):
-            # if isinstance(val, (six.string_types, six.text_type)):
-            if isinstance(val, (str, Text)):
-                return
-
-            node.attr(attr).set(val)
-
-    except RuntimeError:
-        mgear.log("applyMirror failed: {0} {1}: {2}".format(node.name(), attr, val), mgear.sev_error)
-
+    # mirror data is cached per rig, see mirror_map
+    mirror_map.mirrorPose(nodes, flip)
 
-def gatherMirrorData(nameSpace: str, node: DagNodeLike, flip: bool) -> list[MirrorEntry]:
-    """Get the data to mirror
 
-    Args:
-        nameSpace (str): Namespace
-        node (PyNode): No
-        flip (TYPE): flip option
-
-    Returns:
-        [dict[str]: The mirror data
-    """
-    if anim_utils.isSideElement(node.name()):
-
-        nameParts = anim_utils.stripNamespace(node.name()).split("|")[-1]
-        nameParts = anim_utils.swapSideLabel(nameParts)
-        nameTarget = ":".join([nameSpace, nameParts])
-
-        oTarget = anim_utils.getNode(nameTarget)
-
-        return calculateMirrorData(node, oTarget, flip=flip)
-
-    else:
-        return calculateMirrorData(node, node, flip=False)
-
-
-def calculateMirrorData(srcNode: DagNodeLike, targetNode: DagNodeLike, flip: bool=False) -> list[MirrorEntry]:
-    """Calculate the mirror data
+@deco.autokey_off
+@utils.one_undo
+def mirrorAnimation(startFrame: float, endFrame: float, flip: bool=False, nodes: object=None) -> None:
+    """Mirror or flip the animation of controls over a frame range
 
     Args:
-        srcNode (str): The source Node
-        targetNode ([dict[str]]): Target node
-        flip (bool, optional): flip option
-
-    Returns:
-        [{"target": node, "attr": at, "val": flipVal}]
+        startFrame (float): First frame
+        endFrame (float): Last frame, included
+        flip (bool, optiona): Set the function behaviout to flip
+        nodes (None,  [PyNode]): Controls to mirro/flip the animation
     """
+    if nodes is None:
+        nodes = pm.selected()
 
-    results = []
-
-    # mirror attribute of source
-    for attrName in anim_utils.listAttrForMirror(srcNode):
-
-        full_path = "{}.{}".format(srcNode.name(), attrName)
-        if node_utils.is_proxy_attribute(full_path):
-            continue
-
-        # whether does attribute "invTx" exists when attrName is "tx"
-        invCheckName = anim_utils.getInvertCheckButtonAttrName(attrName)
-        if not pm.attributeQuery(invCheckName,
-                                 node=srcNode,
-                                 shortName=True,
-                                 exists=True,
-                                 keyable=True):
-
-            # if not exists, straight
-            inv = 1
-
-        else:
-            # if exists, check its value
-            invAttr = srcNode.attr(invCheckName)
-            if invAttr.get():
-                inv = -1
-            else:
-                inv = 1
-
-        # whether does attribute "invTx" exists when attrName is "tx"
-        pivotCheckName = getPivotCheckButtonAttrName(attrName)
-        if not pm.attributeQuery(pivotCheckName,
-                                 node=srcNode,
-                                 shortName=True,
-                                 exists=True,
-                                 keyable=True):
-
-            # if not exists, straight
-            pivot = 0.
-
-        else:
-            # if exists, check its value
-            pivotAttr = srcNode.attr(pivotCheckName)
-            pivot = pivotAttr.get()
-
-        # if attr name is side specified, record inverted attr name
-        if anim_utils.isSideElement(attrName):
-            invAttrName = anim_utils.swapSideLabel(attrName)
-        else:
-            invAttrName = attrName
-
-        # if flip enabled record self also
-        if flip:
-            flipVal = targetNode.attr(attrName).get()
-            if isinstance(flipVal, float):
-                entry = MirrorEntry(srcNode, invAttrName, (flipVal + pivot) * inv)
-            else:
-                entry = MirrorEntry(srcNode, invAttrName, (flipVal) * inv)
-
-            results.append(entry)
-
-        if isinstance(srcNode.attr(attrName).get(), float):
-            entry = MirrorEntry(targetNode, invAttrName, (srcNode.attr(attrName).get() + pivot) * inv)
-        else:
-            entry = MirrorEntry(targetNode, invAttrName, (srcNode.attr(attrName).get()) * inv)
-        results.append(entry)
-
-    return results
-
-
-def getPivotCheckButtonAttrName(str: str) -> str:
-    """Get the invert check butto attribute name
-
-    Args:
-        str (str): The attribute name
-
-    Returns:
-        str: The checked attribute name
-    """
-    return "invPivot{0}".format(str.lower().capitalize())
+    mirror_map.mirrorAnimation(nodes, startFrame, endFrame, flip)
 
 
 def getMatrix(obj: DagNodeLike) -> list[float]:
@@ -626,44 +486,29 @@ class IkFkTransfer(anim_utils.AbstractAnimationTransfer):
         else:
             keyframeList = [x for x in range(startFrame, endFrame + 1)]
 
+        # everything is evaluated in DG context before touching the curves,
+        # the current time is never changed while baking
         worldMatrixList = self.getWorldMatrices(startFrame,
                                                 endFrame,
                                                 val_src_nodes,
                                                 keyframeList)
+        transforms = computeLocalTransforms(key_dst_nodes,
+                                            keyframeList,
+                                            worldMatrixList)
 
         # delete animation in the space switch channel and destination ctrls
         pm.cutKey(key_dst_nodes, at=channels, time=(startFrame, endFrame))
         pm.cutKey(switch_attr_name, time=(startFrame, endFrame))
 
-        def keyframe(x: object, i: object) -> None:
-            pm.currentTime(x)
-
-            # set the new space in the channel
-            self.changeAttrToBoundValue()
-
-            # bake the stored transforms to the cotrols
-            for j, n in enumerate(key_dst_nodes):
-                # n.setMatrix(worldMatrixList[i][j], worldSpace=True)
-                for _ in range(2):
-                    cmds.xform(n.name(), ws=True, matrix=worldMatrixList[i][j])
+        # set the new space in the channel
+        self.changeAttrToBoundValue()
+        if keyframeList:
+            cmds.setKeyframe(switch_attr_name,
+                             time=keyframeList,
+                             value=self.getValue())
 
-            # bake the stored transforms to the cotrols
-            for j, n in enumerate(key_dst_nodes):
-                # n.setMatrix(worldMatrixList[i][j], worldSpace=True)
-
-                for _ in range(2):
-                    cmds.xform(n.name(), ws=True, matrix=worldMatrixList[i][j])
-
-            pm.setKeyframe(key_dst_nodes, at=channels)
-            pm.setKeyframe(switch_attr_name)
-
-        if onlyKeyframes:
-            for i, x in enumerate(keyframeList):
-                keyframe(x, i)
-
-        else:
-            for i, x in enumerate(range(startFrame, endFrame + 1)):
-                keyframe(x, i)
+        # bake the stored transforms to the cotrols
+        keyTransforms(key_dst_nodes, keyframeList, transforms)
 
         # if versions.current() <= 20180200:
         pm.cycleCheck(e=True)
@@ -785,19 +630,10 @@ class IkFkTransfer(anim_utils.AbstractAnimationTransfer):
         kwargs.update({"switchTo": "fk"})
         IkFkTransfer.execute(model, ikfk_attr, uihost, fks, ik, upv, ikRot, **kwargs)
 
-    def getWorldMatrices(self, start: object, end: object, val_src_nodes: object, keyframes: object) -> object:
+    def getWorldMatrices(self, start: object, end: object, val_src_nodes: object, keyframes: object) -> list[list[om.MMatrix]]:
         """ returns matrice List[frame][controller number]."""
 
-        res = []
-        for x in keyframes:
-            tmp = []
-            cmds.currentTime(x)
-            for n in val_src_nodes:
-                tmp.append(cmds.xform(n.name(), q=True, matrix=True, ws=True))
-
-            res.append(tmp)
-
-        return res
+        return getWorldMatricesAtFrames(val_src_nodes, keyframes)
 
 
 class toggleControllerVisibilityButton(QtWidgets.QPushButton):